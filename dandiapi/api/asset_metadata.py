@@ -0,0 +1,89 @@
+"""
+Maintain the computed fields of asset metadata, stored in `Asset.computed_metadata`.
+
+These fields are derived from the blob or zarr of an asset, the embargo status of the dandisets
+it belongs to, and settings. Any code which changes those must call
+`invalidate_computed_metadata` on the affected assets, in the same transaction as the change.
+Until the fields are refreshed, `Asset.full_metadata` computes them on every access.
+"""
+
+from __future__ import annotations
+
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+
+from dandiapi.api.models import Asset
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.db.models import QuerySet
+
+# The number of assets refreshed in each transaction
+REFRESH_BATCH_SIZE = 1000
+
+# The number of assets whose full metadata is fetched and computed together when iterating
+ITER_CHUNK_SIZE = 2000
+
+
+def iter_full_metadata(
+    assets: QuerySet[Asset], *, chunk_size: int = ITER_CHUNK_SIZE
+) -> Iterator[dict]:
+    """
+    Yield the full metadata of each asset, using a server-side cursor.
+
+    The embargo end dates needed by each chunk of assets are looked up at once. The queryset should
+    select the related blob, zarr and zarr dandiset.
+    """
+    for chunk in batched(assets.iterator(chunk_size=chunk_size), chunk_size, strict=False):
+        embargo_end_dates = Asset.get_embargo_end_dates(chunk)
+        for asset in chunk:
+            yield asset.get_full_metadata(embargo_end_dates)
+
+
+def invalidate_computed_metadata(assets: QuerySet[Asset]) -> int:
+    """Clear the computed metadata of the given assets, returning the number of assets cleared."""
+    # Rows which are already cleared can't be excluded, as one might be locked by a refresh which
+    # read the state from before this change
+    return assets.update(computed_metadata=None)
+
+
+def refresh_computed_metadata(*, limit: int | None = None) -> int:
+    """
+    Compute and store the metadata of assets which have none, returning the number refreshed.
+
+    Assets which are locked, by a refresh running concurrently or a transaction invalidating
+    them, are skipped.
+    """
+    refreshed = 0
+    while limit is None or refreshed < limit:
+        batch_size = (
+            REFRESH_BATCH_SIZE if limit is None else min(REFRESH_BATCH_SIZE, limit - refreshed)
+        )
+        with transaction.atomic():
+            # The assets must be locked before reading anything their metadata is computed from, so
+            # that any invalidation which cleared them has committed, and any later one will wait
+            asset_ids = list(
+                Asset.objects.filter(computed_metadata__isnull=True)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not asset_ids:
+                break
+
+            assets = list(
+                Asset.objects.filter(id__in=asset_ids).select_related(
+                    'blob', 'zarr', 'zarr__dandiset'
+                )
+            )
+            embargo_end_dates = Asset.get_embargo_end_dates(assets)
+            for asset in assets:
+                asset.computed_metadata = asset.compute_metadata(embargo_end_dates)
+            Asset.objects.bulk_update(assets, ['computed_metadata'])
+
+        refreshed += len(assets)
+
+    return refreshed
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from django.db import IntegrityError, transaction
-from django.db.models import F, QuerySet, Sum
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum
 from django.db.models.functions import Coalesce
-from tqdm import tqdm
 
 # Import only the asset paths models
-from dandiapi.api.models.asset_paths import AssetPath, AssetPathRelation
+from dandiapi.api.models.asset_paths import AssetPath, AssetPathAggregateDelta, AssetPathRelation
 
 # Import models for type checking only (prevent cyclic imports)
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from dandiapi.api.models import Asset, Version
     from dandiapi.zarr.models import ZarrArchive
 
@@ -22,6 +26,16 @@ if TYPE_CHECKING:
 ####################################################################
 
 
+def uses_closure_table() -> bool:
+    """
+    Return whether the asset path hierarchy is stored in the `AssetPathRelation` closure table.
+
+    Otherwise, the hierarchy is derived from the paths themselves, using the index over the
+    version, depth and path of each `AssetPath`.
+    """
+    return settings.DANDI_ASSET_PATH_HIERARCHY == 'closure'
+
+
 def extract_paths(path: str) -> list[str]:
     nodepaths: list[str] = path.split('/')
     for i in range(len(nodepaths))[1:]:
@@ -30,6 +44,15 @@ def extract_paths(path: str) -> list[str]:
     return nodepaths
 
 
+def annotate_pending_aggregates(qs: QuerySet[AssetPath]) -> QuerySet[AssetPath]:
+    """Annotate paths with the sum of their aggregate deltas, which haven't been compacted yet."""
+    deltas = AssetPathAggregateDelta.objects.filter(path=OuterRef('pk')).values('path')
+    return qs.annotate(
+        pending_files=Coalesce(Subquery(deltas.annotate(total=Sum('files')).values('total')), 0),
+        pending_size=Coalesce(Subquery(deltas.annotate(total=Sum('size')).values('total')), 0),
+    )
+
+
 def get_root_paths_many(versions: QuerySet[Version], *, join_assets=False) -> QuerySet[AssetPath]:
     """Return all root paths for all provided versions."""
     qs = AssetPath.objects.get_queryset()
@@ -42,31 +65,72 @@ def get_root_paths_many(versions: QuerySet[Version], *, join_assets=False) -> Qu
     return qs.filter(version__in=versions).exclude(path__contains='/').order_by('path')
 
 
-def get_root_paths(version: Version) -> QuerySet[AssetPath]:
-    """Return all root paths for a version."""
+def get_root_paths(version: Version, *, after: str | None = None) -> QuerySet[AssetPath]:
+    """Return all root paths for a version, only those after a path if one is given."""
     # Use prefetch_related here instead of select_related,
     # as otherwise the resulting join is very large
     qs = AssetPath.objects.prefetch_related('asset', 'asset__blob', 'asset__zarr')
-    return qs.filter(version=version).exclude(path__contains='/').order_by('path')
-
-
-def get_path_children(path: AssetPath, depth: int | None = 1) -> QuerySet[AssetPath]:
+    qs = qs.filter(version=version, depth=1).order_by('path')
+    if after is not None:
+        qs = qs.filter(path__gt=after)
+    return annotate_pending_aggregates(qs)
+
+
+def get_root_aggregates(version: Version) -> tuple[int, int]:
+    """Return the total number of files and size of a version, including uncompacted deltas."""
+    root_paths = AssetPath.objects.filter(version=version).exclude(path__contains='/')
+    totals = [
+        qs.aggregate(files=Coalesce(Sum(files), 0), size=Coalesce(Sum(size), 0))
+        for qs, files, size in [
+            (root_paths, 'aggregate_files', 'aggregate_size'),
+            (AssetPathAggregateDelta.objects.filter(path__in=root_paths), 'files', 'size'),
+        ]
+    ]
+    return sum(total['files'] for total in totals), sum(total['size'] for total in totals)
+
+
+def get_path_children(
+    path: AssetPath, depth: int | None = 1, *, after: str | None = None
+) -> QuerySet[AssetPath]:
     """
     Get all children from an existing path.
 
     By default, returns only the direct children.
     If depth is `None`, all children will be returned, regardless of depth.
+    If `after` is given, only the children whose path sorts after it are returned.
     """
-    relation_qs = AssetPathRelation.objects.filter(parent=path).exclude(child=path)
-    if depth is not None:
-        relation_qs = relation_qs.filter(depth=depth)
-
-    path_ids = relation_qs.values_list('child', flat=True).distinct()
-    return (
-        AssetPath.objects.select_related('asset', 'asset__blob', 'asset__zarr')
-        .filter(id__in=path_ids)
-        .order_by('path')
-    )
+    # Children after a path are found from the index of the path itself, even with the closure
+    # table, so that a page of them costs the same however many children come before it
+    if uses_closure_table() and after is None:
+        relation_qs = AssetPathRelation.objects.filter(parent=path).exclude(child=path)
+        if depth is not None:
+            relation_qs = relation_qs.filter(depth=depth)
+
+        path_ids = relation_qs.values_list('child', flat=True).distinct()
+        qs = AssetPath.objects.filter(id__in=path_ids)
+    else:
+        # The 'C' collation of the path allows this prefix match to use the index directly
+        qs = AssetPath.objects.filter(version_id=path.version_id, path__startswith=f'{path.path}/')
+        if depth is not None:
+            qs = qs.filter(depth=path.depth + depth)
+        if after is not None:
+            qs = qs.filter(path__gt=after)
+
+    qs = qs.select_related('asset', 'asset__blob', 'asset__zarr').order_by('path')
+    return annotate_pending_aggregates(qs)
+
+
+def get_ancestor_paths(leaf: AssetPath) -> QuerySet[AssetPath]:
+    """Get all paths which contain an existing path, including the path itself."""
+    if uses_closure_table():
+        parent_ids = (
+            AssetPathRelation.objects.filter(child=leaf)
+            .distinct('parent')
+            .values_list('parent', flat=True)
+        )
+        return AssetPath.objects.filter(id__in=parent_ids)
+
+    return AssetPath.objects.filter(version_id=leaf.version_id, path__in=extract_paths(leaf.path))
 
 
 def get_conflicting_paths(path: str, version: Version) -> list[str]:
@@ -86,10 +150,12 @@ def get_conflicting_paths(path: str, version: Version) -> list[str]:
     )
 
 
-def search_asset_paths(query: str, version: Version) -> QuerySet[AssetPath] | None:
-    """Return all direct children of this path, if there are any."""
+def search_asset_paths(
+    query: str, version: Version, *, after: str | None = None
+) -> QuerySet[AssetPath] | None:
+    """Return all direct children of this path, only those after a path if one is given."""
     if not query:
-        return get_root_paths(version)
+        return get_root_paths(version, after=after)
 
     # Ensure no trailing slash
     fixed_query = query.rstrip('/')
@@ -99,7 +165,29 @@ def search_asset_paths(query: str, version: Version) -> QuerySet[AssetPath] | No
     if path is None:
         return None
 
-    return get_path_children(path)
+    return get_path_children(path, after=after)
+
+
+def get_subtree_leaves(
+    query: str, version: Version, *, after: str | None = None
+) -> QuerySet[AssetPath] | None:
+    """
+    Return the leaves of all assets within a folder at any depth, if the folder exists.
+
+    If `after` is given, only the leaves whose path sorts after it are returned.
+    """
+    if not query:
+        leaves = AssetPath.objects.filter(version=version, asset__isnull=False).order_by('path')
+        return leaves if after is None else leaves.filter(path__gt=after)
+
+    # Retrieve folder
+    folder = AssetPath.objects.filter(
+        version=version, path=query.rstrip('/'), asset__isnull=True
+    ).first()
+    if folder is None:
+        return None
+
+    return get_path_children(folder, depth=None, after=after).filter(asset__isnull=False)
 
 
 def insert_asset_paths(asset: Asset, version: Version):
@@ -133,6 +221,10 @@ def insert_asset_paths(asset: Asset, version: Version):
         ignore_conflicts=True,
     )
 
+    # Without a closure table, the paths themselves are all that's needed
+    if not uses_closure_table():
+        return leaf
+
     # Retrieve all paths
     paths = [*AssetPath.objects.filter(version=version, path__in=nodepaths).order_by('path'), leaf]
 
@@ -152,6 +244,24 @@ def insert_asset_paths(asset: Asset, version: Version):
     return leaf
 
 
+def _add_aggregate_deltas(path_ids: Iterable[int], *, files: int, size: int):
+    AssetPathAggregateDelta.objects.bulk_create(
+        [AssetPathAggregateDelta(path_id=path_id, files=files, size=size) for path_id in path_ids]
+    )
+
+
+def _delete_empty_paths(paths: QuerySet[AssetPath]) -> int:
+    """Delete any of the given paths that don't contain any files, returning the number deleted."""
+    empty_path_ids = list(
+        annotate_pending_aggregates(paths)
+        .alias(total_files=F('aggregate_files') + F('pending_files'))
+        .filter(total_files__lte=0)
+        .values_list('id', flat=True)
+    )
+    AssetPath.objects.filter(id__in=empty_path_ids).delete()
+    return len(empty_path_ids)
+
+
 def _add_asset_paths(asset: Asset, version: Version):
     leaf = insert_asset_paths(asset, version)
 
@@ -159,19 +269,14 @@ def _add_asset_paths(asset: Asset, version: Version):
     if leaf.aggregate_files == 1:
         return
 
-    # Increment the size and file count of all parent paths.
-    # Get all relations (including leaf node)
-    parent_ids = (
-        AssetPathRelation.objects.filter(child=leaf)
-        .distinct('parent')
-        .values_list('parent', flat=True)
-    )
+    # The leaf path belongs to this asset alone, so it can be updated in place
+    size = leaf.asset.size
+    AssetPath.objects.filter(id=leaf.id).update(aggregate_size=size, aggregate_files=1)
 
-    # Update size + file count
-    AssetPath.objects.filter(id__in=parent_ids).update(
-        aggregate_size=F('aggregate_size') + leaf.asset.size,
-        aggregate_files=F('aggregate_files') + 1,
-    )
+    # Parent paths are shared with other assets, so rather than incrementing their size and file
+    # count directly (which would serialize all concurrent changes to the version), record deltas
+    parent_ids = get_ancestor_paths(leaf).exclude(id=leaf.id).values_list('id', flat=True)
+    _add_aggregate_deltas(parent_ids, files=1, size=size)
 
 
 def _delete_asset_paths(asset: Asset, version: Version):
@@ -180,32 +285,15 @@ def _delete_asset_paths(asset: Asset, version: Version):
         return
 
     # Fetch parents
-    parent_ids = (
-        AssetPathRelation.objects.filter(child=leaf)
-        .distinct('parent')
-        .values_list('parent', flat=True)
-    )
-    parent_paths = AssetPath.objects.filter(id__in=parent_ids)
+    parent_ids = list(get_ancestor_paths(leaf).exclude(id=leaf.id).values_list('id', flat=True))
 
     # Get the previously computed size of the leaf node, not the current asset size,
     # in case the size of the AssetBlob/ZarrArchive that it points to has changed
-    leaf_size = leaf.aggregate_size
+    _add_aggregate_deltas(parent_ids, files=-1, size=-leaf.aggregate_size)
 
-    # Update parents
-    parent_paths.update(
-        aggregate_size=F('aggregate_size') - leaf_size,
-        aggregate_files=F('aggregate_files') - 1,
-    )
-
-    # Ensure integrity
-    leaf.refresh_from_db()
-    if leaf.aggregate_size != 0:
-        raise RuntimeError('Remaining non-zero aggregate_size')
-    if leaf.aggregate_files != 0:
-        raise RuntimeError('Remaining non-zero aggregate_files')
-
-    # Delete leaf node and any other paths with no contained files
-    AssetPath.objects.filter(aggregate_files=0).delete()
+    # Delete leaf node and any parents of it which no longer contain any files
+    leaf.delete()
+    _delete_empty_paths(AssetPath.objects.filter(id__in=parent_ids))
 
 
 @transaction.atomic
@@ -224,46 +312,520 @@ def update_asset_paths(old_asset: Asset, new_asset: Asset, version: Version):
     _add_asset_paths(new_asset, version)
 
 
+@transaction.atomic
+def delete_asset_paths_many(assets: Iterable[Asset], version: Version) -> int:
+    """
+    Remove many assets from the paths of a version, returning the number of leaves deleted.
+
+    This has the same result as calling `delete_asset_paths` for each asset, but does so with a
+    fixed number of queries, regardless of the number of assets.
+    """
+    leaves = list(
+        AssetPath.objects.filter(
+            version=version, asset_id__in=[asset.id for asset in assets]
+        ).values_list('id', 'path', 'aggregate_size')
+    )
+    if not leaves:
+        return 0
+
+    # Sum what each folder loses, using the previously computed sizes of the leaves, as
+    # _delete_asset_paths does
+    files: Counter[str] = Counter()
+    sizes: Counter[str] = Counter()
+    for _, path, size in leaves:
+        for folder in extract_paths(path)[:-1]:
+            files[folder] += 1
+            sizes[folder] += size
+
+    # The stored aggregates of folders may not include their pending deltas yet, so what they lose
+    # is recorded as deltas too, with one row per folder rather than per asset
+    folder_ids = dict(
+        AssetPath.objects.filter(version=version, path__in=list(files)).values_list('path', 'id')
+    )
+    AssetPathAggregateDelta.objects.bulk_create(
+        [
+            AssetPathAggregateDelta(path_id=path_id, files=-files[path], size=-sizes[path])
+            for path, path_id in folder_ids.items()
+        ]
+    )
+
+    # Delete the leaves, and any of their folders which no longer contain any files
+    AssetPath.objects.filter(id__in=[leaf_id for leaf_id, _, _ in leaves]).delete()
+    _delete_empty_paths(AssetPath.objects.filter(id__in=folder_ids.values()))
+
+    return len(leaves)
+
+
+# Deleting the deltas and applying them happens in a single statement, so that concurrent
+# compactions of the same version can never apply a delta twice
+_COMPACT_VERSION_AGGREGATES_SQL = """
+    WITH folded AS (
+        DELETE FROM api_assetpathaggregatedelta d
+        USING api_assetpath p
+        WHERE d.path_id = p.id AND p.version_id = %(version_id)s
+        RETURNING d.path_id, d.files, d.size
+    )
+    UPDATE api_assetpath p
+    SET
+        aggregate_files = p.aggregate_files + agg.files,
+        aggregate_size = p.aggregate_size + agg.size
+    FROM (
+        SELECT path_id, sum(files) AS files, sum(size) AS size
+        FROM folded
+        GROUP BY path_id
+    ) agg
+    WHERE p.id = agg.path_id
+"""
+
+
+@transaction.atomic
+def compact_asset_path_aggregates(version: Version):
+    """Fold all aggregate deltas of a version into the aggregate fields of their paths."""
+    with connection.cursor() as cursor:
+        cursor.execute(_COMPACT_VERSION_AGGREGATES_SQL, {'version_id': version.id})
+
+
+@transaction.atomic
+def prune_empty_asset_paths(version: Version) -> int:
+    """
+    Delete all paths of a version that don't contain any files.
+
+    Deleting an asset only prunes its own ancestors, so concurrent deletions from the same folder
+    can each leave it behind. This cleans up any such paths, returning the number deleted.
+    """
+    compact_asset_path_aggregates(version)
+    return _delete_empty_paths(AssetPath.objects.filter(version=version))
+
+
+# The statements below implement `add_version_asset_paths` as a handful of set-based queries.
+# Every (asset, node path) pair of the version is first expanded into a temporary staging table,
+# from which the paths, the closure relations and the folder aggregates are derived in bulk.
+_CREATE_STAGING_TABLE_SQL = """
+    CREATE TEMPORARY TABLE asset_path_staging (
+        asset_id bigint NOT NULL,
+        path varchar(512) COLLATE "C" NOT NULL,
+        depth integer NOT NULL,
+        is_leaf boolean NOT NULL,
+        size bigint NOT NULL,
+        path_id bigint
+    ) ON COMMIT DROP
+"""
+
+_STAGE_VERSION_ASSET_NODES_SQL = """
+    INSERT INTO asset_path_staging (asset_id, path, depth, is_leaf, size)
+    SELECT
+        a.id,
+        array_to_string(parts.nodes[1:n.depth], '/'),
+        n.depth,
+        n.depth = cardinality(parts.nodes),
+        COALESCE(b.size, z.size, 0)
+    FROM api_asset_versions av
+    JOIN api_asset a ON a.id = av.asset_id
+    LEFT JOIN api_assetblob b ON b.id = a.blob_id
+    LEFT JOIN zarr_zarrarchive z ON z.id = a.zarr_id
+    CROSS JOIN LATERAL string_to_array(a.path, '/') AS parts(nodes)
+    CROSS JOIN LATERAL generate_series(1, cardinality(parts.nodes)) AS n(depth)
+    WHERE av.version_id = %(version_id)s
+"""
+
+_INSERT_STAGED_PATHS_SQL = """
+    INSERT INTO api_assetpath (path, version_id, asset_id, aggregate_files, aggregate_size)
+    SELECT DISTINCT s.path, %(version_id)s, CASE WHEN s.is_leaf THEN s.asset_id END, 0, 0
+    FROM asset_path_staging s
+    ON CONFLICT DO NOTHING
+"""
+
+_RESOLVE_STAGED_PATH_IDS_SQL = """
+    UPDATE asset_path_staging s
+    SET path_id = p.id
+    FROM api_assetpath p
+    WHERE p.version_id = %(version_id)s AND p.path = s.path
+"""
+
+# Any staged leaf which isn't backed by a path pointing to its own asset
+# has collided with a different asset (or folder) at the same path
+_FIND_CONFLICTING_STAGED_LEAF_SQL = """
+    SELECT s.path
+    FROM asset_path_staging s
+    LEFT JOIN api_assetpath p ON p.id = s.path_id
+    WHERE s.is_leaf AND (p.asset_id IS NULL OR p.asset_id != s.asset_id)
+    LIMIT 1
+"""
+
+_INSERT_STAGED_RELATIONS_SQL = """
+    INSERT INTO api_assetpathrelation (parent_id, child_id, depth)
+    SELECT DISTINCT parent.path_id, child.path_id, child.depth - parent.depth
+    FROM asset_path_staging parent
+    JOIN asset_path_staging child
+        ON child.asset_id = parent.asset_id AND child.depth >= parent.depth
+    ON CONFLICT DO NOTHING
+"""
+
+# Only nodes which haven't been computed yet are updated, which keeps this idempotent
+_UPDATE_STAGED_AGGREGATES_SQL = """
+    UPDATE api_assetpath p
+    SET aggregate_files = agg.files, aggregate_size = agg.size
+    FROM (
+        SELECT path_id, count(*) AS files, sum(size) AS size
+        FROM asset_path_staging
+        GROUP BY path_id
+    ) agg
+    WHERE p.id = agg.path_id AND p.aggregate_files = 0
+"""
+
+
 @transaction.atomic
 def add_version_asset_paths(version: Version):
-    """Add every asset from a version."""
-    # Leaves
-    for asset in tqdm(version.assets.all()):
-        insert_asset_paths(asset, version)
-
-    # Compute aggregate file size + count for each asset path, instead of when each asset
-    # is added. This is done because updating the same row many times within a transaction is slow.
-    # https://stackoverflow.com/a/60221875
-
-    # Get all nodes which haven't been computed yet
-    nodes = AssetPath.objects.filter(version=version, aggregate_files=0)
-    for node in tqdm(nodes):
-        child_link_ids = node.child_links.distinct('child_id').values_list('child_id', flat=True)
-        child_leaves = AssetPath.objects.filter(id__in=child_link_ids, asset__isnull=False)
-
-        # Get all aggregates
-        sizes = child_leaves.aggregate(
-            size=Coalesce(Sum('asset__blob__size'), 0), zsize=Coalesce(Sum('asset__zarr__size'), 0)
-        )
+    """
+    Add every asset from a version.
 
-        node.aggregate_files += child_leaves.count()
-        node.aggregate_size += sizes['size'] + sizes['zsize']
-        node.save()
+    This produces the same paths, relations and aggregates as calling `add_asset_paths` for each
+    asset, but does so with a fixed number of queries, regardless of the number of assets.
+    """
+    # Any existing paths must reflect their true aggregates before computing the missing ones
+    compact_asset_path_aggregates(version)
+
+    params = {'version_id': version.id}
+    with connection.cursor() as cursor:
+        cursor.execute(_CREATE_STAGING_TABLE_SQL)
+        cursor.execute(_STAGE_VERSION_ASSET_NODES_SQL, params)
+        cursor.execute('CREATE INDEX ON asset_path_staging (asset_id, depth)')
+        cursor.execute('ANALYZE asset_path_staging')
+
+        cursor.execute(_INSERT_STAGED_PATHS_SQL, params)
+        cursor.execute(_RESOLVE_STAGED_PATH_IDS_SQL, params)
+        cursor.execute(_FIND_CONFLICTING_STAGED_LEAF_SQL)
+        if cursor.fetchone() is not None:
+            from dandiapi.api.services.asset.exceptions import AssetAlreadyExistsError
+
+            raise AssetAlreadyExistsError
+
+        if uses_closure_table():
+            cursor.execute(_INSERT_STAGED_RELATIONS_SQL)
+
+        # Compute aggregate file size + count for each asset path in one pass, instead of when
+        # each asset is added. This is done because updating the same row many times within a
+        # transaction is slow. https://stackoverflow.com/a/60221875
+        cursor.execute(_UPDATE_STAGED_AGGREGATES_SQL)
+
+        # Drop explicitly, as this may be called more than once within the same transaction
+        cursor.execute('DROP TABLE asset_path_staging')
+
+
+_STAGE_ASSET_NODES_SQL = """
+    INSERT INTO asset_path_staging (asset_id, path, depth, is_leaf, size)
+    SELECT
+        a.id,
+        array_to_string(parts.nodes[1:n.depth], '/'),
+        n.depth,
+        n.depth = cardinality(parts.nodes),
+        COALESCE(b.size, z.size, 0)
+    FROM api_asset a
+    LEFT JOIN api_assetblob b ON b.id = a.blob_id
+    LEFT JOIN zarr_zarrarchive z ON z.id = a.zarr_id
+    CROSS JOIN LATERAL string_to_array(a.path, '/') AS parts(nodes)
+    CROSS JOIN LATERAL generate_series(1, cardinality(parts.nodes)) AS n(depth)
+    WHERE a.id = ANY(%(asset_ids)s)
+"""
+
+# Any staged folder backed by a path of an asset collides with that asset. Adding a whole version
+# can't cause this, as the version's own assets can't conflict with each other.
+_FIND_CONFLICTING_STAGED_FOLDER_SQL = """
+    SELECT a.path, s.path
+    FROM asset_path_staging s
+    JOIN api_assetpath p ON p.id = s.path_id
+    JOIN api_asset a ON a.id = s.asset_id
+    WHERE NOT s.is_leaf AND p.asset_id IS NOT NULL
+    LIMIT 1
+"""
+
+# Each leaf belongs to its asset alone, so is set in place, as in `add_asset_paths`
+_UPDATE_STAGED_LEAF_AGGREGATES_SQL = """
+    UPDATE api_assetpath p
+    SET aggregate_files = 1, aggregate_size = s.size
+    FROM asset_path_staging s
+    WHERE p.id = s.path_id AND s.is_leaf
+"""
+
+# Folders may be shared with other assets, so are changed through a single delta each
+_INSERT_STAGED_FOLDER_DELTAS_SQL = """
+    INSERT INTO api_assetpathaggregatedelta (path_id, files, size)
+    SELECT path_id, count(*), sum(size)
+    FROM asset_path_staging
+    WHERE NOT is_leaf
+    GROUP BY path_id
+"""
 
 
 @transaction.atomic
-def add_zarr_paths(zarr: ZarrArchive):
-    """Add all asset paths that are associated with a zarr."""
-    # Only act on draft assets/versions
-    for asset in zarr.assets.filter(published=False).iterator():
-        for version in asset.versions.filter(version='draft').iterator():
-            _add_asset_paths(asset, version)
+def add_asset_paths_many(assets: Iterable[Asset], version: Version):
+    """
+    Add many new assets to the paths of a version.
+
+    This produces the same paths, relations and aggregates as calling `add_asset_paths` for each
+    asset, but does so with a fixed number of queries, regardless of the number of assets.
+    """
+    asset_ids = [asset.id for asset in assets]
+    if not asset_ids:
+        return
+
+    params = {'version_id': version.id, 'asset_ids': asset_ids}
+    with connection.cursor() as cursor:
+        cursor.execute(_CREATE_STAGING_TABLE_SQL)
+        cursor.execute(_STAGE_ASSET_NODES_SQL, params)
+        cursor.execute(_INSERT_STAGED_PATHS_SQL, params)
+        cursor.execute(_RESOLVE_STAGED_PATH_IDS_SQL, params)
+        cursor.execute(_FIND_CONFLICTING_STAGED_LEAF_SQL)
+        if cursor.fetchone() is not None:
+            from dandiapi.api.services.asset.exceptions import AssetAlreadyExistsError
+
+            raise AssetAlreadyExistsError
+        cursor.execute(_FIND_CONFLICTING_STAGED_FOLDER_SQL)
+        conflict = cursor.fetchone()
+        if conflict is not None:
+            from dandiapi.api.services.asset.exceptions import AssetPathConflictError
+
+            new_path, existing_path = conflict
+            raise AssetPathConflictError(new_path=new_path, existing_paths=[existing_path])
+
+        if uses_closure_table():
+            cursor.execute(_INSERT_STAGED_RELATIONS_SQL)
+
+        cursor.execute(_UPDATE_STAGED_LEAF_AGGREGATES_SQL)
+        cursor.execute(_INSERT_STAGED_FOLDER_DELTAS_SQL)
+
+        # Drop explicitly, as this may be called more than once within the same transaction
+        cursor.execute('DROP TABLE asset_path_staging')
+
+
+# Each distinct node has one relation to itself and to each of its ancestors, i.e. `depth` rows
+_COUNT_VERSION_ASSET_NODES_SQL = """
+    SELECT count(*), COALESCE(sum(nodes.depth), 0)
+    FROM (
+        SELECT DISTINCT array_to_string(parts.nodes[1:n.depth], '/') AS path, n.depth
+        FROM api_asset_versions av
+        JOIN api_asset a ON a.id = av.asset_id
+        CROSS JOIN LATERAL string_to_array(a.path, '/') AS parts(nodes)
+        CROSS JOIN LATERAL generate_series(1, cardinality(parts.nodes)) AS n(depth)
+        WHERE av.version_id = %(version_id)s
+    ) nodes
+"""
+
+
+def count_version_asset_paths(version: Version) -> tuple[int, int]:
+    """Return the number of paths and relations that ingesting a version anew would create."""
+    with connection.cursor() as cursor:
+        cursor.execute(_COUNT_VERSION_ASSET_NODES_SQL, {'version_id': version.id})
+        paths, relations = cursor.fetchone()
+
+    return paths, relations if uses_closure_table() else 0
+
+
+# Deleting these directly avoids Django loading every path of the version into memory
+_DELETE_VERSION_RELATIONS_SQL = """
+    DELETE FROM api_assetpathrelation r
+    USING api_assetpath p
+    WHERE r.parent_id = p.id AND p.version_id = %(version_id)s
+"""
+
+_DELETE_VERSION_AGGREGATE_DELTAS_SQL = """
+    DELETE FROM api_assetpathaggregatedelta d
+    USING api_assetpath p
+    WHERE d.path_id = p.id AND p.version_id = %(version_id)s
+"""
+
+_DELETE_VERSION_PATHS_SQL = 'DELETE FROM api_assetpath WHERE version_id = %(version_id)s'
+
+
+@transaction.atomic
+def rebuild_version_asset_paths(version: Version):
+    """Delete all asset paths of a version, and ingest them again from its assets."""
+    params = {'version_id': version.id}
+    with connection.cursor() as cursor:
+        cursor.execute(_DELETE_VERSION_RELATIONS_SQL, params)
+        cursor.execute(_DELETE_VERSION_AGGREGATE_DELTAS_SQL, params)
+        cursor.execute(_DELETE_VERSION_PATHS_SQL, params)
+
+    add_version_asset_paths(version)
+
+
+_CLONE_VERSION_PATHS_SQL = """
+    INSERT INTO api_assetpath (path, version_id, asset_id, aggregate_files, aggregate_size)
+    SELECT path, %(target_version_id)s, asset_id, aggregate_files, aggregate_size
+    FROM api_assetpath
+    WHERE version_id = %(source_version_id)s
+"""
+
+# Paths are unique per version, so each relation is remapped to the new version through its paths
+_CLONE_VERSION_RELATIONS_SQL = """
+    INSERT INTO api_assetpathrelation (parent_id, child_id, depth)
+    SELECT new_parent.id, new_child.id, r.depth
+    FROM api_assetpathrelation r
+    JOIN api_assetpath old_parent ON old_parent.id = r.parent_id
+    JOIN api_assetpath old_child ON old_child.id = r.child_id
+    JOIN api_assetpath new_parent
+        ON new_parent.version_id = %(target_version_id)s AND new_parent.path = old_parent.path
+    JOIN api_assetpath new_child
+        ON new_child.version_id = %(target_version_id)s AND new_child.path = old_child.path
+    WHERE old_parent.version_id = %(source_version_id)s
+"""
 
 
 @transaction.atomic
-def delete_zarr_paths(zarr: ZarrArchive):
-    """Remove all asset paths that are associated with a zarr."""
-    # Only act on draft assets/versions
-    for asset in zarr.assets.filter(published=False).iterator():
-        for version in asset.versions.filter(version='draft').iterator():
-            _delete_asset_paths(asset, version)
+def clone_version_asset_paths(source: Version, target: Version):
+    """
+    Copy the entire asset path tree of one version to another version.
+
+    The target version must contain the same assets as the source version, and must not have any
+    asset paths of its own. This is used when publishing, since the draft version already has a
+    correct, aggregated tree.
+    """
+    if target.asset_paths.exists():
+        raise RuntimeError(f'Version {target} already contains asset paths')
+
+    compact_asset_path_aggregates(source)
+
+    params = {'source_version_id': source.id, 'target_version_id': target.id}
+    with connection.cursor() as cursor:
+        cursor.execute(_CLONE_VERSION_PATHS_SQL, params)
+        if uses_closure_table():
+            cursor.execute(_CLONE_VERSION_RELATIONS_SQL, params)
+
+
+# Each leaf is resized in place, and the difference in its size is recorded as a delta for each of
+# its ancestors, which are found from the leaf path itself (so this works for either hierarchy)
+_RESIZE_ZARR_PATHS_SQL = """
+    WITH leaves AS (
+        SELECT leaf.id, leaf.version_id, leaf.path, %(size)s - leaf.aggregate_size AS diff
+        FROM api_assetpath leaf
+        JOIN api_asset a ON a.id = leaf.asset_id
+        JOIN api_version v ON v.id = leaf.version_id
+        WHERE a.zarr_id = %(zarr_id)s
+            AND NOT a.published
+            AND v.version = 'draft'
+            AND leaf.aggregate_size != %(size)s
+        FOR UPDATE OF leaf
+    ),
+    resized AS (
+        UPDATE api_assetpath p
+        SET aggregate_size = %(size)s
+        FROM leaves
+        WHERE p.id = leaves.id
+    )
+    INSERT INTO api_assetpathaggregatedelta (path_id, files, size)
+    SELECT p.id, 0, leaves.diff
+    FROM leaves
+    CROSS JOIN LATERAL string_to_array(leaves.path, '/') AS parts(nodes)
+    CROSS JOIN LATERAL generate_series(1, cardinality(parts.nodes) - 1) AS n(depth)
+    JOIN api_assetpath p
+        ON p.version_id = leaves.version_id
+        AND p.path = array_to_string(parts.nodes[1:n.depth], '/') COLLATE "C"
+"""
+
+
+def resize_zarr_paths(zarr: ZarrArchive):
+    """
+    Update the asset paths associated with a zarr to reflect its current size.
+
+    Rather than removing and re-adding the paths of each asset, the size difference is applied to
+    the leaves and their ancestors in every draft version at once.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(_RESIZE_ZARR_PATHS_SQL, {'zarr_id': zarr.id, 'size': zarr.size})
+
+
+@dataclass
+class AssetPathDrift:
+    """An asset path whose aggregates don't match the assets it contains."""
+
+    path_id: int
+    path: str
+    files: int
+    size: int
+    expected_files: int
+    expected_size: int
+
+
+# The expected aggregates of every path are recomputed from the current size of each leaf's asset,
+# and compared against the stored aggregates along with any uncompacted deltas
+_FIND_VERSION_AGGREGATE_DRIFT_SQL = """
+    WITH leaves AS (
+        SELECT leaf.path, COALESCE(b.size, z.size, 0) AS size
+        FROM api_assetpath leaf
+        JOIN api_asset a ON a.id = leaf.asset_id
+        LEFT JOIN api_assetblob b ON b.id = a.blob_id
+        LEFT JOIN zarr_zarrarchive z ON z.id = a.zarr_id
+        WHERE leaf.version_id = %(version_id)s
+    ),
+    expected AS (
+        SELECT
+            array_to_string(parts.nodes[1:n.depth], '/') COLLATE "C" AS path,
+            count(*) AS files,
+            sum(leaves.size) AS size
+        FROM leaves
+        CROSS JOIN LATERAL string_to_array(leaves.path, '/') AS parts(nodes)
+        CROSS JOIN LATERAL generate_series(1, cardinality(parts.nodes)) AS n(depth)
+        GROUP BY 1
+    ),
+    pending AS (
+        SELECT d.path_id, sum(d.files) AS files, sum(d.size) AS size
+        FROM api_assetpathaggregatedelta d
+        JOIN api_assetpath p ON p.id = d.path_id
+        WHERE p.version_id = %(version_id)s
+        GROUP BY d.path_id
+    ),
+    actual AS (
+        SELECT
+            p.id,
+            p.path,
+            p.aggregate_files + COALESCE(pending.files, 0) AS files,
+            p.aggregate_size + COALESCE(pending.size, 0) AS size,
+            COALESCE(expected.files, 0) AS expected_files,
+            COALESCE(expected.size, 0) AS expected_size
+        FROM api_assetpath p
+        LEFT JOIN pending ON pending.path_id = p.id
+        LEFT JOIN expected ON expected.path = p.path
+        WHERE p.version_id = %(version_id)s
+    )
+    SELECT id, path, files, size, expected_files, expected_size
+    FROM actual
+    WHERE files != expected_files OR size != expected_size
+    ORDER BY path
+"""
+
+
+def find_asset_path_drift(version: Version) -> list[AssetPathDrift]:
+    """Return all paths of a version with aggregates that don't match the assets they contain."""
+    with connection.cursor() as cursor:
+        cursor.execute(_FIND_VERSION_AGGREGATE_DRIFT_SQL, {'version_id': version.id})
+        return [AssetPathDrift(*row) for row in cursor.fetchall()]
+
+
+@transaction.atomic
+def repair_asset_path_aggregates(version: Version) -> list[AssetPathDrift]:
+    """
+    Correct the aggregates of all paths of a version, returning the paths that were incorrect.
+
+    Paths which no longer contain any files are deleted.
+    """
+    # Any change to the assets of a version also updates the version itself, so holding a lock on
+    # it prevents assets from being changed until the repair is committed
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM api_version WHERE id = %s FOR UPDATE', [version.id])
+
+    compact_asset_path_aggregates(version)
+    drift = find_asset_path_drift(version)
+
+    AssetPath.objects.bulk_update(
+        [
+            AssetPath(
+                id=d.path_id, aggregate_files=d.expected_files, aggregate_size=d.expected_size
+            )
+            for d in drift
+            if d.expected_files
+        ],
+        fields=['aggregate_files', 'aggregate_size'],
+    )
+    AssetPath.objects.filter(id__in=[d.path_id for d in drift if not d.expected_files]).delete()
+
+    return drift
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+import time
+
+import djclick as click
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from dandiapi.api.models import Version
+from dandiapi.api.views.pagination import KeysetPagination
+
+
+def _time_page(version: Version, params: dict) -> float:
+    paginator = KeysetPagination()
+    request = Request(APIRequestFactory().get('/', params))
+    start = time.perf_counter()
+    paginator.paginate_queryset(version.assets.all(), request)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.argument('dandiset')
+@click.argument('version', default='draft')
+@click.option(
+    '--order',
+    default='created',
+    show_default=True,
+    type=click.Choice(KeysetPagination.get_ordering_choices()),
+)
+@click.option('--page-size', default=100, show_default=True)
+@click.option(
+    '--samples',
+    default=5,
+    show_default=True,
+    help='The number of pages to time, spread evenly across the listing',
+)
+def benchmark_asset_pagination(
+    *, dandiset: str, version: str, order: str, page_size: int, samples: int
+):
+    """Compare the time to fetch pages of the asset list by page number and by cursor."""
+    ver = Version.objects.get(dandiset=int(dandiset), version=version)
+    total = ver.assets.count()
+    pages = max(math.ceil(total / page_size), 1)
+    click.echo(f'Version: {ver} ({total} assets, {pages} pages)')
+
+    paginator = KeysetPagination()
+    field = order.lstrip('-')
+    ordered = ver.assets.order_by(order, '-id' if order.startswith('-') else 'id')
+    for page in sorted({1 + (pages - 1) * i // max(samples - 1, 1) for i in range(samples)}):
+        # The cursor of a page is made from the last row of the page before it
+        cursor = ''
+        if page > 1:
+            pk, value = ordered.values_list('id', field)[(page - 1) * page_size - 1]
+            cursor = paginator.encode_cursor(value, pk)
+
+        offset_time = _time_page(ver, {'order': order, 'page': page, 'page_size': page_size})
+        cursor_time = _time_page(ver, {'order': order, 'cursor': cursor, 'page_size': page_size})
+        click.echo(f'\tPage {page}: offset {offset_time:.3f}s, cursor {cursor_time:.3f}s')
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.test.utils import override_settings
+import djclick as click
+
+from dandiapi.api.asset_paths import (
+    add_version_asset_paths,
+    compact_asset_path_aggregates,
+    get_path_children,
+    insert_asset_paths,
+)
+from dandiapi.api.models import AssetPath, AssetPathRelation, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def legacy_add_version_asset_paths(version: Version):
+    """Add every asset from a version, one asset at a time (the original implementation)."""
+    for asset in version.assets.all():
+        insert_asset_paths(asset, version)
+    compact_asset_path_aggregates(version)
+
+    nodes = AssetPath.objects.filter(version=version, aggregate_files=0)
+    for node in nodes:
+        child_link_ids = node.child_links.distinct('child_id').values_list('child_id', flat=True)
+        child_leaves = AssetPath.objects.filter(id__in=child_link_ids, asset__isnull=False)
+        sizes = child_leaves.aggregate(
+            size=Coalesce(Sum('asset__blob__size'), 0), zsize=Coalesce(Sum('asset__zarr__size'), 0)
+        )
+
+        node.aggregate_files += child_leaves.count()
+        node.aggregate_size += sizes['size'] + sizes['zsize']
+        node.save()
+
+
+def snapshot_asset_paths(version: Version) -> tuple[set, set]:
+    """Return the paths and relations of a version, independent of their row IDs."""
+    paths = set(
+        AssetPath.objects.filter(version=version).values_list(
+            'path', 'asset_id', 'aggregate_files', 'aggregate_size'
+        )
+    )
+    relations = set(
+        AssetPathRelation.objects.filter(parent__version=version).values_list(
+            'parent__path', 'child__path', 'depth'
+        )
+    )
+    return paths, relations
+
+
+def _time_ingestion(version: Version, ingest: Callable[[Version], None]) -> float:
+    AssetPath.objects.filter(version=version).delete()
+    start = time.perf_counter()
+    ingest(version)
+    return time.perf_counter() - start
+
+
+def _time_children_queries(folders: list[AssetPath], depth: int | None) -> float:
+    start = time.perf_counter()
+    for folder in folders:
+        list(get_path_children(folder, depth=depth))
+    return time.perf_counter() - start
+
+
+def _relation_size(version: Version) -> tuple[int, int]:
+    """Return the number of closure table rows of a version, along with their size in bytes."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT count(*), COALESCE(sum(pg_column_size(r.*)), 0)
+            FROM api_assetpathrelation r
+            JOIN api_assetpath p ON p.id = r.parent_id
+            WHERE p.version_id = %s
+            """,
+            [version.id],
+        )
+        return cursor.fetchone()
+
+
+def _table_sizes() -> tuple[int, int]:
+    """Return the size of the entire closure table, and of the index replacing it."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT
+                pg_total_relation_size('api_assetpathrelation'),
+                pg_relation_size('"version-depth-path"')
+            """
+        )
+        return cursor.fetchone()
+
+
+@click.command()
+@click.argument('dandiset')
+@click.argument('version', default='draft')
+@click.option(
+    '--folders',
+    default=200,
+    show_default=True,
+    help='The maximum number of folders to query the children of',
+)
+def benchmark_asset_paths(*, dandiset: str, version: str, folders: int):
+    """
+    Benchmark asset path ingestion and hierarchy queries of a version.
+
+    This compares the bulk and the per-asset ingestion, along with the closure table and prefix
+    hierarchies. Everything is run within a transaction that is always rolled back, so the
+    existing asset paths of the version are left untouched.
+    """
+    ver = Version.objects.get(dandiset=int(dandiset), version=version)
+    click.echo(f'Version: {ver} ({ver.assets.count()} assets)')
+
+    # The per-asset implementation relies on the closure table to compute aggregates
+    with transaction.atomic(), override_settings(DANDI_ASSET_PATH_HIERARCHY='closure'):
+        legacy_time = _time_ingestion(ver, legacy_add_version_asset_paths)
+        legacy_snapshot = snapshot_asset_paths(ver)
+
+        bulk_time = _time_ingestion(ver, add_version_asset_paths)
+        bulk_snapshot = snapshot_asset_paths(ver)
+
+        relation_count, relation_bytes = _relation_size(ver)
+        closure_table_bytes, prefix_index_bytes = _table_sizes()
+        sample = list(ver.asset_paths.filter(asset__isnull=True).order_by('?')[:folders])
+        hierarchy_times = {}
+        for hierarchy in ['closure', 'prefix']:
+            with override_settings(DANDI_ASSET_PATH_HIERARCHY=hierarchy):
+                hierarchy_times[hierarchy] = (
+                    _time_children_queries(sample, depth=1),
+                    _time_children_queries(sample, depth=None),
+                )
+
+        # Discard all changes made while benchmarking
+        transaction.set_rollback(True)
+
+    click.echo('Ingestion:')
+    click.echo(f'\tPer-asset: {legacy_time:.2f}s')
+    click.echo(f'\tBulk: {bulk_time:.2f}s ({legacy_time / max(bulk_time, 1e-6):.1f}x)')
+    click.echo(f'\t{len(bulk_snapshot[0])} paths, {len(bulk_snapshot[1])} relations')
+
+    click.echo('Hierarchy size:')
+    click.echo(f'\tClosure table rows for this version: {relation_count} ({relation_bytes} bytes)')
+    click.echo(f'\tClosure table, all versions: {closure_table_bytes} bytes')
+    click.echo(f'\tPrefix index, all versions: {prefix_index_bytes} bytes')
+
+    click.echo(f'Children of {len(sample)} folders (direct / all):')
+    for hierarchy, (direct_time, all_time) in hierarchy_times.items():
+        click.echo(f'\t{hierarchy.capitalize()}: {direct_time:.3f}s / {all_time:.3f}s')
+
+    if bulk_snapshot != legacy_snapshot:
+        click.echo(click.style('\nBulk and per-asset ingestion differ', fg='red', bold=True))
+        sys.exit(1)
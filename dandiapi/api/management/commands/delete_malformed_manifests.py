@@ -104,7 +104,7 @@ def delete_malformed_manifests(dandisets: tuple[int, ...], *, include_all: bool,
         regenerated_count += 1
         if not dry_run:
             click.echo('  Regenerating manifest files...')
-            write_manifest_files(version_obj.pk)
+            write_manifest_files(version_obj.pk, force=True)
         else:
             click.echo('  [DRY RUN] Would regenerate manifest files...')
 
@@ -1,14 +1,151 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+from typing import TYPE_CHECKING
+
+from django.db import connections
 import djclick as click
 
-from dandiapi.api.asset_paths import add_version_asset_paths
-from dandiapi.api.models import Version
+from dandiapi.api.asset_paths import count_version_asset_paths
+from dandiapi.api.models import AssetPathIngestCheckpoint, Version
+from dandiapi.api.tasks import ingest_version_asset_paths_task
 
+if TYPE_CHECKING:
+    from datetime import datetime
 
-@click.command()
-def ingest_asset_paths():
-    for version in Version.objects.iterator():
+
+def _echo_expected_rows(versions: list[Version]):
+    total_paths = total_relations = 0
+    for version in versions:
+        paths, relations = count_version_asset_paths(version)
+        total_paths += paths
+        total_relations += relations
         click.echo(f'Version: {version}')
-        click.echo(f'\t {version.assets.count()} assets')
-        add_version_asset_paths(version)
+        click.echo(f'\t {paths} paths, {relations} relations')
+
+    click.echo(f'Total: {len(versions)} versions, {total_paths} paths, {total_relations} relations')
+
+
+def _ingest_in_process(version_ids: list[int], *, rebuild: bool, workers: int):
+    if workers == 1:
+        for i, version_id in enumerate(version_ids, start=1):
+            ingest_version_asset_paths_task(version_id, rebuild=rebuild)
+            click.echo(f'[{i}/{len(version_ids)}] Ingested version {version_id}')
+        return
+
+    # Connections can't be shared with forked processes, so each worker must open its own
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context('fork')
+    ) as executor:
+        futures = {
+            executor.submit(
+                ingest_version_asset_paths_task, version_id, rebuild=rebuild
+            ): version_id
+            for version_id in version_ids
+        }
+        failed = []
+        for i, future in enumerate(as_completed(futures), start=1):
+            version_id = futures[future]
+            if future.exception() is not None:
+                failed.append(version_id)
+                click.echo(
+                    f'[{i}/{len(version_ids)}] Failed to ingest version {version_id}: '
+                    f'{future.exception()}',
+                    err=True,
+                )
+            else:
+                click.echo(f'[{i}/{len(version_ids)}] Ingested version {version_id}')
+
+    # Fail like an exception would in a single process, once every other version has finished
+    if failed:
+        raise click.ClickException(
+            f'Failed to ingest {len(failed)} versions: {", ".join(map(str, sorted(failed)))}'
+        )
+
+
+@click.command()
+@click.option(
+    '--dandiset',
+    'dandisets',
+    multiple=True,
+    type=int,
+    help='Only ingest the versions of this dandiset. May be specified more than once.',
+)
+@click.option(
+    '--since',
+    type=click.DateTime(),
+    help='Only ingest versions which were modified since this date',
+)
+@click.option(
+    '--rebuild',
+    is_flag=True,
+    default=False,
+    help='Delete and recreate all existing paths of each version',
+)
+@click.option(
+    '--workers',
+    default=1,
+    show_default=True,
+    help='The number of processes to ingest versions in',
+)
+@click.option(
+    '--celery',
+    'use_celery',
+    is_flag=True,
+    default=False,
+    help='Dispatch a task for each version instead of ingesting them in this process',
+)
+@click.option(
+    '--restart',
+    is_flag=True,
+    default=False,
+    help='Discard the checkpoints of previous runs, ingesting every selected version again',
+)
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    default=False,
+    help='Only report the number of paths and relations each version would have',
+)
+def ingest_asset_paths(  # noqa: PLR0913
+    *,
+    dandisets: tuple[int, ...],
+    since: datetime | None,
+    rebuild: bool,
+    workers: int,
+    use_celery: bool,
+    restart: bool,
+    dry_run: bool,
+):
+    """
+    Ingest the asset paths of all versions.
+
+    A checkpoint is recorded for every version once it's ingested, so if this is interrupted,
+    running it again will skip any versions which were already completed.
+    """
+    versions = Version.objects.order_by('id')
+    if dandisets:
+        versions = versions.filter(dandiset__in=dandisets)
+    if since is not None:
+        versions = versions.filter(modified__gte=since)
+
+    checkpoints = AssetPathIngestCheckpoint.objects.filter(version__in=versions)
+    if restart and not dry_run:
+        checkpoints.delete()
+    elif not restart:
+        versions = versions.exclude(id__in=checkpoints.values('version_id'))
+
+    if dry_run:
+        _echo_expected_rows(list(versions.select_related('dandiset')))
+        return
+
+    version_ids = list(versions.values_list('id', flat=True))
+    click.echo(f'Ingesting {len(version_ids)} versions')
+    if use_celery:
+        for version_id in version_ids:
+            ingest_version_asset_paths_task.delay(version_id, rebuild=rebuild)
+        click.echo(f'Dispatched {len(version_ids)} tasks')
+    else:
+        _ingest_in_process(version_ids, rebuild=rebuild, workers=workers)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+
+import djclick as click
+
+from dandiapi.api.asset_paths import find_asset_path_drift, repair_asset_path_aggregates
+from dandiapi.api.models import Version
+
+
+@click.command()
+@click.option(
+    '--dandiset',
+    'dandisets',
+    multiple=True,
+    type=int,
+    help='Only verify the versions of this dandiset. May be specified more than once.',
+)
+@click.option('--repair', is_flag=True, default=False, help='Correct any incorrect aggregates')
+def verify_asset_paths(*, dandisets: tuple[int, ...], repair: bool):
+    """
+    Verify that the aggregates of all asset paths match the assets they contain.
+
+    Each version is verified (and repaired) in its own transaction.
+    """
+    versions = Version.objects.select_related('dandiset').order_by('id')
+    if dandisets:
+        versions = versions.filter(dandiset__in=dandisets)
+
+    total = 0
+    for version in versions.iterator():
+        drift = repair_asset_path_aggregates(version) if repair else find_asset_path_drift(version)
+        if not drift:
+            continue
+
+        total += len(drift)
+        click.echo(f'Version: {version}')
+        for d in drift:
+            click.echo(
+                f'\t {d.path}: {d.files} files ({d.size} bytes), '
+                f'expected {d.expected_files} files ({d.expected_size} bytes)'
+            )
+
+    click.echo(f'{total} asset paths {"repaired" if repair else "incorrect"}')
+    if total and not repair:
+        sys.exit(1)
@@ -1,28 +1,32 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-import tempfile
-from typing import IO, TYPE_CHECKING, Any
-from urllib.parse import urlparse, urlunparse
+from abc import ABC, abstractmethod
+from contextlib import ExitStack, contextmanager
+import gzip
+import hashlib
+import io
+import json
+from typing import IO, TYPE_CHECKING, Any, cast
 
 from django.conf import settings
-from django.core.files.base import File
 from django.core.files.storage import default_storage
+from django.db.models import Count, Max, Q, Sum
 from rest_framework.renderers import JSONRenderer
 import yaml
 
+from dandiapi.api.asset_metadata import iter_full_metadata
 from dandiapi.api.models import Asset, Version
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Generator
+
+    from dandiapi.storage import DandiS3Storage
 
 
 def _s3_url(path: str) -> str:
     """Turn an object path into a fully qualified S3 URL."""
-    signed_url = default_storage.url(path)
-    # Strip off the query parameters from the presigning, as they are different every time
-    parsed = urlparse(signed_url)
-    return urlunparse((parsed[0], parsed[1], parsed[2], '', '', ''))
+    # Build the URL directly, as presigning it would only add query parameters
+    return cast('DandiS3Storage', default_storage).url(path, signed=False)
 
 
 def _manifests_path(version: Version) -> str:
@@ -38,7 +42,11 @@ def manifest_location(version: Version) -> list[str]:
                 f'/versions/draft/assets/'
             )
         ]
-    return [_s3_url(_assets_yaml_path(version))]
+    return [
+        _s3_url(_assets_yaml_path(version)),
+        _s3_url(_assets_yaml_gz_path(version)),
+        _s3_url(_assets_jsonld_gz_path(version)),
+    ]
 
 
 def _dandiset_jsonld_path(version: Version) -> str:
@@ -57,6 +65,14 @@ def _assets_yaml_path(version: Version) -> str:
     return f'{_manifests_path(version)}/assets.yaml'
 
 
+def _assets_jsonld_gz_path(version: Version) -> str:
+    return f'{_assets_jsonld_path(version)}.gz'
+
+
+def _assets_yaml_gz_path(version: Version) -> str:
+    return f'{_assets_yaml_path(version)}.gz'
+
+
 def _collection_jsonld_path(version: Version) -> str:
     return f'{_manifests_path(version)}/collection.jsonld'
 
@@ -68,31 +84,172 @@ def all_manifest_filepaths(version: Version) -> list[str]:
         _dandiset_yaml_path(version),
         _assets_yaml_path(version),
         _collection_jsonld_path(version),
+        _assets_jsonld_gz_path(version),
+        _assets_yaml_gz_path(version),
     ]
 
 
+# The compression level of the gzip compressed manifests. This is the fastest level, as they're
+# written in the same pass as the others, and the repetitive metadata still compresses well at it.
+MANIFEST_GZIP_LEVEL = 1
+
+
+def manifest_fingerprint(version: Version) -> str:
+    """
+    Return a digest of everything the manifests of a version are written from.
+
+    The manifests don't need to be rewritten while this is unchanged. The digest covers the version
+    metadata and the embargo status of its dandiset, along with a summary of its assets. Any asset
+    being added, removed or changed changes the summary. Assets awaiting validation are counted
+    separately, as their computed fields may still change.
+    """
+    assets = version.assets.aggregate(
+        count=Count('id'),
+        id_sum=Sum('id'),
+        modified=Max('modified'),
+        pending=Count('id', filter=Q(status=Asset.Status.PENDING)),
+    )
+    state = [version.dandiset.embargo_status, version.metadata, assets]
+    return hashlib.sha256(
+        json.dumps(state, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+
 @contextmanager
 def _streaming_file_upload(path: str, *, embargoed: bool) -> Generator[IO[bytes]]:
-    with tempfile.NamedTemporaryFile(mode='r+b') as outfile:
-        yield outfile
-        outfile.seek(0)
+    # Embargoed manifests are tagged as they're created, so they're never readable without the tag
+    tags = {'embargoed': 'true'} if embargoed else None
+    with cast('DandiS3Storage', default_storage).open_write(path, tags=tags) as stream:
+        yield cast('IO[bytes]', stream)
+
+
+def _yaml_dump_sequence_item(stream: IO[bytes], obj: Any) -> None:
+    for i, line in enumerate(
+        yaml.dump(obj, encoding='utf-8', Dumper=yaml.CSafeDumper, allow_unicode=True).splitlines()
+    ):
+        stream.write(b'- ' if i == 0 else b'  ')
+        stream.write(line)
+        stream.write(b'\n')
+
+
+class _TeeStream(io.RawIOBase):
+    """File-like object that writes everything written to it to several streams."""
+
+    def __init__(self, streams: list[IO[bytes]]):
+        self._streams = streams
+
+    def write(self, data: bytes) -> int:
+        for stream in self._streams:
+            stream.write(data)
+        return len(data)
+
+    def writable(self) -> bool:
+        return True
+
+
+class _AssetManifestEncoder(ABC):
+    """Write a manifest listing the assets of a version, one asset at a time."""
+
+    def __init__(self, stream: IO[bytes], version: Version) -> None:
+        self.stream = stream
+        self.renderer = JSONRenderer()
+        self.count = 0
+
+    @abstractmethod
+    def add(self, metadata: dict) -> None:
+        """Write the entry of an asset, given its full metadata."""
+
+    # Optional, as most manifests need nothing written after their last asset
+    def close(self) -> None:  # noqa: B027
+        """Finish the manifest, after all assets have been added."""
+
+    def _add_array_item(self, item: Any) -> None:
+        if self.count > 0:
+            self.stream.write(b',')
+        self.stream.write(self.renderer.render(item))
+        self.count += 1
+
+
+class _AssetsYamlEncoder(_AssetManifestEncoder):
+    """Write assets.yaml, a YAML sequence of the full metadata of each asset."""
 
-        default_storage.save(path, File(outfile))
+    def add(self, metadata: dict) -> None:
+        _yaml_dump_sequence_item(self.stream, metadata)
 
-    if embargoed:
-        default_storage.put_tags(path, {'embargoed': 'true'})
 
+class _AssetsJsonldEncoder(_AssetManifestEncoder):
+    """Write assets.jsonld, a JSON array of the full metadata of each asset."""
 
-def _yaml_dump_sequence_from_generator(stream: IO[bytes], generator: Iterable[Any]) -> None:
-    for obj in generator:
-        for i, line in enumerate(
-            yaml.dump(
-                obj, encoding='utf-8', Dumper=yaml.CSafeDumper, allow_unicode=True
-            ).splitlines()
+    def __init__(self, stream: IO[bytes], version: Version) -> None:
+        super().__init__(stream, version)
+        stream.write(b'[')
+
+    def add(self, metadata: dict) -> None:
+        self._add_array_item(metadata)
+
+    def close(self) -> None:
+        self.stream.write(b']')
+
+
+class _CollectionJsonldEncoder(_AssetManifestEncoder):
+    """Write collection.jsonld, listing the ID of each asset as a member of the version."""
+
+    suffix = b']}'
+
+    def __init__(self, stream: IO[bytes], version: Version) -> None:
+        super().__init__(stream, version)
+        # Render the collection without members, then write the members into its open array
+        collection = self.renderer.render(
+            {
+                '@context': version.metadata['@context'],
+                'id': version.metadata['id'],
+                '@type': 'prov:Collection',
+                'hasMember': [],
+            }
+        )
+        stream.write(collection.removesuffix(self.suffix))
+
+    def add(self, metadata: dict) -> None:
+        self._add_array_item(metadata['id'])
+
+    def close(self) -> None:
+        self.stream.write(self.suffix)
+
+
+def _write_asset_manifests(
+    version: Version, manifests: list[tuple[list[str], type[_AssetManifestEncoder]]]
+) -> None:
+    """
+    Write manifests listing the assets of a version, in a single pass over the assets.
+
+    The assets are read once with a server-side cursor and the full metadata of each is computed
+    once, then given to the encoder of every manifest. Each encoder renders an asset once and writes
+    it to all of its paths, compressing it for those ending with ".gz".
+    """
+    embargoed = version.dandiset.embargoed
+    with ExitStack() as stack:
+        encoders = []
+        for paths, encoder_class in manifests:
+            streams = []
+            for path in paths:
+                stream = stack.enter_context(_streaming_file_upload(path, embargoed=embargoed))
+                if path.endswith('.gz'):
+                    # This is closed before the upload completes, writing the end of the data
+                    gzip_file = gzip.GzipFile(
+                        fileobj=stream, mode='wb', compresslevel=MANIFEST_GZIP_LEVEL, mtime=0
+                    )
+                    stream = cast('IO[bytes]', stack.enter_context(gzip_file))
+                streams.append(stream)
+            tee = streams[0] if len(streams) == 1 else cast('IO[bytes]', _TeeStream(streams))
+            encoders.append(encoder_class(tee, version))
+        # Use full metadata when writing externally
+        for metadata in iter_full_metadata(
+            version.assets.select_related('blob', 'zarr', 'zarr__dandiset').order_by('created')
         ):
-            stream.write(b'- ' if i == 0 else b'  ')
-            stream.write(line)
-            stream.write(b'\n')
+            for encoder in encoders:
+                encoder.add(metadata)
+        for encoder in encoders:
+            encoder.close()
 
 
 def write_dandiset_jsonld(version: Version) -> None:
@@ -102,20 +259,7 @@ def write_dandiset_jsonld(version: Version) -> None:
 
 
 def write_assets_jsonld(version: Version) -> None:
-    # Use full metadata when writing externally
-    assets_metadata = (
-        asset.full_metadata
-        for asset in version.assets.select_related('blob', 'zarr', 'zarr__dandiset').iterator()
-    )
-    embargoed = version.dandiset.embargoed
-    with _streaming_file_upload(_assets_jsonld_path(version), embargoed=embargoed) as stream:
-        stream.write(b'[')
-        for i, obj in enumerate(assets_metadata):
-            if i > 0:
-                stream.write(b',')
-            stream.write(JSONRenderer().render(obj))
-
-        stream.write(b']')
+    _write_asset_manifests(version, [([_assets_jsonld_path(version)], _AssetsJsonldEncoder)])
 
 
 def write_dandiset_yaml(version: Version) -> None:
@@ -127,18 +271,7 @@ def write_dandiset_yaml(version: Version) -> None:
 
 
 def write_assets_yaml(version: Version) -> None:
-    embargoed = version.dandiset.embargoed
-    with _streaming_file_upload(_assets_yaml_path(version), embargoed=embargoed) as stream:
-        _yaml_dump_sequence_from_generator(
-            stream,
-            # Use full metadata when writing externally
-            (
-                asset.full_metadata
-                for asset in version.assets.select_related('blob', 'zarr', 'zarr__dandiset')
-                .order_by('created')
-                .iterator()
-            ),
-        )
+    _write_asset_manifests(version, [([_assets_yaml_path(version)], _AssetsYamlEncoder)])
 
 
 def write_collection_jsonld(version: Version) -> None:
@@ -158,3 +291,23 @@ def write_collection_jsonld(version: Version) -> None:
                 },
             )
         )
+
+
+def write_asset_manifests(version: Version) -> None:
+    """
+    Write every manifest listing the assets of a version in a single pass over the assets.
+
+    These are assets.yaml, assets.jsonld and collection.jsonld, along with gzip compressed copies of
+    assets.yaml and assets.jsonld.
+    """
+    _write_asset_manifests(
+        version,
+        [
+            ([_assets_yaml_path(version), _assets_yaml_gz_path(version)], _AssetsYamlEncoder),
+            (
+                [_assets_jsonld_path(version), _assets_jsonld_gz_path(version)],
+                _AssetsJsonldEncoder,
+            ),
+            ([_collection_jsonld_path(version)], _CollectionJsonldEncoder),
+        ],
+    )
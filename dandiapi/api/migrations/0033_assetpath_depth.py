@@ -0,0 +1,38 @@
+# Generated by Django 5.2.13 on 2026-10-18 04:38
+from __future__ import annotations
+
+from django.db import migrations, models
+import django.db.models.expressions
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0032_version_release_notes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetpath',
+            name='depth',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        django.db.models.functions.text.Length('path'),
+                        '-',
+                        django.db.models.functions.text.Length(
+                            django.db.models.functions.text.Replace('path', models.Value('/'))
+                        ),
+                    ),
+                    '+',
+                    models.Value(1),
+                ),
+                output_field=models.PositiveIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='assetpath',
+            index=models.Index(fields=['version', 'depth', 'path'], name='version-depth-path'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.13 on 2026-10-18 04:42
+from __future__ import annotations
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0033_assetpath_depth'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssetPathAggregateDelta',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                ('files', models.BigIntegerField()),
+                ('size', models.BigIntegerField()),
+                (
+                    'path',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='aggregate_deltas',
+                        to='api.assetpath',
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.13 on 2026-10-18 04:45
+from __future__ import annotations
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0034_assetpathaggregatedelta'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssetPathIngestCheckpoint',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                ('completed', models.DateTimeField(auto_now=True)),
+                (
+                    'version',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='api.version',
+                    ),
+                ),
+            ],
+        ),
+    ]
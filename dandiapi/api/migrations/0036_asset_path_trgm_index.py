@@ -0,0 +1,23 @@
+# Generated by Django 5.2.13 on 2026-10-18 04:53
+from __future__ import annotations
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0035_assetpathingestcheckpoint'),
+        ('zarr', '0005_remove_zarrarchive_embargoed'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='asset',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['path'], name='api_asset_path_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+    ]
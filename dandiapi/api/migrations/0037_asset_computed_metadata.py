@@ -0,0 +1,27 @@
+# Generated by Django 5.2.13 on 2026-10-18 04:58
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0036_asset_path_trgm_index'),
+        ('zarr', '0005_remove_zarrarchive_embargoed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='computed_metadata',
+            field=models.JSONField(blank=True, default=None, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(
+                condition=models.Q(('computed_metadata__isnull', True)),
+                fields=['id'],
+                name='api_asset_computed_pending',
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.13 on 2026-10-18 05:17
+from __future__ import annotations
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0037_asset_computed_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ManifestCheckpoint',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('version_modified', models.DateTimeField()),
+                ('written', models.DateTimeField(auto_now=True)),
+                (
+                    'version',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='manifest_checkpoint',
+                        to='api.version',
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.13 on 2026-10-18 05:31
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0038_manifestcheckpoint'),
+        ('zarr', '0005_remove_zarrarchive_embargoed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['created', 'id'], name='api_asset_created_id'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['modified', 'id'], name='api_asset_modified_id'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['path', 'id'], name='api_asset_path_id'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.13 on 2026-10-18 05:50
+from __future__ import annotations
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('api', '0039_asset_keyset_indexes'),
+        ('zarr', '0005_remove_zarrarchive_embargoed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(
+                django.db.models.functions.text.Upper('path'), name='api_asset_path_upper'
+            ),
+        ),
+    ]
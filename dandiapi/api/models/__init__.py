@@ -1,20 +1,27 @@
 from __future__ import annotations
 
 from .asset import Asset, AssetBlob, AssetStatus
-from .asset_paths import AssetPath, AssetPathRelation
+from .asset_paths import (
+    AssetPath,
+    AssetPathAggregateDelta,
+    AssetPathIngestCheckpoint,
+    AssetPathRelation,
+)
 from .audit import AuditRecord
 from .dandiset import Dandiset, DandisetStar
 from .garbage_collection import GarbageCollectionEvent, GarbageCollectionEventRecord
 from .stats import ApplicationStats
 from .upload import Upload
 from .user import UserMetadata
-from .version import Version
+from .version import ManifestCheckpoint, Version
 
 __all__ = [
     'ApplicationStats',
     'Asset',
     'AssetBlob',
     'AssetPath',
+    'AssetPathAggregateDelta',
+    'AssetPathIngestCheckpoint',
     'AssetPathRelation',
     'AssetStatus',
     'AuditRecord',
@@ -22,6 +29,7 @@ __all__ = [
     'DandisetStar',
     'GarbageCollectionEvent',
     'GarbageCollectionEventRecord',
+    'ManifestCheckpoint',
     'Upload',
     'UserMetadata',
     'Version',
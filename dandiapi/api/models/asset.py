@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import TYPE_CHECKING
-from urllib.parse import urlparse, urlunparse
+from typing import TYPE_CHECKING, cast
 import uuid
 
 from dandischema.digests.dandietag import DandiETag
 from dandischema.models import AccessType
 from django.conf import settings
-from django.contrib.postgres.indexes import HashIndex
+from django.contrib.postgres.indexes import GinIndex, HashIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.db import models
-from django.db.models import Min, Q
+from django.db.models import Count, Min, Q
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django_extensions.db.models import TimeStampedModel
 
@@ -59,6 +59,9 @@ def validate_asset_path(path: str):
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from dandiapi.storage import DandiS3Storage
     from dandiapi.zarr.models import ZarrArchive
 
 
@@ -97,10 +100,9 @@ class AssetBlob(TimeStampedModel):
 
     @property
     def s3_url(self) -> str:
-        signed_url = self.blob.url
-        # Strip off the query parameters from the presigning, as they are different every time
-        parsed = urlparse(signed_url)
-        return urlunparse((parsed[0], parsed[1], parsed[2], '', '', ''))
+        # Build the URL directly, as presigning it would only add query parameters
+        storage = cast('DandiS3Storage', self.blob.storage)
+        return storage.url(self.blob.name, signed=False)
 
     def __str__(self) -> str:
         return self.blob.name
@@ -120,6 +122,9 @@ class Asset(PublishableMetadataMixin, TimeStampedModel):
         'zarr.ZarrArchive', related_name='assets', on_delete=models.CASCADE, null=True, blank=True
     )
     metadata = models.JSONField(blank=True, default=dict)
+    # The fields of `full_metadata` which are computed from other models, or None if they must be
+    # recomputed. See dandiapi.api.asset_metadata.
+    computed_metadata = models.JSONField(blank=True, null=True, default=None)
     versions = models.ManyToManyField(Version, related_name='assets')
     status = models.CharField(
         max_length=10,
@@ -142,6 +147,21 @@ class Asset(PublishableMetadataMixin, TimeStampedModel):
                 name='%(app_label)s_%(class)s_status_pending',
                 condition=Q(status=AssetStatus.PENDING),
             ),
+            # Assets whose computed metadata must be refreshed are found with this index
+            models.Index(
+                fields=['id'],
+                name='%(app_label)s_%(class)s_computed_pending',
+                condition=Q(computed_metadata__isnull=True),
+            ),
+            # Supports glob patterns which can't be reduced to a literal path prefix
+            GinIndex(fields=['path'], name='api_asset_path_trgm', opclasses=['gin_trgm_ops']),
+            # Support case insensitive prefix matching of the path, i.e. UPPER(path) LIKE 'FOO%'
+            models.Index(Upper('path'), name='api_asset_path_upper'),
+            # Support the row value comparisons of cursor pagination of the asset list
+            *(
+                models.Index(fields=[field, 'id'], name=f'%(app_label)s_%(class)s_{field}_id')
+                for field in ['created', 'modified', 'path']
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -242,7 +262,54 @@ class Asset(PublishableMetadataMixin, TimeStampedModel):
     def dandi_asset_id(asset_id: str | uuid.UUID):
         return f'dandiasset:{asset_id}'
 
-    def access_metadata(self):
+    @classmethod
+    def get_embargo_end_dates(cls, assets: Iterable[Asset]) -> dict[int, datetime.date | None]:
+        """
+        Get the minimum embargo end date of each embargoed blob of these assets, in one query.
+
+        Only assets whose metadata isn't stored are considered. The result can be passed to
+        `access_metadata`, to avoid querying each blob separately.
+        """
+        return cls._get_blob_embargo_end_dates(
+            {
+                asset.blob_id
+                for asset in assets
+                if asset.computed_metadata is None
+                and asset.blob is not None
+                and asset.blob.embargoed
+            }
+        )
+
+    @classmethod
+    def _get_blob_embargo_end_dates(cls, blob_ids: set[int]) -> dict[int, datetime.date | None]:
+        if not blob_ids:
+            return {}
+
+        rows = (
+            cls.objects.filter(blob_id__in=blob_ids)
+            .values('blob_id')
+            .annotate(
+                open_dandisets=Count(
+                    'versions',
+                    filter=Q(versions__dandiset__embargo_status=Dandiset.EmbargoStatus.OPEN),
+                ),
+                embargo_end_date=Min('versions__dandiset__embargo_end_date'),
+            )
+        )
+
+        # Blobs which no saved asset refers to yet have no embargo end date
+        embargo_end_dates: dict[int, datetime.date | None] = dict.fromkeys(blob_ids)
+        for row in rows:
+            # These blobs should only be associated with embargoed dandisets
+            if row['open_dandisets']:
+                raise EmbargoedAssetWithinOpenDandisetError(
+                    'Embargoed asset contained within OPEN dandiset'
+                )
+            embargo_end_dates[row['blob_id']] = row['embargo_end_date']
+
+        return embargo_end_dates
+
+    def access_metadata(self, embargo_end_dates: dict[int, datetime.date | None] | None = None):
         # Default to open access
         embargoed = self.is_embargoed
         access = {
@@ -264,22 +331,9 @@ class Asset(PublishableMetadataMixin, TimeStampedModel):
 
         # In the blob case, we need to consider all dandisets this blob might be associated with,
         # and take the minimum embargo end date
-
-        # This blob should only be associated with embargoed dandisets
-        open_dandisets = self.blob.assets.filter(
-            versions__dandiset__embargo_status=Dandiset.EmbargoStatus.OPEN
-        )
-        if open_dandisets.exists():
-            raise EmbargoedAssetWithinOpenDandisetError(
-                'Embargoed asset contained within OPEN dandiset'
-            )
-
-        # Retrieve the minimum embargo end date, across all dandisets
-        embargo_end_date: datetime.date | None = self.blob.assets.filter(
-            versions__isnull=False
-        ).aggregate(min_embargo_end_date=Min('versions__dandiset__embargo_end_date'))[
-            'min_embargo_end_date'
-        ]
+        if embargo_end_dates is None or self.blob_id not in embargo_end_dates:
+            embargo_end_dates = self._get_blob_embargo_end_dates({self.blob_id})
+        embargo_end_date = embargo_end_dates[self.blob_id]
 
         # The only way embargo_end_date can be None here is if asset isn't associated with any
         # versions (most likely due to being updated). Even so, sometimes these assets are accessed
@@ -290,24 +344,25 @@ class Asset(PublishableMetadataMixin, TimeStampedModel):
 
         return access
 
-    @property
-    def full_metadata(self):
+    def compute_metadata(
+        self, embargo_end_dates: dict[int, datetime.date | None] | None = None
+    ) -> dict:
+        """Compute the fields of `full_metadata` which aren't stored in `metadata`."""
         download_url = settings.DANDI_API_URL + reverse(
             'asset-download',
             kwargs={'asset_id': str(self.asset_id)},
         )
 
         metadata = {
-            **self.metadata,
             'id': self.dandi_asset_id(self.asset_id),
-            'access': [self.access_metadata()],
+            'access': [self.access_metadata(embargo_end_dates)],
             'path': self.path,
             'identifier': str(self.asset_id),
             'contentUrl': [download_url, self.s3_url],
             'contentSize': self.size,
             'digest': self.digest,
         }
-        schema_version = metadata['schemaVersion']
+        schema_version = self.metadata['schemaVersion']
         metadata['@context'] = (
             'https://raw.githubusercontent.com/dandi/schema/master/releases/'
             f'{schema_version}/context.json'
@@ -316,6 +371,23 @@ class Asset(PublishableMetadataMixin, TimeStampedModel):
             metadata['encodingFormat'] = 'application/x-zarr'
         return metadata
 
+    def get_full_metadata(
+        self, embargo_end_dates: dict[int, datetime.date | None] | None = None
+    ) -> dict:
+        """
+        Get the metadata of this asset, including its computed fields.
+
+        When serializing many assets, pass `embargo_end_dates` from `get_embargo_end_dates`.
+        """
+        computed = self.computed_metadata
+        if computed is None:
+            computed = self.compute_metadata(embargo_end_dates)
+        return {**self.metadata, **computed}
+
+    @property
+    def full_metadata(self):
+        return self.get_full_metadata()
+
     def published_metadata(self):
         """Generate the metadata of this asset as if it were being published."""
         now = datetime.datetime.now(datetime.UTC)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from django.db import models
+from django.db.models import Sum
+from django.db.models.functions import Coalesce, Length, Replace
 
 
 class AssetPath(models.Model):
@@ -16,11 +18,26 @@ class AssetPath(models.Model):
     # all paths associated to that version are no longer relevant
     version = models.ForeignKey('Version', related_name='asset_paths', on_delete=models.CASCADE)
 
+    # The number of components in the path, e.g. 'foo/bar.txt' has a depth of 2
+    depth = models.GeneratedField(
+        expression=Length('path') - Length(Replace('path', models.Value('/'))) + 1,
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
+
     # Aggregate fields
     aggregate_files = models.PositiveBigIntegerField(default=0)
     aggregate_size = models.PositiveBigIntegerField(default=0)
 
+    # The sums of uncompacted aggregate deltas, if annotated by `annotate_pending_aggregates`
+    pending_files: int
+    pending_size: int
+
     class Meta:
+        indexes = [
+            # Used to find the children of a path when the closure table is not in use
+            models.Index(fields=['version', 'depth', 'path'], name='version-depth-path'),
+        ]
         constraints = [
             # Disallow slashes at the beginning or end of path
             models.CheckConstraint(
@@ -42,6 +59,35 @@ class AssetPath(models.Model):
     def __str__(self) -> str:
         return self.path
 
+    def refresh_from_db(self, *args, **kwargs) -> None:
+        super().refresh_from_db(*args, **kwargs)
+
+        # Deltas may have been recorded or compacted since the pending totals were fetched
+        self.__dict__.pop('pending_files', None)
+        self.__dict__.pop('pending_size', None)
+
+    def _pending_aggregate(self, field: str) -> int:
+        # Use the values annotated by `annotate_pending_aggregates` if present. Otherwise, fetch
+        # both totals at once and keep them, so that total_files and total_size share a query.
+        if getattr(self, 'pending_files', None) is None:
+            pending = self.aggregate_deltas.aggregate(
+                files=Coalesce(Sum('files'), 0), size=Coalesce(Sum('size'), 0)
+            )
+            self.pending_files = pending['files']
+            self.pending_size = pending['size']
+
+        return getattr(self, f'pending_{field}')
+
+    @property
+    def total_files(self) -> int:
+        """The number of files contained in this path, including any uncompacted deltas."""
+        return self.aggregate_files + self._pending_aggregate('files')
+
+    @property
+    def total_size(self) -> int:
+        """The size of all files contained in this path, including any uncompacted deltas."""
+        return self.aggregate_size + self._pending_aggregate('size')
+
 
 class AssetPathRelation(models.Model):
     # Give related name of child_links, because for any entry with parent=node,
@@ -62,3 +108,30 @@ class AssetPathRelation(models.Model):
 
     def __str__(self) -> str:
         return f'{self.parent} -> {self.child}'
+
+
+class AssetPathAggregateDelta(models.Model):
+    """
+    A change to the aggregate fields of an asset path, which hasn't been applied yet.
+
+    Per-asset operations record these instead of updating their parent paths in place, so that
+    concurrent changes to the same version don't all contend for the same rows. They are
+    periodically folded into `AssetPath.aggregate_files` and `AssetPath.aggregate_size`.
+    """
+
+    path = models.ForeignKey(AssetPath, related_name='aggregate_deltas', on_delete=models.CASCADE)
+    files = models.BigIntegerField()
+    size = models.BigIntegerField()
+
+    def __str__(self) -> str:
+        return f'{self.path}: {self.files:+} files, {self.size:+} bytes'
+
+
+class AssetPathIngestCheckpoint(models.Model):
+    """Records that the `ingest_asset_paths` command has completed the paths of a version."""
+
+    version = models.OneToOneField('Version', related_name='+', on_delete=models.CASCADE)
+    completed = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f'{self.version}: {self.completed}'
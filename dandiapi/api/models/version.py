@@ -11,9 +11,10 @@ from django.contrib.postgres.indexes import HashIndex
 from django.core.validators import RegexValidator
 from django.db import models
 from django.db.models.query_utils import Q
+from django.utils.functional import cached_property
 from django_extensions.db.models import TimeStampedModel
 
-from dandiapi.api.asset_paths import get_root_paths
+from dandiapi.api.asset_paths import get_root_aggregates
 from dandiapi.api.models.metadata import PublishableMetadataMixin
 
 from .dandiset import Dandiset
@@ -75,16 +76,22 @@ class Version(PublishableMetadataMixin, TimeStampedModel):
             HashIndex(fields=['name']),
         ]
 
+    def refresh_from_db(self, *args, **kwargs) -> None:
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop('root_aggregates', None)
+
+    @cached_property
+    def root_aggregates(self) -> tuple[int, int]:
+        # Shared by asset_count and size, so that serializing both only aggregates once
+        return get_root_aggregates(self)
+
     @property
     def asset_count(self):
-        return get_root_paths(self).aggregate(nfiles=models.Sum('aggregate_files'))['nfiles'] or 0
+        return self.root_aggregates[0]
 
     @property
     def size(self):
-        return (
-            get_root_paths(self).aggregate(total_size=models.Sum('aggregate_size'))['total_size']
-            or 0
-        )
+        return self.root_aggregates[1]
 
     @property
     def active_uploads(self):
@@ -279,3 +286,19 @@ class Version(PublishableMetadataMixin, TimeStampedModel):
 
     def __str__(self) -> str:
         return f'{self.dandiset.identifier}/{self.version}'
+
+
+class ManifestCheckpoint(models.Model):
+    """Records what the manifests of a version were last written from."""
+
+    version = models.OneToOneField(
+        Version, related_name='manifest_checkpoint', on_delete=models.CASCADE
+    )
+    # A digest of everything the manifests are written from, see `manifest_fingerprint`
+    fingerprint = models.CharField(max_length=64)
+    # The modification time of the version when the fingerprint was taken
+    version_modified = models.DateTimeField()
+    written = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f'{self.version}: {self.written}'
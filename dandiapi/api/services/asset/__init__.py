@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.utils import timezone
-
-from dandiapi.api.asset_paths import add_asset_paths, delete_asset_paths, get_conflicting_paths
+from rest_framework import status
+
+from dandiapi.api.asset_metadata import invalidate_computed_metadata
+from dandiapi.api.asset_paths import (
+    add_asset_paths,
+    add_asset_paths_many,
+    delete_asset_paths,
+    delete_asset_paths_many,
+    extract_paths,
+    get_conflicting_paths,
+)
 from dandiapi.api.models.asset import Asset, AssetBlob
+from dandiapi.api.models.asset_paths import AssetPath
 from dandiapi.api.models.dandiset import Dandiset
 from dandiapi.api.models.version import Version
 from dandiapi.api.services import audit
@@ -17,10 +29,13 @@ from dandiapi.api.services.asset.exceptions import (
     DraftDandisetNotModifiableError,
     ZarrArchiveBelongsToDifferentDandisetError,
 )
+from dandiapi.api.services.exceptions import DandiError
 from dandiapi.api.services.permissions.dandiset import is_dandiset_owner
 from dandiapi.api.tasks import remove_asset_blob_embargoed_tag_task
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
     from dandiapi.zarr.models import ZarrArchive
 
 
@@ -56,6 +71,11 @@ def _add_asset_to_version(
     zarr_archive: ZarrArchive | None,
     metadata: dict,
 ) -> Asset:
+    # The access metadata of every asset sharing an embargoed blob depends on the dandisets the
+    # blob belongs to, so must be recomputed
+    if asset_blob is not None and asset_blob.embargoed:
+        invalidate_computed_metadata(asset_blob.assets.all())
+
     # Creating an asset in an OPEN dandiset that points to an
     # embargoed blob results in that blob being unembargoed.
     # NOTE: This only applies to asset blobs, as zarrs cannot belong to
@@ -92,6 +112,9 @@ def _remove_asset_from_version(*, asset: Asset, version: Version):
     delete_asset_paths(asset, version)
     version.assets.remove(asset)
 
+    if asset.blob is not None and asset.blob.embargoed:
+        invalidate_computed_metadata(asset.blob.assets.all())
+
     # Trigger a version metadata validation, as saving the version might change the metadata
     Version.objects.filter(id=version.id).update(
         status=Version.Status.PENDING, modified=timezone.now()
@@ -210,3 +233,231 @@ def remove_asset_from_version(*, user, asset: Asset, version: Version) -> Versio
         audit.remove_asset(dandiset=version.dandiset, user=user, asset=asset)
 
     return version
+
+
+def remove_assets_from_version(*, user, version: Version, assets: QuerySet[Asset]) -> int:
+    """
+    Remove many assets from a version at once, returning the number removed.
+
+    This has the same result as calling `remove_asset_from_version` for each asset, but removes
+    them, along with their paths, in a fixed number of queries. The version is marked as pending
+    once.
+    """
+    if not is_dandiset_owner(version.dandiset, user):
+        raise DandisetOwnerRequiredError
+    if version.version != 'draft':
+        raise DraftDandisetNotModifiableError
+
+    with transaction.atomic():
+        # Lock the assets being removed, as the single asset endpoints do
+        asset_ids = list(
+            version.assets.filter(id__in=assets.values('id'))
+            .select_for_update()
+            .values_list('id', flat=True)
+        )
+        if not asset_ids:
+            return 0
+        removed = list(Asset.objects.filter(id__in=asset_ids).select_related('blob'))
+
+        delete_asset_paths_many(removed, version)
+        Asset.versions.through.objects.filter(version=version, asset_id__in=asset_ids).delete()
+
+        embargoed_blob_ids = {
+            asset.blob_id for asset in removed if asset.blob is not None and asset.blob.embargoed
+        }
+        if embargoed_blob_ids:
+            invalidate_computed_metadata(Asset.objects.filter(blob__in=embargoed_blob_ids))
+
+        # Trigger a version metadata validation, as saving the version might change the metadata
+        Version.objects.filter(id=version.id).update(
+            status=Version.Status.PENDING, modified=timezone.now()
+        )
+
+        audit.remove_assets(dandiset=version.dandiset, user=user, assets=removed)
+
+    return len(removed)
+
+
+@dataclass
+class AssetBatchItem:
+    """An asset to add to a version, or the new state of `asset` if it's given."""
+
+    metadata: dict
+    asset_blob: AssetBlob | None = None
+    zarr_archive: ZarrArchive | None = None
+    asset: Asset | None = None
+
+
+def _validate_batch_item(item: AssetBatchItem, version: Version) -> Asset | DandiError:
+    """
+    Return the asset an item would create, or the reason it can't be created.
+
+    If the item doesn't change its asset, that asset is returned instead.
+    """
+    metadata = Asset.strip_metadata(item.metadata)
+    if item.asset is not None and not item.asset.is_different_from(
+        asset_blob=item.asset_blob,
+        zarr_archive=item.zarr_archive,
+        metadata=metadata,
+        path=item.metadata['path'],
+    ):
+        return item.asset
+
+    if item.zarr_archive and item.zarr_archive.dandiset_id != version.dandiset_id:
+        return ZarrArchiveBelongsToDifferentDandisetError()
+
+    asset = Asset(
+        path=item.metadata['path'],
+        blob=item.asset_blob,
+        zarr=item.zarr_archive,
+        metadata=metadata,
+        status=Asset.Status.PENDING,
+    )
+    try:
+        # Asset IDs are generated, so they don't need to be checked for uniqueness
+        asset.full_clean(validate_unique=False, validate_constraints=False)
+    except ValidationError as e:
+        return DandiError(' '.join(e.messages), status.HTTP_400_BAD_REQUEST)
+
+    return asset
+
+
+def _check_batch_paths(
+    version: Version, items: list[AssetBatchItem], results: list[Asset | DandiError]
+):
+    """Replace each new asset in `results` whose path conflicts with another by an error."""
+    pending = [
+        (i, item, result)
+        for i, (item, result) in enumerate(zip(items, results, strict=True))
+        if isinstance(result, Asset) and result is not item.asset
+    ]
+
+    # Fetch every existing path that any new asset could conflict with at once
+    nodes = {node for _, _, asset in pending for node in extract_paths(asset.path)}
+    existing: dict[str, int | None] = dict(
+        AssetPath.objects.filter(version=version, path__in=nodes).values_list('path', 'asset_id')
+    )
+
+    # Check each new asset against the existing paths, and the new paths accepted before it
+    accepted_files: set[str] = set()
+    accepted_folders: set[str] = set()
+    for i, item, asset in pending:
+        # Only the asset being changed by an item is known to be gone by the time it's added
+        freed = {None, item.asset.id if item.asset is not None else None}
+        path = asset.path
+        folders = extract_paths(path)[:-1]
+        if path in accepted_files or existing.get(path) not in freed:
+            results[i] = AssetAlreadyExistsError()
+        elif path in accepted_folders:
+            results[i] = AssetPathConflictError(
+                new_path=path,
+                existing_paths=sorted(p for p in accepted_files if p.startswith(f'{path}/')),
+            )
+        elif path in existing and existing[path] is None:
+            results[i] = AssetPathConflictError(
+                new_path=path, existing_paths=get_conflicting_paths(path, version)
+            )
+        elif conflicts := [
+            folder
+            for folder in folders
+            if folder in accepted_files or existing.get(folder) not in freed
+        ]:
+            results[i] = AssetPathConflictError(new_path=path, existing_paths=conflicts)
+        else:
+            accepted_files.add(path)
+            accepted_folders.update(folders)
+
+
+def add_or_change_assets(
+    *, user, version: Version, items: list[AssetBatchItem]
+) -> list[Asset | DandiError]:
+    """
+    Add or change many assets of a version at once, returning the outcome of each item in order.
+
+    Items are checked against the version and each other as a set, and an item which fails is
+    returned as an error without affecting the others. Items which don't change their asset
+    return it as is. All other assets are created, along with their paths and audit records, in a
+    single transaction, which marks the version as pending once.
+    """
+    if not is_dandiset_owner(version.dandiset, user):
+        raise DandisetOwnerRequiredError
+    if version.version != 'draft':
+        raise DraftDandisetNotModifiableError
+
+    with transaction.atomic():
+        # Lock the assets being changed, as change_asset does
+        list(
+            version.assets.select_for_update()
+            .filter(id__in=[item.asset.id for item in items if item.asset is not None])
+            .values_list('id', flat=True)
+        )
+
+        results = [_validate_batch_item(item, version) for item in items]
+        _check_batch_paths(version, items, results)
+
+        accepted = [
+            (item, result)
+            for item, result in zip(items, results, strict=True)
+            if isinstance(result, Asset) and result is not item.asset
+        ]
+        if not accepted:
+            return results
+
+        created = [asset for item, asset in accepted if item.asset is None]
+        changed = [asset for item, asset in accepted if item.asset is not None]
+        _write_asset_batch(
+            version=version,
+            new_assets=[*created, *changed],
+            replaced=[item.asset for item, _ in accepted if item.asset is not None],
+        )
+        if created:
+            audit.add_assets(dandiset=version.dandiset, user=user, assets=created)
+        if changed:
+            audit.update_assets(dandiset=version.dandiset, user=user, assets=changed)
+
+    return results
+
+
+def _write_asset_batch(*, version: Version, new_assets: list[Asset], replaced: list[Asset]):
+    """Replace assets of a version with new ones, as the single asset services do for each."""
+    delete_asset_paths_many(replaced, version)
+    version.assets.remove(*replaced)
+
+    # The access metadata of every asset sharing an embargoed blob depends on the dandisets the
+    # blob belongs to, so must be recomputed
+    embargoed_blob_ids = {
+        asset.blob_id
+        for asset in [*replaced, *new_assets]
+        if asset.blob is not None and asset.blob.embargoed
+    }
+    if embargoed_blob_ids:
+        invalidate_computed_metadata(Asset.objects.filter(blob__in=embargoed_blob_ids))
+
+    # Adding embargoed blobs to an OPEN dandiset unembargoes them, as in _add_asset_to_version
+    unembargoed_blobs = [
+        blob for asset in new_assets if (blob := asset.blob) is not None and blob.embargoed
+    ]
+    if unembargoed_blobs and version.dandiset.embargo_status == Dandiset.EmbargoStatus.OPEN:
+        AssetBlob.objects.filter(id__in=[blob.id for blob in unembargoed_blobs]).update(
+            embargoed=False
+        )
+        for blob in unembargoed_blobs:
+            blob.embargoed = False
+        blob_ids = {blob.blob_id for blob in unembargoed_blobs}
+
+        def remove_embargoed_tags():
+            for blob_id in blob_ids:
+                remove_asset_blob_embargoed_tag_task.delay(blob_id=blob_id)
+
+        transaction.on_commit(remove_embargoed_tags)
+
+    Asset.objects.bulk_create(new_assets)
+    Asset.versions.through.objects.bulk_create(
+        [Asset.versions.through(asset_id=asset.id, version_id=version.id) for asset in new_assets]
+    )
+    add_asset_paths_many(new_assets, version)
+
+    # Trigger a version metadata validation, as saving the version might change the metadata
+    Version.objects.filter(id=version.id).update(
+        status=Version.Status.PENDING, modified=timezone.now()
+    )
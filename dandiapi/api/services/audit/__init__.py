@@ -23,22 +23,44 @@ def _make_audit_record(
     admin: bool = False,
     description: str = '',
 ) -> AuditRecord:
-    if not admin and user is None:
-        raise ValueError('Non-null `user` required when `admin` is False')
-
-    audit_record = AuditRecord(
-        dandiset_id=dandiset.id,
-        username=user.username if user else '',
-        user_email=user.email if user else '',
-        user_fullname=f'{user.first_name} {user.last_name}' if user else '',
+    return _make_audit_records(
+        dandiset=dandiset,
+        user=user,
         record_type=record_type,
-        details=details,
+        details_list=[details],
         admin=admin,
         description=description,
-    )
-    audit_record.save()
+    )[0]
 
-    return audit_record
+
+def _make_audit_records(
+    *,
+    dandiset: Dandiset,
+    user: User | None,
+    record_type: AuditRecordType,
+    details_list: list[dict],
+    admin: bool = False,
+    description: str = '',
+) -> list[AuditRecord]:
+    """Create an audit record of the same type for each of the given details, all at once."""
+    if not admin and user is None:
+        raise ValueError('Non-null `user` required when `admin` is False')
+
+    return AuditRecord.objects.bulk_create(
+        [
+            AuditRecord(
+                dandiset_id=dandiset.id,
+                username=user.username if user else '',
+                user_email=user.email if user else '',
+                user_fullname=f'{user.first_name} {user.last_name}' if user else '',
+                record_type=record_type,
+                details=details,
+                admin=admin,
+                description=description,
+            )
+            for details in details_list
+        ]
+    )
 
 
 def create_dandiset(
@@ -164,6 +186,44 @@ def update_asset(
     )
 
 
+def add_assets(
+    *,
+    dandiset: Dandiset,
+    user: User | None,
+    assets: list[Asset],
+    admin: bool = False,
+    description: str = '',
+) -> list[AuditRecord]:
+    """Record the addition of many assets at once, as `add_asset` does for each."""
+    return _make_audit_records(
+        dandiset=dandiset,
+        user=user,
+        record_type='add_asset',
+        details_list=[_asset_details(asset) for asset in assets],
+        admin=admin,
+        description=description,
+    )
+
+
+def update_assets(
+    *,
+    dandiset: Dandiset,
+    user: User | None,
+    assets: list[Asset],
+    admin: bool = False,
+    description: str = '',
+) -> list[AuditRecord]:
+    """Record the update of many assets at once, as `update_asset` does for each."""
+    return _make_audit_records(
+        dandiset=dandiset,
+        user=user,
+        record_type='update_asset',
+        details_list=[_asset_details(asset) for asset in assets],
+        admin=admin,
+        description=description,
+    )
+
+
 def remove_asset(
     *,
     dandiset: Dandiset,
@@ -186,6 +246,25 @@ def remove_asset(
     )
 
 
+def remove_assets(
+    *,
+    dandiset: Dandiset,
+    user: User | None,
+    assets: list[Asset],
+    admin: bool = False,
+    description: str = '',
+) -> list[AuditRecord]:
+    """Record the removal of many assets at once, as `remove_asset` does for each."""
+    return _make_audit_records(
+        dandiset=dandiset,
+        user=user,
+        record_type='remove_asset',
+        details_list=[{'path': asset.path, 'asset_id': str(asset.asset_id)} for asset in assets],
+        admin=admin,
+        description=description,
+    )
+
+
 def create_zarr(
     *,
     dandiset: Dandiset,
@@ -4,8 +4,10 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from dandiapi.api.asset_metadata import invalidate_computed_metadata
 from dandiapi.api.mail import send_dandiset_unembargoed_message
 from dandiapi.api.models import AssetBlob, Dandiset, Version
 from dandiapi.api.models.asset import Asset
@@ -48,6 +50,14 @@ def unembargo_dandiset(ds: Dandiset, user: User):
     logger.info('Removing tags...')
     remove_dandiset_embargo_tags(ds)
 
+    # The access metadata of these assets, and any others sharing their blobs, will change
+    invalidate_computed_metadata(
+        Asset.objects.filter(
+            Q(versions__dandiset=ds)
+            | Q(blob__in=AssetBlob.objects.filter(embargoed=True, assets__versions__dandiset=ds))
+        )
+    )
+
     # Set all assets to pending
     updated_assets = Asset.objects.filter(versions__dandiset=ds).update(status=Asset.Status.PENDING)
     # Update embargoed flag on asset blobs
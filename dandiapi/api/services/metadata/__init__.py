@@ -11,6 +11,7 @@ from django.db import transaction
 from django.db.models.query_utils import Q
 from django.utils import timezone
 
+from dandiapi.api.asset_metadata import iter_full_metadata
 from dandiapi.api.models import Asset, Version
 from dandiapi.api.services.metadata.exceptions import (
     AssetHasBeenPublishedError,
@@ -95,10 +96,11 @@ def version_aggregate_assets_summary(version: Version) -> None:
         raise VersionHasBeenPublishedError
 
     assets_summary = aggregate_assets_summary(
-        asset.full_metadata
-        for asset in version.assets.filter(status=Asset.Status.VALID)
-        .select_related('blob', 'zarr', 'zarr__dandiset')
-        .iterator()
+        iter_full_metadata(
+            version.assets.filter(status=Asset.Status.VALID).select_related(
+                'blob', 'zarr', 'zarr__dandiset'
+            )
+        )
     )
 
     updated_metadata = {**version.metadata, 'assetsSummary': assets_summary}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 import typing
 
 from django.contrib.auth.models import AnonymousUser, User
@@ -73,6 +74,60 @@ def is_owned_asset(asset: Asset, user: AbstractBaseUser | AnonymousUser) -> bool
     return asset_dandisets_owned_by_user.exists()
 
 
+def get_owned_assets(
+    assets: QuerySet[Asset], user: AbstractBaseUser | AnonymousUser
+) -> QuerySet[Asset]:
+    """Filter `assets` to those which belong to a dandiset that the user is an owner of."""
+    if user.is_anonymous:
+        return assets.none()
+
+    user = typing.cast('User', user)
+    owned_dandisets = DandisetUserObjectPermission.objects.filter(
+        user=user, permission__codename='owner'
+    ).values('content_object_id')
+
+    return assets.filter(versions__dandiset__in=owned_dandisets).distinct()
+
+
+class OwnershipCache:
+    """
+    Answer repeated ownership checks of one user, such as those made while handling a request.
+
+    The IDs of the dandisets owned by the user are fetched once, on the first check. The cache
+    should not outlive the request, as ownership changes are not reflected in it.
+    """
+
+    def __init__(self, user: AbstractBaseUser | AnonymousUser):
+        self.user = user
+
+    @cached_property
+    def owned_dandiset_ids(self) -> frozenset[int]:
+        if self.user.is_anonymous or not self.user.is_active:
+            return frozenset()
+
+        return frozenset(
+            DandisetUserObjectPermission.objects.filter(
+                user=self.user, permission__codename='owner'
+            ).values_list('content_object_id', flat=True)
+        )
+
+    def is_dandiset_owner(self, dandiset: Dandiset) -> bool:
+        """Return `True` if the user owns the dandiset, as `is_dandiset_owner` does."""
+        # Active superusers have every permission, including ownership of every dandiset
+        user = typing.cast('User', self.user)
+        if not user.is_anonymous and user.is_active and user.is_superuser:
+            return True
+
+        return dandiset.pk in self.owned_dandiset_ids
+
+    def is_owned_asset(self, asset: Asset) -> bool:
+        """Return `True` if the asset belongs to a dandiset that the user is an owner of."""
+        if not self.owned_dandiset_ids:
+            return False
+
+        return asset.versions.filter(dandiset_id__in=self.owned_dandiset_ids).exists()
+
+
 def get_owned_dandisets(
     user: AbstractBaseUser | AnonymousUser,
     include_superusers=True,  # noqa: FBT002
@@ -11,7 +11,7 @@ from django.db import transaction
 from more_itertools import ichunked
 
 from dandiapi.api import doi
-from dandiapi.api.asset_paths import add_version_asset_paths
+from dandiapi.api.asset_paths import add_version_asset_paths, clone_version_asset_paths
 from dandiapi.api.models import Asset, Dandiset, Version
 from dandiapi.api.services import audit
 from dandiapi.api.services.exceptions import NotAllowedError
@@ -176,8 +176,17 @@ def _publish_dandiset(dandiset_id: int, user_id: int) -> None:
         )
         new_version.save()
 
-        # Add asset paths with new version
-        add_version_asset_paths(version=new_version)
+        # Copy the asset paths of the draft to the new version, since both now contain the same
+        # assets. If the draft's leaf paths don't match its assets, build them from scratch.
+        draft_leaves = old_version.asset_paths.filter(asset__isnull=False)
+        if (
+            draft_leaves.count()
+            == draft_leaves.filter(asset__in=old_version.assets.all()).count()
+            == old_version.assets.count()
+        ):
+            clone_version_asset_paths(source=old_version, target=new_version)
+        else:
+            add_version_asset_paths(version=new_version)
 
         # Copy the finalized assetsSummary to the draft version in case it wasn't up to date
         # before starting the publish.
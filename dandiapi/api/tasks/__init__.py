@@ -6,17 +6,33 @@ from celery import shared_task
 from celery.exceptions import SoftTimeLimitExceeded
 from celery.utils.log import get_task_logger
 from django.contrib.auth.models import User
-
+from django.db import OperationalError, transaction
+import psycopg.errors
+
+from dandiapi.api.asset_metadata import invalidate_computed_metadata
+from dandiapi.api.asset_paths import (
+    add_version_asset_paths,
+    compact_asset_path_aggregates,
+    find_asset_path_drift,
+    prune_empty_asset_paths,
+    rebuild_version_asset_paths,
+    repair_asset_path_aggregates,
+)
 from dandiapi.api.doi import delete_doi
 from dandiapi.api.mail import send_dandiset_unembargo_failed_message
 from dandiapi.api.manifests import (
-    write_assets_jsonld,
-    write_assets_yaml,
-    write_collection_jsonld,
+    manifest_fingerprint,
+    write_asset_manifests,
     write_dandiset_jsonld,
     write_dandiset_yaml,
 )
-from dandiapi.api.models import Asset, AssetBlob, Version
+from dandiapi.api.models import (
+    Asset,
+    AssetBlob,
+    AssetPathIngestCheckpoint,
+    ManifestCheckpoint,
+    Version,
+)
 from dandiapi.api.models.dandiset import Dandiset
 
 if TYPE_CHECKING:
@@ -47,19 +63,94 @@ def calculate_sha256(blob_id: str | UUID) -> None:
 
     # TODO: Run dandi-cli validation
 
-    AssetBlob.objects.filter(blob_id=blob_id).update(sha256=sha256)
+    with transaction.atomic():
+        AssetBlob.objects.filter(blob_id=blob_id).update(sha256=sha256)
+        invalidate_computed_metadata(Asset.objects.filter(blob__blob_id=blob_id))
 
 
 @shared_task(soft_time_limit=180)
-def write_manifest_files(version_id: int) -> None:
-    version: Version = Version.objects.get(id=version_id)
-    logger.info('Writing manifests for version %s:%s', version.dandiset.identifier, version.version)
+def write_manifest_files(version_id: int, *, force: bool = False) -> None:
+    version: Version = Version.objects.select_related('dandiset').get(id=version_id)
+
+    # The fingerprint is taken after the modification time is read, so that any change made while
+    # writing is picked up by the next check of the version
+    fingerprint = manifest_fingerprint(version)
+    checkpoint = ManifestCheckpoint.objects.filter(version=version).first()
+    if not force and checkpoint is not None and checkpoint.fingerprint == fingerprint:
+        logger.info(
+            'Manifests for version %s:%s are unchanged',
+            version.dandiset.identifier,
+            version.version,
+        )
+        ManifestCheckpoint.objects.filter(
+            version=version, version_modified__lt=version.modified
+        ).update(version_modified=version.modified)
+        return
 
+    logger.info('Writing manifests for version %s:%s', version.dandiset.identifier, version.version)
     write_dandiset_yaml(version)
-    write_assets_yaml(version)
     write_dandiset_jsonld(version)
-    write_assets_jsonld(version)
-    write_collection_jsonld(version)
+    write_asset_manifests(version)
+
+    ManifestCheckpoint.objects.update_or_create(
+        version=version,
+        defaults={'fingerprint': fingerprint, 'version_modified': version.modified},
+    )
+
+
+@shared_task(bind=True, soft_time_limit=60, max_retries=3, retry_backoff=True)
+def compact_asset_path_aggregates_task(self, version_id: int) -> None:
+    version: Version = Version.objects.get(id=version_id)
+    try:
+        compact_asset_path_aggregates(version)
+    except OperationalError as e:
+        if isinstance(e.__cause__, psycopg.errors.DeadlockDetected):
+            raise self.retry(exc=e) from e
+        raise
+
+
+@shared_task(bind=True, soft_time_limit=300, max_retries=3, retry_backoff=True)
+def prune_empty_asset_paths_task(self, version_id: int) -> None:
+    version: Version = Version.objects.get(id=version_id)
+    try:
+        deleted = prune_empty_asset_paths(version)
+    except OperationalError as e:
+        if isinstance(e.__cause__, psycopg.errors.DeadlockDetected):
+            raise self.retry(exc=e) from e
+        raise
+
+    if deleted:
+        logger.info('Pruned %s empty asset paths from version %s', deleted, version)
+
+
+@shared_task(soft_time_limit=3600)
+def ingest_version_asset_paths_task(version_id: int, *, rebuild: bool = False) -> None:
+    version: Version = Version.objects.get(id=version_id)
+
+    # Record the checkpoint in the same transaction, so that it only exists if ingestion succeeded
+    with transaction.atomic():
+        if rebuild:
+            rebuild_version_asset_paths(version)
+        else:
+            add_version_asset_paths(version)
+        AssetPathIngestCheckpoint.objects.update_or_create(version=version)
+
+
+@shared_task(soft_time_limit=600)
+def verify_asset_paths_task(version_id: int, *, repair: bool = False) -> None:
+    version: Version = Version.objects.get(id=version_id)
+    drift = repair_asset_path_aggregates(version) if repair else find_asset_path_drift(version)
+    for d in drift:
+        logger.warning(
+            'Asset path %s of version %s has %s files (%s bytes), expected %s files (%s bytes)%s',
+            d.path,
+            version,
+            d.files,
+            d.size,
+            d.expected_files,
+            d.expected_size,
+            ', repaired' if repair else '',
+        )
 
 
 @shared_task(soft_time_limit=10)
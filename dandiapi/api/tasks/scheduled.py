@@ -17,10 +17,13 @@ from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import connection
+from django.db.models import F
 from django.db.models.query_utils import Q
+from django.utils import timezone
 
+from dandiapi.api.asset_metadata import refresh_computed_metadata
 from dandiapi.api.mail import send_pending_users_message
-from dandiapi.api.models import UserMetadata, Version
+from dandiapi.api.models import AssetPath, AssetPathAggregateDelta, UserMetadata, Version
 from dandiapi.api.models.asset import Asset
 from dandiapi.api.models.dandiset import Dandiset
 from dandiapi.api.models.stats import ApplicationStats
@@ -28,8 +31,11 @@ from dandiapi.api.services.garbage_collection import garbage_collect
 from dandiapi.api.services.metadata import version_aggregate_assets_summary
 from dandiapi.api.services.metadata.exceptions import VersionMetadataConcurrentlyModifiedError
 from dandiapi.api.tasks import (
+    compact_asset_path_aggregates_task,
+    prune_empty_asset_paths_task,
     validate_asset_metadata_task,
     validate_version_metadata_task,
+    verify_asset_paths_task,
     write_manifest_files,
 )
 from dandiapi.zarr.models import ZarrArchiveStatus
@@ -101,14 +107,76 @@ def validate_draft_version_metadata():
         for draft_version_id in pending_draft_versions.iterator():
             validate_version_metadata_task.delay(draft_version_id)
             aggregate_assets_summary_task.delay(draft_version_id)
-
-            # Revalidation should be triggered every time a version is modified,
-            # so now is a good time to write out the manifests as well.
-            write_manifest_files.delay(draft_version_id)
     else:
         logger.debug('Found no versions to validate')
 
 
+@shared_task(soft_time_limit=20)
+def write_modified_manifests():
+    # Only versions modified since their manifests were last checked are considered, once they
+    # have gone unmodified for long enough, or have waited too long to be written regardless. A
+    # version never written has waited since it was created. Each write then skips versions whose
+    # manifests would be unchanged.
+    now = timezone.now()
+    settled = now - timedelta(seconds=settings.DANDI_MANIFEST_DEBOUNCE)
+    overdue = now - timedelta(seconds=settings.DANDI_MANIFEST_MAX_DELAY)
+    modified_draft_versions = (
+        Version.objects.filter(version='draft')
+        .filter(
+            Q(manifest_checkpoint__isnull=True)
+            | Q(modified__gt=F('manifest_checkpoint__version_modified'))
+        )
+        .filter(
+            Q(modified__lte=settled)
+            | Q(manifest_checkpoint__written__lte=overdue)
+            | Q(manifest_checkpoint__isnull=True, created__lte=overdue)
+        )
+        .order_by('modified')
+        .values_list('id', flat=True)
+    )
+    # Limit the versions enqueued by each run, leaving any remaining for the next one
+    for version_id in throttled_iterator(modified_draft_versions[:1000].iterator()):
+        write_manifest_files.delay(version_id)
+
+
+@shared_task(soft_time_limit=20)
+def compact_pending_asset_path_aggregates():
+    # Select only the id of versions that have any uncompacted aggregate deltas
+    pending_version_ids = AssetPathAggregateDelta.objects.values_list(
+        'path__version_id', flat=True
+    ).distinct()
+    for version_id in pending_version_ids.iterator():
+        compact_asset_path_aggregates_task.delay(version_id)
+
+
+@shared_task(soft_time_limit=50)
+def refresh_computed_asset_metadata():
+    # Limit the assets refreshed by each run, leaving any remaining for the next one
+    refreshed = refresh_computed_metadata(limit=20_000)
+    if refreshed:
+        logger.info('Refreshed the computed metadata of %s assets', refreshed)
+
+
+@shared_task(soft_time_limit=60)
+def sweep_empty_asset_paths():
+    # Once compacted, only paths that contain no files have no aggregate files, so any version
+    # without such paths can be skipped. Each remaining version is then swept separately.
+    version_ids = (
+        AssetPath.objects.filter(aggregate_files__lte=0)
+        .values_list('version_id', flat=True)
+        .distinct()
+    )
+    for version_id in version_ids.iterator():
+        prune_empty_asset_paths_task.delay(version_id)
+
+
+@shared_task(soft_time_limit=60)
+def verify_all_asset_paths():
+    # Each version is verified in its own task, so that no lock is held for more than one version
+    for version_id in Version.objects.values_list('id', flat=True).iterator():
+        verify_asset_paths_task.delay(version_id, repair=settings.DANDI_ASSET_PATH_REPAIR)
+
+
 @shared_task(soft_time_limit=20)
 def send_pending_users_email() -> None:
     """Send an email to admins listing users with status set to PENDING."""
@@ -174,6 +242,30 @@ def register_scheduled_tasks(sender: Celery, **kwargs):
         validate_pending_asset_metadata.s(),
     )
 
+    # Rewrite the manifests of any draft versions which have settled after being modified
+    sender.add_periodic_task(
+        timedelta(seconds=settings.DANDI_VALIDATION_JOB_INTERVAL),
+        write_modified_manifests.s(),
+    )
+
+    # Fold the aggregate deltas recorded by asset changes into their asset paths every minute
+    sender.add_periodic_task(
+        timedelta(seconds=settings.DANDI_VALIDATION_JOB_INTERVAL),
+        compact_pending_asset_path_aggregates.s(),
+    )
+
+    # Store the computed metadata of any new or changed assets every minute
+    sender.add_periodic_task(
+        timedelta(seconds=settings.DANDI_VALIDATION_JOB_INTERVAL),
+        refresh_computed_asset_metadata.s(),
+    )
+
+    # Clean up any asset paths left empty by concurrent asset deletions every hour
+    sender.add_periodic_task(timedelta(hours=1), sweep_empty_asset_paths.s())
+
+    # Verify the aggregates of all asset paths once a day
+    sender.add_periodic_task(crontab(hour=3, minute=0), verify_all_asset_paths.s())
+
     # Send daily email to admins containing a list of users awaiting approval
     sender.add_periodic_task(crontab(hour=0, minute=0), send_pending_users_email.s())
 
@@ -7,11 +7,12 @@ from dandischema.consts import DANDI_SCHEMA_VERSION
 from dandischema.models import AccessType
 from django.conf import settings
 from django.db.utils import IntegrityError
-from django.urls import reverse
+from django.urls import resolve, reverse
 import pytest
 import requests
 
-from dandiapi.api.asset_paths import add_asset_paths, extract_paths
+from dandiapi.api.asset_metadata import refresh_computed_metadata
+from dandiapi.api.asset_paths import add_asset_paths, extract_paths, find_asset_path_drift
 from dandiapi.api.models import Asset, Version
 from dandiapi.api.models.asset_paths import AssetPath
 from dandiapi.api.models.dandiset import Dandiset
@@ -25,6 +26,8 @@ from dandiapi.api.tests.factories import (
     PublishedVersionFactory,
     UserFactory,
 )
+from dandiapi.api.views.asset import compile_glob
+from dandiapi.storage import DandiS3Storage, _TTLCache
 from dandiapi.zarr.models import ZarrArchiveStatus
 from dandiapi.zarr.tasks import ingest_zarr_archive
 from dandiapi.zarr.tests.factories import ZarrArchiveFactory
@@ -84,6 +87,136 @@ def test_asset_rest_path(api_client, asset_factory):
     assert val['aggregate_files'] == 1
 
 
+@pytest.mark.django_db
+def test_asset_rest_path_after(api_client, asset_factory):
+    version: Version = DraftVersionFactory.create()
+    for path in ['foo/a.txt', 'foo/b.txt', 'foo/c.txt', 'foo/d.txt']:
+        asset = asset_factory(path=path)
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+
+    # Page through the children of a folder using the last path of each page as the cursor
+    url = f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/paths/'
+    resp = api_client.get(url, {'path_prefix': 'foo', 'after': '', 'page_size': 3}).json()
+    assert [val['path'] for val in resp['results']] == ['foo/a.txt', 'foo/b.txt', 'foo/c.txt']
+    assert resp['count'] is None
+    assert 'after=foo%2Fc.txt' in resp['next']
+
+    resp = api_client.get(url, {'path_prefix': 'foo', 'after': 'foo/c.txt', 'page_size': 3}).json()
+    assert [val['path'] for val in resp['results']] == ['foo/d.txt']
+    assert resp['next'] is None
+
+
+@pytest.mark.django_db
+def test_asset_rest_paths_tree(api_client, asset_factory):
+    version: Version = DraftVersionFactory.create()
+    assets = {}
+    for path in ['foo/a.txt', 'foo/bar/b.txt', 'foo/bar/baz/c.txt', 'other.txt']:
+        assets[path] = asset_factory(path=path)
+        version.assets.add(assets[path])
+        add_asset_paths(assets[path], version)
+
+    url = (
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}'
+        '/assets/paths/tree/'
+    )
+    resp = api_client.get(url, {'path_prefix': 'foo/'})
+    assert resp.status_code == 200
+    assert resp['Content-Type'] == 'application/x-ndjson'
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert lines == [
+        {
+            'path': path,
+            'asset_id': str(assets[path].asset_id),
+            'size': assets[path].size,
+            'digest': assets[path].digest,
+        }
+        for path in ['foo/a.txt', 'foo/bar/b.txt', 'foo/bar/baz/c.txt']
+    ]
+
+    # Resume from a path
+    resp = api_client.get(url, {'path_prefix': 'foo', 'after': 'foo/bar/b.txt'})
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert [line['path'] for line in lines] == ['foo/bar/baz/c.txt']
+
+    # Stream an entire version
+    resp = api_client.get(url)
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert len(lines) == 4
+
+    resp = api_client.get(url, {'path_prefix': 'foo/a.txt'})
+    assert resp.status_code == 404
+
+
+@pytest.mark.django_db
+def test_asset_rest_paths_tree_time_limit(api_client, asset_factory, monkeypatch):
+    version: Version = DraftVersionFactory.create()
+    for path in ['foo/a.txt', 'foo/b.txt']:
+        asset = asset_factory(path=path)
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+    monkeypatch.setattr('dandiapi.api.views.asset.SUBTREE_STREAM_TIME_LIMIT', -1)
+
+    url = (
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}'
+        '/assets/paths/tree/'
+    )
+    resp = api_client.get(url, {'path_prefix': 'foo'})
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert [line.get('path') for line in lines] == ['foo/a.txt', None]
+    assert lines[-1]['next'] == f'http://testserver{url}?after=foo%2Fa.txt&path_prefix=foo'
+
+    resp = api_client.get(lines[-1]['next'])
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert lines[0]['path'] == 'foo/b.txt'
+
+
+@pytest.mark.django_db
+def test_asset_rest_metadata_stream(api_client, version, asset_factory):
+    assets = [asset_factory(path=path) for path in ['b.txt', 'a/b.txt', 'c.txt']]
+    version.assets.add(*assets)
+
+    url = (
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/metadata/'
+    )
+    resp = api_client.get(url)
+    assert resp.status_code == 200
+    assert resp['Content-Type'] == 'application/x-ndjson'
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert lines == [asset.full_metadata for asset in sorted(assets, key=lambda asset: asset.path)]
+
+    # Resume from a path
+    resp = api_client.get(url, {'after': 'b.txt'})
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert [line['path'] for line in lines] == ['c.txt']
+
+
+def test_asset_rest_metadata_routes():
+    # The metadata stream of a version isn't shadowed by fetching the metadata of assets by ID
+    nested = resolve('/api/dandisets/000001/versions/draft/assets/metadata/').func
+    assert nested.actions['get'] == 'metadata_stream'
+    assert resolve('/api/assets/metadata/').func.actions['post'] == 'metadata_batch'
+
+
+@pytest.mark.django_db
+def test_asset_rest_metadata_stream_time_limit(api_client, version, asset_factory, monkeypatch):
+    version.assets.add(*[asset_factory(path=path) for path in ['a.txt', 'b.txt']])
+    monkeypatch.setattr('dandiapi.api.views.asset.ASSET_METADATA_STREAM_CHUNK_SIZE', 1)
+    monkeypatch.setattr('dandiapi.api.views.asset.ASSET_METADATA_STREAM_TIME_LIMIT', -1)
+
+    url = (
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/metadata/'
+    )
+    resp = api_client.get(url)
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert [line.get('path') for line in lines] == ['a.txt', None]
+    assert lines[-1]['next'] == f'http://testserver{url}?after=a.txt'
+
+    resp = api_client.get(lines[-1]['next'])
+    lines = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+    assert lines[0]['path'] == 'b.txt'
+
+
 @pytest.mark.django_db
 def test_asset_rest_path_not_found(api_client, asset_factory):
     # Initialize version and contained assets
@@ -103,6 +236,22 @@ def test_asset_rest_path_not_found(api_client, asset_factory):
     assert resp.json() == {'detail': 'Specified path not found.'}
 
 
+def test_storage_url_unsigned_matches_presigned():
+    storage = DandiS3Storage(
+        bucket_name='dandiarchive',
+        region_name='us-east-2',
+        endpoint_url=None,
+        access_key='access',
+        secret_key='secret',
+    )
+    name = 'blobs/abc/def/a b.txt'
+    assert storage.url(name, signed=False) == storage.url(name).split('?')[0]
+    assert (
+        storage.url(name, signed=False)
+        == 'https://dandiarchive.s3.amazonaws.com/blobs/abc/def/a%20b.txt'
+    )
+
+
 @pytest.mark.django_db
 def test_asset_s3_url(asset_blob):
     signed_url = asset_blob.blob.url
@@ -402,6 +551,49 @@ def test_asset_rest_list_ordering(api_client, version, asset_factory, order_para
     assert result_paths == ordering
 
 
+@pytest.mark.parametrize('order_param', ['created', '-created', 'path', '-path'])
+@pytest.mark.django_db
+def test_asset_rest_list_cursor(api_client, version, asset_factory, order_param):
+    for path in ['b', 'e', 'a', 'd', 'c']:
+        version.assets.add(asset_factory(path=path))
+
+    url = f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/'
+    expected = api_client.get(url, {'order': order_param}).json()['results']
+
+    # Walk the listing by following the `next` link of each page
+    results = []
+    resp = api_client.get(url, {'order': order_param, 'cursor': '', 'page_size': 2}).json()
+    while True:
+        assert resp['count'] is None
+        assert len(resp['results']) <= 2
+        results.extend(resp['results'])
+        if resp['next'] is None:
+            break
+        resp = api_client.get(resp['next']).json()
+
+    assert [asset['path'] for asset in results] == [asset['path'] for asset in expected]
+
+
+@pytest.mark.django_db
+def test_asset_rest_list_invalid_cursor(api_client, version):
+    resp = api_client.get(
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/',
+        {'cursor': 'not-a-cursor'},
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.parametrize('order_param', ['path,created', 'id', 'metadata'])
+@pytest.mark.django_db
+def test_asset_rest_list_cursor_invalid_order(api_client, version, order_param):
+    resp = api_client.get(
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/',
+        {'order': order_param, 'cursor': ''},
+    )
+    assert resp.status_code == 400
+    assert 'order' in resp.json()
+
+
 @pytest.mark.parametrize(
     ('order_param', 'expected_order'),
     [
@@ -559,6 +751,105 @@ def test_asset_rest_retrieve(api_client, version, asset, asset_factory):
     )
 
 
+@pytest.mark.django_db
+def test_asset_rest_retrieve_conditional(api_client, version, asset):
+    version.assets.add(asset)
+
+    url = f'/api/assets/{asset.asset_id}/'
+    resp = api_client.get(url)
+    assert resp.status_code == 200
+    etag = resp['ETag']
+
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+
+    # The info of an asset is validated by the same ETag
+    resp = api_client.get(f'{url}info/', HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+
+    # The ETag changes with the computed fields of the metadata, without the asset being modified
+    Asset.objects.filter(id=asset.id).update(computed_metadata={'contentSize': 1})
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200
+    assert resp.json()['contentSize'] == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('url_format', 'max_queries'),
+    [
+        ('/api/assets/{asset_id}/', 3),
+        ('/api/assets/{asset_id}/info/', 3),
+        ('/api/dandisets/{dandiset_id}/versions/draft/assets/{asset_id}/', 3),
+        ('/api/dandisets/{dandiset_id}/versions/draft/assets/{asset_id}/info/', 3),
+    ],
+)
+def test_asset_rest_detail_num_queries(
+    api_client,
+    draft_asset_factory,
+    embargoed_asset_blob,
+    django_assert_max_num_queries,
+    url_format,
+    max_queries,
+):
+    user = UserFactory.create()
+    # An embargoed asset requires the most lookups to authorize
+    version = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED, dandiset__owners=[user]
+    )
+    asset = draft_asset_factory(blob=embargoed_asset_blob)
+    version.assets.add(asset)
+    refresh_computed_metadata()
+
+    api_client.force_authenticate(user=user)
+    url = url_format.format(dandiset_id=version.dandiset.identifier, asset_id=asset.asset_id)
+    with django_assert_max_num_queries(max_queries):
+        resp = api_client.get(url)
+    assert resp.status_code == 200
+
+
+@pytest.mark.parametrize('suffix', ['', 'info/', 'download/', 'validation/'])
+@pytest.mark.django_db
+def test_asset_rest_nested_asset_of_another_version(
+    api_client, draft_asset_factory, embargoed_asset_blob, suffix
+):
+    user = UserFactory.create()
+    embargoed_version = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED
+    )
+    asset = draft_asset_factory(blob=embargoed_asset_blob)
+    embargoed_version.assets.add(asset)
+
+    # Access to an open dandiset doesn't grant access to the assets of another
+    open_version = DraftVersionFactory.create(dandiset__owners=[user])
+    api_client.force_authenticate(user=user)
+    resp = api_client.get(
+        f'/api/dandisets/{open_version.dandiset.identifier}/versions/draft/assets/'
+        f'{asset.asset_id}/{suffix}'
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.django_db
+def test_asset_rest_list_published_conditional(api_client, published_version, asset):
+    published_version.assets.add(asset)
+
+    url = (
+        f'/api/dandisets/{published_version.dandiset.identifier}/'
+        f'versions/{published_version.version}/assets/'
+    )
+    resp = api_client.get(url, {'metadata': True})
+    assert resp.status_code == 200
+    assert resp['Cache-Control'] == 'public, max-age=86400'
+
+    resp = api_client.get(url, {'metadata': True}, HTTP_IF_NONE_MATCH=resp['ETag'])
+    assert resp.status_code == 304
+
+    # Each page has its own ETag
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=resp['ETag'])
+    assert resp.status_code == 200
+
+
 @pytest.mark.django_db
 def test_asset_rest_retrieve_no_sha256(api_client, version, asset):
     version.assets.add(asset)
@@ -600,6 +891,43 @@ def test_asset_rest_retrieve_embargoed_admin(
     assert r.status_code == 200
 
 
+@pytest.mark.django_db
+def test_asset_rest_metadata_batch(api_client, version, asset_factory):
+    assets = [asset_factory(), asset_factory()]
+    version.assets.add(*assets)
+
+    resp = api_client.post(
+        '/api/assets/metadata/',
+        {'asset_ids': [str(assets[1].asset_id), str(uuid4()), str(assets[0].asset_id)]},
+        format='json',
+    )
+    assert resp.status_code == 200
+    assert resp.json() == [assets[1].full_metadata, assets[0].full_metadata]
+
+
+@pytest.mark.django_db
+def test_asset_rest_metadata_batch_embargoed(api_client, draft_asset_factory):
+    owner = UserFactory.create()
+    version = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED, dandiset__owners=[owner]
+    )
+    asset = draft_asset_factory(blob__embargoed=True)
+    version.assets.add(asset)
+    data = {'asset_ids': [str(asset.asset_id)]}
+
+    resp = api_client.post('/api/assets/metadata/', data, format='json')
+    assert resp.status_code == 401
+
+    api_client.force_authenticate(user=UserFactory.create())
+    resp = api_client.post('/api/assets/metadata/', data, format='json')
+    assert resp.status_code == 403
+
+    api_client.force_authenticate(user=owner)
+    resp = api_client.post('/api/assets/metadata/', data, format='json')
+    assert resp.status_code == 200
+    assert resp.json() == [asset.full_metadata]
+
+
 @pytest.mark.django_db
 def test_asset_rest_download_embargoed_admin(
     api_client,
@@ -1056,6 +1384,160 @@ def test_asset_create_zarr_validated(api_client, zarr_file_factory):
     assert asset2.status == Asset.Status.VALID
 
 
+@pytest.mark.django_db
+def test_asset_rest_batch(api_client, asset_blob_factory, draft_asset_factory):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    existing = draft_asset_factory(path='foo/existing.txt')
+    draft_version.assets.add(existing)
+    add_asset_paths(existing, draft_version)
+    api_client.force_authenticate(user=user)
+
+    blob = asset_blob_factory()
+    new_blob = asset_blob_factory()
+    resp = api_client.post(
+        f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/batch/',
+        {
+            'assets': [
+                {'blob_id': blob.blob_id, 'metadata': {'path': 'foo/a.txt'}},
+                {'blob_id': blob.blob_id, 'metadata': {'path': 'foo/b/c.txt'}},
+                # An asset can be changed without moving it
+                {
+                    'asset_id': existing.asset_id,
+                    'blob_id': new_blob.blob_id,
+                    'metadata': {'path': 'foo/existing.txt'},
+                },
+                # These conflict with the items before them
+                {'blob_id': blob.blob_id, 'metadata': {'path': 'foo/a.txt'}},
+                {'blob_id': blob.blob_id, 'metadata': {'path': 'foo/b'}},
+                {'blob_id': blob.blob_id, 'metadata': {'path': 'foo/a.txt/d.txt'}},
+                # These are invalid
+                {'blob_id': uuid4(), 'metadata': {'path': 'missing.txt'}},
+                {'blob_id': blob.blob_id, 'metadata': {'path': '/absolute.txt'}},
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    results = resp.json()
+    assert [result['status'] for result in results] == [200, 200, 200, 409, 409, 409, 404, 400]
+
+    draft_version.refresh_from_db()
+    assert draft_version.status == Version.Status.PENDING
+    assert sorted(draft_version.assets.values_list('path', flat=True)) == [
+        'foo/a.txt',
+        'foo/b/c.txt',
+        'foo/existing.txt',
+    ]
+    assert not draft_version.assets.filter(id=existing.id).exists()
+    for result in results[:3]:
+        asset = Asset.objects.get(asset_id=result['asset']['asset_id'])
+        assert result['asset']['metadata'] == asset.full_metadata
+        assert AssetPath.objects.get(version=draft_version, path=asset.path).asset == asset
+
+    # The folder only held pending deltas when its asset was replaced, which must still add up
+    folder = AssetPath.objects.get(version=draft_version, path='foo')
+    assert (folder.total_files, folder.total_size) == (3, 2 * blob.size + new_blob.size)
+    assert find_asset_path_drift(draft_version) == []
+
+
+@pytest.mark.django_db
+def test_asset_rest_batch_unchanged(api_client, asset_blob):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    metadata = {'path': 'foo/a.txt', 'schemaVersion': DANDI_SCHEMA_VERSION}
+    asset = add_asset_to_version(
+        user=user, version=draft_version, asset_blob=asset_blob, metadata=metadata
+    )
+    api_client.force_authenticate(user=user)
+
+    resp = api_client.post(
+        f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/batch/',
+        {
+            'assets': [
+                {'asset_id': asset.asset_id, 'blob_id': asset_blob.blob_id, 'metadata': metadata}
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    [result] = resp.json()
+    assert result['status'] == 200
+    assert result['asset']['asset_id'] == str(asset.asset_id)
+    assert list(draft_version.assets.all()) == [asset]
+
+
+@pytest.mark.django_db
+def test_asset_rest_batch_not_an_owner(api_client, asset_blob):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create()
+    api_client.force_authenticate(user=user)
+
+    resp = api_client.post(
+        f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/batch/',
+        {'assets': [{'blob_id': asset_blob.blob_id, 'metadata': {'path': 'foo/a.txt'}}]},
+    )
+    assert resp.status_code == 403
+    assert not draft_version.assets.exists()
+
+
+@pytest.mark.django_db
+def test_asset_rest_bulk_remove(api_client, draft_asset_factory):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    paths = ['session/a.txt', 'session/sub/b.txt', 'session2/c.txt', 'd.txt']
+    assets = [draft_asset_factory(path=path) for path in paths]
+    for asset in assets:
+        draft_version.assets.add(asset)
+        add_asset_paths(asset, draft_version)
+    api_client.force_authenticate(user=user)
+    url = f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/remove/'
+
+    # Only the assets within the folder itself are removed
+    resp = api_client.post(url, {'path_prefix': 'session/'})
+    assert resp.status_code == 200
+    assert resp.json() == {'removed': 2}
+    assert sorted(draft_version.assets.values_list('path', flat=True)) == [
+        'd.txt',
+        'session2/c.txt',
+    ]
+
+    # Assets not in the version are ignored
+    resp = api_client.post(url, {'asset_ids': [assets[0].asset_id, assets[3].asset_id]})
+    assert resp.status_code == 200
+    assert resp.json() == {'removed': 1}
+    assert list(draft_version.assets.values_list('path', flat=True)) == ['session2/c.txt']
+
+    # The assets themselves are not deleted
+    assert Asset.objects.filter(id__in=[asset.id for asset in assets]).count() == len(assets)
+    assert sorted(draft_version.asset_paths.values_list('path', flat=True)) == [
+        'session2',
+        'session2/c.txt',
+    ]
+    assert find_asset_path_drift(draft_version) == []
+
+    draft_version.refresh_from_db()
+    assert draft_version.status == Version.Status.PENDING
+
+
+@pytest.mark.django_db
+def test_asset_rest_bulk_remove_invalid(api_client, draft_asset_factory):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    api_client.force_authenticate(user=user)
+    url = f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/remove/'
+
+    assert api_client.post(url, {}).status_code == 400
+    assert api_client.post(url, {'asset_ids': [], 'path_prefix': 'foo'}).status_code == 400
+
+    # Published versions can't be modified
+    published_version = PublishedVersionFactory.create(dandiset=draft_version.dandiset)
+    resp = api_client.post(
+        f'/api/dandisets/{draft_version.dandiset.identifier}'
+        f'/versions/{published_version.version}/assets/remove/',
+        {'path_prefix': 'foo'},
+    )
+    assert resp.status_code == 405
+
+
 @pytest.mark.django_db
 def test_asset_create_zarr_wrong_dandiset(api_client, zarr_archive_factory):
     user = UserFactory.create()
@@ -1838,6 +2320,42 @@ def test_asset_direct_download_head(api_client, version, asset):
         assert download.content == reader.read()
 
 
+@pytest.mark.django_db
+def test_asset_direct_download_cached_url(api_client, version, asset):
+    version.assets.add(asset)
+
+    url = f'/api/assets/{asset.asset_id}/download/'
+    download_url = api_client.get(url).get('Location')
+    assert api_client.get(url).get('Location') == download_url
+
+    # URLs with different response parameters are presigned separately
+    inline_url = api_client.get(url, {'content_disposition': 'inline'}).get('Location')
+    assert inline_url != download_url
+    assert requests.get(inline_url, timeout=5).headers.get('Content-Disposition') == (
+        f'inline; filename="{asset.path.split("/")[-1]}"'
+    )
+
+
+def test_ttl_cache(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr('dandiapi.storage.time.monotonic', lambda: now)
+    cache = _TTLCache(ttl=10, maxsize=2)
+
+    cache.set('a', 'url-a')
+    assert cache.get('a') == 'url-a'
+
+    now = 10.0
+    assert cache.get('a') is None
+
+    # The oldest entries are evicted once the cache is full
+    cache.set('a', 'url-a')
+    cache.set('b', 'url-b')
+    cache.set('c', 'url-c')
+    assert cache.get('a') is None
+    assert cache.get('b') == 'url-b'
+    assert cache.get('c') == 'url-c'
+
+
 @pytest.mark.django_db
 def test_asset_direct_metadata(api_client, asset):
     assert (
@@ -1891,3 +2409,39 @@ def test_asset_rest_glob(api_client, asset_factory, version, glob_pattern, expec
 
     # Sort both lists before comparing since ordering is not considered
     assert sorted(expected_paths) == sorted([asset['path'] for asset in resp.json()['results']])
+
+
+@pytest.mark.parametrize(
+    ('glob_pattern', 'prefix', 'regex'),
+    [
+        ('a/b.txt', 'a/b.txt', None),
+        ('a/b/*', 'a/b/', r'^a/b/.*$'),
+        ('*.txt', '', r'^.*\.txt$'),
+        ('a/*/c*.txt', 'a/', r'^a/.*/c.*\.txt$'),
+    ],
+)
+def test_compile_glob(glob_pattern, prefix, regex):
+    assert compile_glob(glob_pattern) == (prefix, regex)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('params', 'expected_paths'),
+    [
+        ({'glob': 'sub-01/*'}, ['sub-01/a.nwb', 'SUB-01/b.nwb']),
+        ({'glob': 'sub-01/*', 'case_sensitive': True}, ['sub-01/a.nwb']),
+        ({'glob': 'SUB-01/b.nwb', 'case_sensitive': True}, ['SUB-01/b.nwb']),
+        ({'glob': 'sub-01/B.nwb', 'case_sensitive': True}, []),
+        ({'path': 'sub-01'}, ['sub-01/a.nwb', 'SUB-01/b.nwb']),
+        ({'path': 'sub-01', 'case_sensitive': True}, ['sub-01/a.nwb']),
+    ],
+)
+def test_asset_rest_case_sensitive(api_client, asset_factory, version, params, expected_paths):
+    for path in ('sub-01/a.nwb', 'SUB-01/b.nwb', 'sub-02/c.nwb'):
+        version.assets.add(asset_factory(path=path))
+
+    resp = api_client.get(
+        f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/assets/', params
+    )
+
+    assert sorted(expected_paths) == sorted([asset['path'] for asset in resp.json()['results']])
@@ -1,21 +1,17 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
 
 from dandischema.consts import DANDI_SCHEMA_VERSION
 from dandischema.models import AccessType
 import pytest
 
-from dandiapi.api.models.asset import EmbargoedAssetWithinOpenDandisetError
+from dandiapi.api.models.asset import Asset, EmbargoedAssetWithinOpenDandisetError
 from dandiapi.api.models.dandiset import Dandiset
 from dandiapi.api.tests.factories import (
     DraftVersionFactory,
 )
 
-if TYPE_CHECKING:
-    from dandiapi.api.models import Asset
-
 
 @pytest.mark.django_db
 def test_asset_full_metadata_access(
@@ -136,6 +132,17 @@ def test_access_metadata_embargoed_blob_shared_across_embargoed_dandisets(
     assert asset_b.access_metadata()['embargoedUntil'] == '2018-10-25'
 
 
+@pytest.mark.django_db
+def test_access_metadata_embargoed_blob_without_assets(embargoed_asset_blob):
+    """An unsaved asset of a blob no other asset refers to has no embargo end date."""
+    asset = Asset(path='foo.txt', blob=embargoed_asset_blob)
+
+    assert asset.access_metadata() == {
+        'schemaKey': 'AccessRequirements',
+        'status': AccessType.EmbargoedAccess.value,
+    }
+
+
 @pytest.mark.django_db
 def test_access_metadata_embargoed_blob_in_open_dandiset_raises(
     embargoed_asset_blob, draft_asset_factory
@@ -147,3 +154,44 @@ def test_access_metadata_embargoed_blob_in_open_dandiset_raises(
 
     with pytest.raises(EmbargoedAssetWithinOpenDandisetError):
         asset.access_metadata()
+
+
+@pytest.mark.django_db
+def test_get_embargo_end_dates(
+    embargoed_asset_blob_factory, asset_blob_factory, draft_asset_factory, django_assert_num_queries
+):
+    """The embargo end dates of many blobs are looked up in one query."""
+    version_a = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED,
+        dandiset__embargo_end_date=date.fromisoformat('2026-08-01'),
+    )
+    version_b = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED,
+        dandiset__embargo_end_date=date.fromisoformat('2018-10-25'),
+    )
+    shared_blob = embargoed_asset_blob_factory()
+    assets = [
+        draft_asset_factory(blob=shared_blob),
+        draft_asset_factory(blob=shared_blob),
+        draft_asset_factory(blob=embargoed_asset_blob_factory()),
+        draft_asset_factory(blob=asset_blob_factory()),
+    ]
+    version_a.assets.add(assets[0], assets[2], assets[3])
+    version_b.assets.add(assets[1])
+
+    with django_assert_num_queries(1):
+        embargo_end_dates = Asset.get_embargo_end_dates(assets)
+    assert embargo_end_dates == {
+        shared_blob.id: date.fromisoformat('2018-10-25'),
+        assets[2].blob_id: date.fromisoformat('2026-08-01'),
+    }
+
+    # The result is used in place of querying each asset
+    with django_assert_num_queries(0):
+        access = [asset.access_metadata(embargo_end_dates) for asset in assets]
+    assert [a.get('embargoedUntil') for a in access] == [
+        '2018-10-25',
+        '2018-10-25',
+        '2026-08-01',
+        None,
+    ]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dandischema.consts import DANDI_SCHEMA_VERSION
+from dandischema.models import AccessType
+import pytest
+
+from dandiapi.api.asset_metadata import invalidate_computed_metadata, refresh_computed_metadata
+from dandiapi.api.models import Asset
+from dandiapi.api.models.dandiset import Dandiset
+from dandiapi.api.services.asset import add_asset_to_version
+from dandiapi.api.tests.factories import DraftVersionFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_refresh_computed_metadata(draft_asset_factory):
+    asset = draft_asset_factory()
+    assert asset.computed_metadata is None
+    expected = asset.full_metadata
+
+    assert refresh_computed_metadata() == 1
+    asset.refresh_from_db()
+    assert asset.computed_metadata == asset.compute_metadata()
+    assert asset.full_metadata == expected
+
+    # Assets which have computed metadata are not refreshed again
+    assert refresh_computed_metadata() == 0
+
+
+@pytest.mark.django_db
+def test_refresh_computed_metadata_limit(draft_asset_factory):
+    draft_asset_factory()
+    draft_asset_factory()
+
+    assert refresh_computed_metadata(limit=1) == 1
+    assert Asset.objects.filter(computed_metadata__isnull=True).count() == 1
+
+
+@pytest.mark.django_db
+def test_full_metadata_uses_computed_metadata(draft_asset_factory):
+    asset = draft_asset_factory()
+    refresh_computed_metadata()
+    Asset.objects.filter(id=asset.id).update(computed_metadata={'contentSize': 1})
+    asset.refresh_from_db()
+    assert asset.full_metadata['contentSize'] == 1
+
+    invalidate_computed_metadata(Asset.objects.filter(id=asset.id))
+    asset.refresh_from_db()
+    assert asset.full_metadata['contentSize'] == asset.size
+
+
+@pytest.mark.django_db
+def test_add_asset_invalidates_shared_embargoed_blob(draft_asset_factory, embargoed_asset_blob):
+    embargoed_version = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED
+    )
+    asset = draft_asset_factory(blob=embargoed_asset_blob)
+    embargoed_version.assets.add(asset)
+    refresh_computed_metadata()
+    asset.refresh_from_db()
+    assert asset.computed_metadata['access'][0]['status'] == AccessType.EmbargoedAccess.value
+
+    # Adding the blob to an open dandiset unembargoes it, changing the access of every asset
+    user = UserFactory.create()
+    open_version = DraftVersionFactory.create(dandiset__owners=[user])
+    add_asset_to_version(
+        user=user,
+        version=open_version,
+        asset_blob=embargoed_asset_blob,
+        metadata={'path': 'a.txt', 'schemaVersion': DANDI_SCHEMA_VERSION},
+    )
+    asset.refresh_from_db()
+    assert asset.computed_metadata is None
+    assert asset.full_metadata['access'][0]['status'] == AccessType.OpenAccess.value
@@ -6,18 +6,28 @@ import pytest
 
 from dandiapi.api.asset_paths import (
     add_asset_paths,
+    add_asset_paths_many,
     add_version_asset_paths,
+    clone_version_asset_paths,
+    compact_asset_path_aggregates,
     delete_asset_paths,
+    delete_asset_paths_many,
     extract_paths,
+    find_asset_path_drift,
+    get_conflicting_paths,
+    get_path_children,
     get_root_paths,
     get_root_paths_many,
+    prune_empty_asset_paths,
+    repair_asset_path_aggregates,
+    resize_zarr_paths,
     search_asset_paths,
     update_asset_paths,
 )
 from dandiapi.api.models import Asset, AssetPath, Version
-from dandiapi.api.models.asset_paths import AssetPathRelation
+from dandiapi.api.models.asset_paths import AssetPathAggregateDelta, AssetPathRelation
 from dandiapi.api.services.asset import add_asset_to_version
-from dandiapi.api.services.asset.exceptions import AssetAlreadyExistsError
+from dandiapi.api.services.asset.exceptions import AssetAlreadyExistsError, AssetPathConflictError
 from dandiapi.api.tasks import publish_dandiset_task
 from dandiapi.api.tests.factories import DraftVersionFactory, UserFactory
 
@@ -69,8 +79,8 @@ def test_asset_path_add_asset(asset_factory):
 
     # Check parent paths and relations
     for path in parent_paths:
-        assert path.aggregate_size == asset.size
-        assert path.aggregate_files == 1
+        assert path.total_size == asset.size
+        assert path.total_files == 1
 
         # Assert self referencing link
         assert AssetPathRelation.objects.filter(parent=path, child=path).exists()
@@ -182,6 +192,109 @@ def test_asset_path_add_version_asset_paths_idempotent(asset_factory):
         assert path.aggregate_size == path.asset.size
 
 
+@pytest.mark.django_db
+def test_asset_path_add_version_asset_paths_matches_add_asset_paths(
+    draft_asset_factory, zarr_archive_factory
+):
+    paths = ['foo/bar/baz.txt', 'foo/bar/baz2.txt', 'foo/baz/file.txt', 'top.txt', 'a/b/c/d/e']
+    assets = [draft_asset_factory(path=path) for path in paths]
+    zarr_archive = zarr_archive_factory(size=1234)
+    assets.append(draft_asset_factory(path='foo/data.zarr', blob=None, zarr=zarr_archive))
+
+    # Ingest the same assets incrementally and in bulk, into two separate versions
+    incremental_version: Version = DraftVersionFactory.create()
+    bulk_version: Version = DraftVersionFactory.create()
+    for asset in assets:
+        incremental_version.assets.add(asset)
+        add_asset_paths(asset, incremental_version)
+        bulk_version.assets.add(asset)
+    add_version_asset_paths(bulk_version)
+    compact_asset_path_aggregates(incremental_version)
+
+    def snapshot(version: Version):
+        paths = set(
+            AssetPath.objects.filter(version=version).values_list(
+                'path', 'asset_id', 'aggregate_files', 'aggregate_size'
+            )
+        )
+        relations = set(
+            AssetPathRelation.objects.filter(parent__version=version).values_list(
+                'parent__path', 'child__path', 'depth'
+            )
+        )
+        return paths, relations
+
+    assert snapshot(bulk_version) == snapshot(incremental_version)
+
+
+@pytest.mark.django_db
+def test_asset_path_add_version_asset_paths_conflicting_path(draft_asset_factory):
+    version: Version = DraftVersionFactory.create()
+    version.assets.add(draft_asset_factory(path='foo/bar.txt'))
+    version.assets.add(draft_asset_factory(path='foo/bar.txt'))
+
+    with pytest.raises(AssetAlreadyExistsError):
+        add_version_asset_paths(version)
+
+    assert not version.asset_paths.exists()
+
+
+@pytest.mark.django_db
+def test_asset_path_add_asset_paths_many_matches_add_asset_paths(
+    draft_asset_factory, zarr_archive_factory
+):
+    existing = [draft_asset_factory(path=path) for path in ['foo/bar/old.txt', 'other.txt']]
+    paths = ['foo/bar/baz.txt', 'foo/bar/baz2.txt', 'foo/baz/file.txt', 'top.txt', 'a/b/c/d/e']
+    assets = [draft_asset_factory(path=path) for path in paths]
+    zarr_archive = zarr_archive_factory(size=1234)
+    assets.append(draft_asset_factory(path='foo/data.zarr', blob=None, zarr=zarr_archive))
+
+    # Add the same assets to versions which already have paths, one at a time and all at once
+    incremental_version: Version = DraftVersionFactory.create()
+    many_version: Version = DraftVersionFactory.create()
+    for version in [incremental_version, many_version]:
+        for asset in existing:
+            version.assets.add(asset)
+            add_asset_paths(asset, version)
+    for asset in assets:
+        incremental_version.assets.add(asset)
+        add_asset_paths(asset, incremental_version)
+        many_version.assets.add(asset)
+    add_asset_paths_many(assets, many_version)
+
+    def snapshot(version: Version):
+        compact_asset_path_aggregates(version)
+        paths = set(
+            AssetPath.objects.filter(version=version).values_list(
+                'path', 'asset_id', 'aggregate_files', 'aggregate_size'
+            )
+        )
+        relations = set(
+            AssetPathRelation.objects.filter(parent__version=version).values_list(
+                'parent__path', 'child__path', 'depth'
+            )
+        )
+        return paths, relations
+
+    assert snapshot(many_version) == snapshot(incremental_version)
+    assert find_asset_path_drift(many_version) == []
+
+
+@pytest.mark.django_db
+def test_asset_path_add_asset_paths_many_conflicting_path(draft_asset_factory):
+    version: Version = DraftVersionFactory.create()
+    existing = draft_asset_factory(path='foo/bar.txt')
+    version.assets.add(existing)
+    add_asset_paths(existing, version)
+
+    with pytest.raises(AssetAlreadyExistsError):
+        add_asset_paths_many([draft_asset_factory(path='foo/bar.txt')], version)
+
+    # A folder can't be added where a file already is
+    with pytest.raises(AssetPathConflictError):
+        add_asset_paths_many([draft_asset_factory(path='foo/bar.txt/baz.txt')], version)
+
+
 @pytest.mark.django_db
 def test_asset_path_add_asset_shared_paths(asset_factory):
     # Create asset with version
@@ -199,8 +312,58 @@ def test_asset_path_add_asset_shared_paths(asset_factory):
     path = AssetPath.objects.get(path='foo', version=version)
     assert asset1.blob is not None
     assert asset2.blob is not None
-    assert path.aggregate_size == asset1.blob.size + asset2.blob.size
-    assert path.aggregate_files == 2
+    assert path.total_size == asset1.blob.size + asset2.blob.size
+    assert path.total_files == 2
+
+
+@pytest.mark.django_db
+def test_asset_path_depth(asset_factory):
+    version: Version = DraftVersionFactory.create()
+    asset = asset_factory(path='foo/bar/baz.txt')
+    version.assets.add(asset)
+    add_asset_paths(asset, version)
+
+    assert dict(version.asset_paths.values_list('path', 'depth')) == {
+        'foo': 1,
+        'foo/bar': 2,
+        'foo/bar/baz.txt': 3,
+    }
+
+
+@pytest.mark.django_db
+def test_asset_path_prefix_hierarchy(settings, asset_factory):
+    settings.DANDI_ASSET_PATH_HIERARCHY = 'prefix'
+
+    version: Version = DraftVersionFactory.create()
+    assets = [
+        asset_factory(path=path)
+        for path in ['foo/bar/baz.txt', 'foo/bar/baz2.txt', 'foo/baz/file.txt', 'foobar/a.txt']
+    ]
+    for asset in assets:
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+
+    # No closure table rows should be written
+    assert not AssetPathRelation.objects.filter(parent__version=version).exists()
+
+    foo = AssetPath.objects.get(version=version, path='foo')
+    assert foo.total_files == 3
+    assert [p.path for p in get_path_children(foo)] == ['foo/bar', 'foo/baz']
+    assert [p.path for p in get_path_children(foo, depth=None)] == [
+        'foo/bar',
+        'foo/bar/baz.txt',
+        'foo/bar/baz2.txt',
+        'foo/baz',
+        'foo/baz/file.txt',
+    ]
+    assert get_conflicting_paths('foo/bar', version) == ['foo/bar/baz.txt', 'foo/bar/baz2.txt']
+    assert get_conflicting_paths('foo/bar/baz.txt/qux.txt', version) == ['foo/bar/baz.txt']
+
+    # Delete an asset, ensuring the aggregates of its parents are updated
+    delete_asset_paths(assets[2], version)
+    foo.refresh_from_db()
+    assert foo.total_files == 2
+    assert not AssetPath.objects.filter(version=version, path='foo/baz').exists()
 
 
 @pytest.mark.django_db
@@ -273,8 +436,163 @@ def test_asset_path_delete_asset_shared_paths(asset_factory, asset_blob_factory)
     # Get path
     path = AssetPath.objects.get(path='foo', version=version)
     assert asset2.blob is not None
-    assert path.aggregate_size == asset2.blob.size
-    assert path.aggregate_files == 1
+    assert path.total_size == asset2.blob.size
+    assert path.total_files == 1
+
+
+@pytest.mark.django_db
+def test_asset_path_delete_asset_paths_many_matches_delete_asset_paths(
+    asset_factory, asset_blob_factory
+):
+    paths = ['foo/bar/a.txt', 'foo/bar/b.txt', 'foo/baz/c.txt', 'foo/d.txt', 'top.txt']
+    assets = [asset_factory(path=path, blob=asset_blob_factory(size=100)) for path in paths]
+    removed = [assets[0], assets[2], assets[4]]
+
+    # Remove the same assets one at a time and all at once, from two separate versions
+    incremental_version: Version = DraftVersionFactory.create()
+    many_version: Version = DraftVersionFactory.create()
+    for version in [incremental_version, many_version]:
+        for asset in assets:
+            version.assets.add(asset)
+            add_asset_paths(asset, version)
+    for asset in removed:
+        delete_asset_paths(asset, incremental_version)
+    assert delete_asset_paths_many(removed, many_version) == len(removed)
+
+    def snapshot(version: Version):
+        compact_asset_path_aggregates(version)
+        return set(
+            AssetPath.objects.filter(version=version).values_list(
+                'path', 'asset_id', 'aggregate_files', 'aggregate_size'
+            )
+        )
+
+    assert snapshot(many_version) == snapshot(incremental_version)
+    assert {path for path, *_ in snapshot(many_version)} == {
+        'foo',
+        'foo/bar',
+        'foo/bar/b.txt',
+        'foo/d.txt',
+    }
+    assert find_asset_path_drift(many_version) == []
+
+
+@pytest.mark.django_db
+def test_asset_path_delete_asset_only_prunes_ancestors(asset_factory):
+    version: Version = DraftVersionFactory.create()
+    asset: Asset = asset_factory(path='foo/bar.txt')
+    version.assets.add(asset)
+    add_asset_paths(asset, version)
+
+    # Empty paths which aren't ancestors of the deleted asset are left to the sweeper
+    other_version: Version = DraftVersionFactory.create()
+    AssetPath.objects.create(path='empty', version=version)
+    AssetPath.objects.create(path='empty', version=other_version)
+
+    delete_asset_paths(asset, version)
+
+    assert list(version.asset_paths.values_list('path', flat=True)) == ['empty']
+    assert other_version.asset_paths.exists()
+
+
+@pytest.mark.django_db
+def test_asset_path_prune_empty_asset_paths(asset_factory):
+    version: Version = DraftVersionFactory.create()
+    asset: Asset = asset_factory(path='foo/bar.txt')
+    version.assets.add(asset)
+    add_asset_paths(asset, version)
+    AssetPath.objects.create(path='empty', version=version)
+    AssetPath.objects.create(path='foo/empty', version=version)
+
+    other_version: Version = DraftVersionFactory.create()
+    AssetPath.objects.create(path='empty', version=other_version)
+
+    assert prune_empty_asset_paths(version) == 2
+    assert sorted(version.asset_paths.values_list('path', flat=True)) == ['foo', 'foo/bar.txt']
+    assert other_version.asset_paths.exists()
+
+
+@pytest.mark.django_db
+def test_asset_path_compact_aggregates(
+    asset_factory, asset_blob_factory, django_assert_num_queries
+):
+    version: Version = DraftVersionFactory.create()
+    asset1: Asset = asset_factory(path='foo/bar.txt', blob=asset_blob_factory(size=128))
+    asset2: Asset = asset_factory(path='foo/baz/qux.txt', blob=asset_blob_factory(size=256))
+    for asset in [asset1, asset2]:
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+
+    # Ancestors only record deltas, which are reflected in their totals and the version stats.
+    # Both totals are fetched together, whether of a path or of the version.
+    foo = AssetPath.objects.get(path='foo', version=version)
+    assert foo.aggregate_files == 0
+    with django_assert_num_queries(1):
+        assert foo.total_files == 2
+        assert foo.total_size == 384
+    with django_assert_num_queries(2):
+        assert version.asset_count == 2
+        assert version.size == 384
+
+    compact_asset_path_aggregates(version)
+
+    assert not AssetPathAggregateDelta.objects.filter(path__version=version).exists()
+    foo.refresh_from_db()
+    version.refresh_from_db()
+    assert (foo.aggregate_files, foo.aggregate_size) == (2, 384)
+    assert (foo.total_files, foo.total_size) == (2, 384)
+    assert version.asset_count == 2
+    assert version.size == 384
+
+
+@pytest.mark.django_db
+def test_asset_path_resize_zarr_paths(draft_asset_factory, zarr_archive_factory):
+    zarr_archive = zarr_archive_factory(size=100)
+    asset = draft_asset_factory(path='foo/bar/data.zarr', blob=None, zarr=zarr_archive)
+    versions: list[Version] = [DraftVersionFactory.create() for _ in range(2)]
+    for version in versions:
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+
+    zarr_archive.size = 250
+    zarr_archive.save()
+    resize_zarr_paths(zarr_archive)
+
+    # The size of every path in every version is updated, while the file count is unchanged
+    for version in versions:
+        assert {
+            path.path: (path.total_files, path.total_size) for path in version.asset_paths.all()
+        } == {
+            'foo': (1, 250),
+            'foo/bar': (1, 250),
+            'foo/bar/data.zarr': (1, 250),
+        }
+
+
+@pytest.mark.django_db
+def test_asset_path_find_and_repair_drift(asset_factory, asset_blob_factory):
+    version: Version = DraftVersionFactory.create()
+    for path in ['foo/bar.txt', 'foo/baz.txt']:
+        asset = asset_factory(path=path, blob=asset_blob_factory(size=100))
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+    assert find_asset_path_drift(version) == []
+
+    # Corrupt the aggregates of a folder, and add a folder without any files
+    AssetPath.objects.filter(version=version, path='foo').update(aggregate_files=5)
+    empty = AssetPath.objects.create(version=version, path='empty', aggregate_files=1)
+
+    drift = find_asset_path_drift(version)
+    assert [(d.path, d.files, d.expected_files) for d in drift] == [
+        ('empty', 1, 0),
+        ('foo', 7, 2),
+    ]
+
+    assert repair_asset_path_aggregates(version) == drift
+    assert find_asset_path_drift(version) == []
+    assert not AssetPath.objects.filter(id=empty.id).exists()
+    foo = AssetPath.objects.get(version=version, path='foo')
+    assert (foo.aggregate_files, foo.aggregate_size) == (2, 200)
 
 
 @pytest.mark.django_db
@@ -301,6 +619,30 @@ def test_asset_path_search_asset_paths(asset_factory):
     assert all(x.asset is not None for x in qs)
 
 
+@pytest.mark.django_db
+def test_asset_path_search_asset_paths_after(asset_factory, django_assert_num_queries):
+    version: Version = DraftVersionFactory.create()
+    paths = ['foo/a.txt', 'foo/b/c.txt', 'foo/d.txt', 'foo/e/f.txt', 'g.txt']
+    for path in paths:
+        asset = asset_factory(path=path)
+        version.assets.add(asset)
+        add_asset_paths(asset, version)
+
+    qs = search_asset_paths('', version, after='foo')
+    assert qs is not None
+    assert [x.path for x in qs] == ['g.txt']
+
+    qs = search_asset_paths('foo', version, after='foo/b')
+    assert qs is not None
+    assert [x.path for x in qs] == ['foo/d.txt', 'foo/e']
+
+    # A page of children after a path is found from the paths alone, not the closure table
+    foo = AssetPath.objects.get(version=version, path='foo')
+    with django_assert_num_queries(1) as captured:
+        assert [x.path for x in get_path_children(foo, after='foo/d.txt')] == ['foo/e']
+    assert 'api_assetpathrelation' not in captured.captured_queries[0]['sql']
+
+
 @pytest.mark.django_db
 def test_asset_path_publish_version(asset_factory):
     user = UserFactory.create()
@@ -333,6 +675,61 @@ def test_asset_path_publish_version(asset_factory):
         AssetPath.objects.get(path=path, version=published_version)
 
 
+@pytest.mark.django_db
+def test_asset_path_publish_version_without_draft_paths(asset_factory):
+    user = UserFactory.create()
+    version: Version = DraftVersionFactory.create(status=Version.Status.PUBLISHING)
+    version.assets.add(asset_factory(path='foo/bar.txt', status=Asset.Status.VALID))
+
+    # Publish, without the draft having any asset paths
+    publish_dandiset_task(version.dandiset.id, user.id)
+
+    published_version = version.dandiset.versions.exclude(version='draft').get()
+    assert sorted(published_version.asset_paths.values_list('path', flat=True)) == [
+        'foo',
+        'foo/bar.txt',
+    ]
+
+
+@pytest.mark.django_db
+def test_asset_path_clone_version_asset_paths(asset_factory):
+    source: Version = DraftVersionFactory.create()
+    target: Version = DraftVersionFactory.create()
+    for path in ['foo/bar/baz.txt', 'foo/bar/baz2.txt', 'foo/baz/file.txt', 'top.txt']:
+        asset = asset_factory(path=path)
+        source.assets.add(asset)
+        target.assets.add(asset)
+    add_version_asset_paths(source)
+
+    clone_version_asset_paths(source=source, target=target)
+
+    def paths(version: Version):
+        return set(
+            version.asset_paths.values_list('path', 'asset', 'aggregate_files', 'aggregate_size')
+        )
+
+    def relations(version: Version):
+        return set(
+            AssetPathRelation.objects.filter(parent__version=version).values_list(
+                'parent__path', 'child__path', 'depth'
+            )
+        )
+
+    assert paths(target) == paths(source)
+    assert relations(target) == relations(source)
+
+    # Ensure relations only link paths within the same version
+    assert (
+        not AssetPathRelation.objects.filter(parent__version=target)
+        .exclude(child__version=target)
+        .exists()
+    )
+
+    # Cloning into a version which already has paths isn't allowed
+    with pytest.raises(RuntimeError):
+        clone_version_asset_paths(source=source, target=target)
+
+
 @pytest.mark.django_db
 def test_asset_path_get_root_paths(asset_factory):
     version = DraftVersionFactory.create()
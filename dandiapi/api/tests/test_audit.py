@@ -234,6 +234,43 @@ def test_audit_update_asset(api_client, asset_blob_factory, draft_asset_factory)
     assert rec.details['asset_blob_id'] == blob.blob_id
 
 
+@pytest.mark.django_db
+def test_audit_batch_assets(api_client, asset_blob_factory, draft_asset_factory):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    asset = draft_asset_factory(path='foo/bar.txt')
+    asset.versions.add(draft_version)
+
+    # Add one asset and replace another.
+    blob = asset_blob_factory()
+    api_client.force_authenticate(user=user)
+    resp = api_client.post(
+        f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/batch/',
+        {
+            'assets': [
+                {'blob_id': str(blob.blob_id), 'metadata': {'path': 'foo/baz.txt'}},
+                {
+                    'asset_id': str(asset.asset_id),
+                    'blob_id': str(blob.blob_id),
+                    'metadata': {'path': 'foo/bar.txt'},
+                },
+            ]
+        },
+    )
+    assert resp.status_code == 200
+
+    # Verify there is an audit record for each.
+    rec = get_latest_audit_record(dandiset=draft_version.dandiset, record_type='add_asset')
+    verify_model_properties(rec, user)
+    assert rec.details['path'] == 'foo/baz.txt'
+    assert rec.details['asset_blob_id'] == blob.blob_id
+
+    rec = get_latest_audit_record(dandiset=draft_version.dandiset, record_type='update_asset')
+    verify_model_properties(rec, user)
+    assert rec.details['path'] == 'foo/bar.txt'
+    assert rec.details['asset_blob_id'] == blob.blob_id
+
+
 @pytest.mark.django_db
 def test_audit_remove_asset(api_client, asset_blob_factory, draft_asset_factory):
     user = UserFactory.create()
@@ -257,6 +294,28 @@ def test_audit_remove_asset(api_client, asset_blob_factory, draft_asset_factory)
     assert rec.details['asset_id'] == str(asset_id)
 
 
+@pytest.mark.django_db
+def test_audit_bulk_remove_assets(api_client, draft_asset_factory):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    asset = draft_asset_factory(path='foo/bar.txt')
+    asset.versions.add(draft_version)
+
+    # Delete the assets within the folder.
+    api_client.force_authenticate(user=user)
+    resp = api_client.post(
+        f'/api/dandisets/{draft_version.dandiset.identifier}/versions/draft/assets/remove/',
+        {'path_prefix': 'foo'},
+    )
+    assert resp.status_code == 200
+
+    # Verify remove_asset audit record.
+    rec = get_latest_audit_record(dandiset=draft_version.dandiset, record_type='remove_asset')
+    verify_model_properties(rec, user)
+    assert rec.details['path'] == 'foo/bar.txt'
+    assert rec.details['asset_id'] == str(asset.asset_id)
+
+
 @pytest.mark.django_db(transaction=True)
 def test_audit_publish_dandiset(api_client, draft_asset_factory):
     user = UserFactory.create()
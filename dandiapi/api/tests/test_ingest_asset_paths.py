@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from dandiapi.api.management.commands.ingest_asset_paths import ingest_asset_paths
+from dandiapi.api.models import AssetPathIngestCheckpoint
+from dandiapi.api.tests.factories import DraftVersionFactory
+
+
+@pytest.fixture
+def version(draft_asset_factory):
+    version = DraftVersionFactory.create()
+    version.assets.add(draft_asset_factory(path='foo/bar.txt'))
+    return version
+
+
+@pytest.mark.django_db
+def test_ingest_asset_paths(version):
+    ingest_asset_paths('--dandiset', str(version.dandiset_id))
+
+    assert sorted(version.asset_paths.values_list('path', flat=True)) == ['foo', 'foo/bar.txt']
+    assert AssetPathIngestCheckpoint.objects.filter(version=version).exists()
+
+
+@pytest.mark.django_db
+def test_ingest_asset_paths_resume(version):
+    ingest_asset_paths('--dandiset', str(version.dandiset_id))
+    version.asset_paths.all().delete()
+
+    # Versions with a checkpoint are skipped
+    ingest_asset_paths('--dandiset', str(version.dandiset_id))
+    assert not version.asset_paths.exists()
+
+    ingest_asset_paths('--dandiset', str(version.dandiset_id), '--restart')
+    assert version.asset_paths.count() == 2
+
+
+@pytest.mark.django_db
+def test_ingest_asset_paths_rebuild(version):
+    ingest_asset_paths('--dandiset', str(version.dandiset_id))
+    version.asset_paths.filter(path='foo').update(aggregate_files=5)
+
+    ingest_asset_paths('--dandiset', str(version.dandiset_id), '--restart', '--rebuild')
+    assert version.asset_paths.get(path='foo').aggregate_files == 1
+
+
+@pytest.mark.django_db
+def test_ingest_asset_paths_dry_run(version, capsys):
+    ingest_asset_paths('--dandiset', str(version.dandiset_id), '--dry-run')
+
+    assert 'Total: 1 versions, 2 paths, 3 relations' in capsys.readouterr().out
+    assert not version.asset_paths.exists()
+    assert not AssetPathIngestCheckpoint.objects.exists()
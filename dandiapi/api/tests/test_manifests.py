@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 from typing import TYPE_CHECKING
 
 from django.core.files.base import ContentFile
@@ -10,6 +11,8 @@ from rest_framework_yaml.renderers import YAMLRenderer
 
 from dandiapi.api.manifests import (
     _streaming_file_upload,
+    manifest_location,
+    write_asset_manifests,
     write_assets_jsonld,
     write_assets_yaml,
     write_collection_jsonld,
@@ -18,7 +21,7 @@ from dandiapi.api.manifests import (
 )
 from dandiapi.api.models import Version
 from dandiapi.api.models.dandiset import Dandiset
-from dandiapi.api.tests.factories import DraftVersionFactory
+from dandiapi.api.tests.factories import DraftVersionFactory, PublishedVersionFactory
 
 if TYPE_CHECKING:
     from dandiapi.api.models import Version
@@ -43,6 +46,42 @@ def test_streaming_file_upload(embargo_status):
         assert tags == {}
 
 
+@pytest.mark.parametrize('size', [0, 100, 11 * 1024 * 1024])
+def test_storage_open_write(size):
+    path = 'foo/streamed.txt'
+    content = bytes(i % 251 for i in range(size))
+
+    # Write in uneven chunks, with parts of the smallest size S3 allows
+    with default_storage.open_write(path, tags={'embargoed': 'true'}, part_size=5 * 1024**2) as f:
+        for start in range(0, size, 3 * 1024**2 + 7):
+            f.write(content[start : start + 3 * 1024**2 + 7])
+
+    with default_storage.open(path) as f:
+        assert f.read() == content
+    assert default_storage.get_tags(path) == {'embargoed': 'true'}
+
+
+def test_storage_open_write_aborts():
+    path = 'foo/aborted.txt'
+    default_storage.save(path, ContentFile(b'original'))
+
+    def write_and_fail():
+        with default_storage.open_write(path, part_size=5 * 1024**2) as f:
+            f.write(b'x' * 6 * 1024**2)
+            raise ValueError('failed')
+
+    with pytest.raises(ValueError, match='failed'):
+        write_and_fail()
+
+    # The object is unchanged, and no parts are left behind
+    with default_storage.open(path) as f:
+        assert f.read() == b'original'
+    uploads = default_storage.s3_client.list_multipart_uploads(
+        Bucket=default_storage.bucket_name, Prefix=path
+    )
+    assert uploads.get('Uploads', []) == []
+
+
 @pytest.mark.django_db
 def test_write_dandiset_jsonld(version: Version):
     write_dandiset_jsonld(version)
@@ -140,3 +179,72 @@ def test_write_assets_yaml_already_exists(version: Version, asset_factory):
 
     with default_storage.open(assets_yaml_path) as f:
         assert f.read() == expected
+
+
+@pytest.mark.django_db
+def test_write_asset_manifests(version: Version, asset_factory):
+    version.assets.add(asset_factory())
+    version.assets.add(asset_factory())
+    manifests_path = f'dandisets/{version.dandiset.identifier}/{version.version}'
+
+    def read_manifests():
+        contents = {}
+        for name in ['assets.yaml', 'assets.jsonld', 'collection.jsonld']:
+            with default_storage.open(f'{manifests_path}/{name}') as f:
+                contents[name] = f.read()
+        return contents
+
+    # Writing the manifests together must match writing each separately
+    write_assets_yaml(version)
+    write_assets_jsonld(version)
+    write_collection_jsonld(version)
+    expected = read_manifests()
+
+    write_asset_manifests(version)
+    assert read_manifests() == expected
+
+
+@pytest.mark.django_db
+def test_write_asset_manifests_no_assets(version: Version):
+    write_asset_manifests(version)
+    manifests_path = f'dandisets/{version.dandiset.identifier}/{version.version}'
+
+    with default_storage.open(f'{manifests_path}/assets.yaml') as f:
+        assert f.read() == b''
+    with default_storage.open(f'{manifests_path}/assets.jsonld') as f:
+        assert f.read() == b'[]'
+    with default_storage.open(f'{manifests_path}/collection.jsonld') as f:
+        assert f.read() == JSONRenderer().render(
+            {
+                '@context': version.metadata['@context'],
+                'id': version.metadata['id'],
+                '@type': 'prov:Collection',
+                'hasMember': [],
+            }
+        )
+
+
+@pytest.mark.django_db
+def test_write_asset_manifests_compressed(version: Version, asset_factory):
+    version.assets.add(asset_factory())
+    manifests_path = f'dandisets/{version.dandiset.identifier}/{version.version}'
+
+    write_asset_manifests(version)
+
+    for name in ['assets.yaml', 'assets.jsonld']:
+        with default_storage.open(f'{manifests_path}/{name}') as f:
+            expected = f.read()
+        with default_storage.open(f'{manifests_path}/{name}.gz') as f:
+            assert gzip.decompress(f.read()) == expected
+
+
+@pytest.mark.django_db
+def test_manifest_location():
+    published_version = PublishedVersionFactory.create()
+    manifests_path = (
+        f'dandisets/{published_version.dandiset.identifier}/{published_version.version}'
+    )
+    assert manifest_location(published_version) == [
+        default_storage.url(f'{manifests_path}/{name}', signed=False)
+        for name in ['assets.yaml', 'assets.yaml.gz', 'assets.jsonld.gz']
+    ]
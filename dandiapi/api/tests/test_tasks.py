@@ -17,7 +17,9 @@ from zarr_checksum.checksum import EMPTY_CHECKSUM
 from zarr_checksum.generators import ZarrArchiveFile
 
 from dandiapi.api import tasks
-from dandiapi.api.models import Asset, Version
+from dandiapi.api.manifests import manifest_fingerprint
+from dandiapi.api.models import Asset, ManifestCheckpoint, Version
+from dandiapi.api.tasks.scheduled import write_modified_manifests
 from dandiapi.api.tests.factories import DraftVersionFactory, UserFactory
 from dandiapi.zarr.models import ZarrArchiveStatus
 
@@ -65,6 +67,79 @@ def test_write_manifest_files(version: Version, asset_factory):
     assert default_storage.exists(collection_jsonld_path)
 
 
+@pytest.mark.django_db
+def test_write_manifest_files_unchanged(version: Version, asset_factory):
+    version.assets.add(asset_factory())
+    assets_yaml_path = f'dandisets/{version.dandiset.identifier}/{version.version}/assets.yaml'
+
+    tasks.write_manifest_files(version.id)
+    checkpoint = ManifestCheckpoint.objects.get(version=version)
+    assert checkpoint.fingerprint == manifest_fingerprint(version)
+
+    # Nothing is written while the manifests would be unchanged
+    default_storage.delete(assets_yaml_path)
+    tasks.write_manifest_files(version.id)
+    assert not default_storage.exists(assets_yaml_path)
+
+    # Unless forced
+    tasks.write_manifest_files(version.id, force=True)
+    assert default_storage.exists(assets_yaml_path)
+
+    # Changing the assets of the version changes its fingerprint
+    default_storage.delete(assets_yaml_path)
+    version.assets.add(asset_factory())
+    tasks.write_manifest_files(version.id)
+    assert default_storage.exists(assets_yaml_path)
+    assert ManifestCheckpoint.objects.get(version=version).fingerprint != checkpoint.fingerprint
+
+
+@pytest.mark.django_db
+def test_write_modified_manifests(mocker):
+    mocked_delay = mocker.patch('dandiapi.api.tasks.scheduled.write_manifest_files.delay')
+    mocker.patch('dandiapi.api.tasks.scheduled.time.sleep')
+    settled = timezone.now() - datetime.timedelta(seconds=settings.DANDI_MANIFEST_DEBOUNCE + 1)
+
+    # Versions only have their manifests written once they have settled
+    never_written = DraftVersionFactory.create()
+    Version.objects.filter(id=never_written.id).update(modified=settled)
+    recently_modified = DraftVersionFactory.create()
+
+    # Versions whose manifests were written since they were last modified are skipped
+    already_written = DraftVersionFactory.create()
+    Version.objects.filter(id=already_written.id).update(modified=settled)
+    ManifestCheckpoint.objects.create(
+        version=already_written, fingerprint='', version_modified=settled
+    )
+    modified_since = DraftVersionFactory.create()
+    Version.objects.filter(id=modified_since.id).update(modified=settled)
+    ManifestCheckpoint.objects.create(
+        version=modified_since,
+        fingerprint='',
+        version_modified=settled - datetime.timedelta(minutes=1),
+    )
+
+    # Versions which keep being modified are written once they have waited too long
+    overdue = timezone.now() - datetime.timedelta(seconds=settings.DANDI_MANIFEST_MAX_DELAY + 1)
+    continually_modified = DraftVersionFactory.create()
+    ManifestCheckpoint.objects.create(
+        version=continually_modified, fingerprint='', version_modified=overdue
+    )
+    ManifestCheckpoint.objects.filter(version=continually_modified).update(written=overdue)
+    never_written_modified = DraftVersionFactory.create()
+    Version.objects.filter(id=never_written_modified.id).update(created=overdue)
+
+    write_modified_manifests()
+
+    enqueued = {call.args[0] for call in mocked_delay.call_args_list}
+    assert enqueued == {
+        never_written.id,
+        modified_since.id,
+        continually_modified.id,
+        never_written_modified.id,
+    }
+    assert recently_modified.id not in enqueued
+
+
 @pytest.mark.django_db
 def test_validate_asset_metadata(draft_asset: Asset):
     tasks.validate_asset_metadata_task(draft_asset.id)
@@ -387,7 +462,7 @@ def test_publish_task(
             'schemaKey': 'PublishActivity',
         },
         'datePublished': UTC_ISO_TIMESTAMP_RE,
-        'manifestLocation': [HTTP_URL_RE],
+        'manifestLocation': [HTTP_URL_RE, HTTP_URL_RE, HTTP_URL_RE],
         'identifier': f'{_SCHEMA_CONFIG.instance_name}:{draft_version.dandiset.identifier}',
         'version': published_version.version,
         'id': (
@@ -119,7 +119,7 @@ def test_published_version_metadata_computed():
 
     expected_metadata = {
         **original_metadata,
-        'manifestLocation': [HTTP_URL_RE],
+        'manifestLocation': [HTTP_URL_RE, HTTP_URL_RE, HTTP_URL_RE],
         'name': published_version.name,
         'identifier': f'{_SCHEMA_CONFIG.instance_name}:{published_version.dandiset.identifier}',
         'version': published_version.version,
@@ -336,7 +336,7 @@ def test_version_publish_version(asset):
         },
         'dateCreated': UTC_ISO_TIMESTAMP_RE,
         'datePublished': UTC_ISO_TIMESTAMP_RE,
-        'manifestLocation': [HTTP_URL_RE],
+        'manifestLocation': [HTTP_URL_RE, HTTP_URL_RE, HTTP_URL_RE],
         'identifier': f'{_SCHEMA_CONFIG.instance_name}:{publish_version.dandiset.identifier}',
         'version': publish_version.version,
         'id': (
@@ -471,6 +471,48 @@ def test_version_rest_retrieve(api_client, version):
     )
 
 
+@pytest.mark.django_db
+def test_version_rest_retrieve_conditional(api_client, version):
+    url = f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/'
+    resp = api_client.get(url)
+    assert resp.status_code == 200
+    etag = resp['ETag']
+    if version.version == 'draft':
+        assert resp['Cache-Control'] == 'no-cache'
+    else:
+        assert resp['Cache-Control'] == 'public, max-age=86400'
+
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+    assert resp['ETag'] == etag
+
+    resp = api_client.get(url, HTTP_IF_MODIFIED_SINCE=resp['Last-Modified'])
+    assert resp.status_code == 304
+
+    # Modifying the version changes its ETag
+    version.save()
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200
+    assert resp['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_version_rest_retrieve_num_queries(api_client, django_assert_max_num_queries):
+    user = UserFactory.create()
+    # An embargoed version requires the most lookups to authorize
+    version = DraftVersionFactory.create(
+        dandiset__embargo_status=Dandiset.EmbargoStatus.EMBARGOED, dandiset__owners=[user]
+    )
+    api_client.force_authenticate(user=user)
+
+    # The dandiset, the dandisets owned by the user and the version
+    with django_assert_max_num_queries(3):
+        resp = api_client.get(
+            f'/api/dandisets/{version.dandiset.identifier}/versions/{version.version}/'
+        )
+    assert resp.status_code == 200
+
+
 @pytest.mark.django_db
 def test_version_rest_info(api_client, version):
     assert api_client.get(
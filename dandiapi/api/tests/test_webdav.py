@@ -199,6 +199,42 @@ def test_asset_atpath_folder(api_client, asset_blob):
     assert resp.json()['results'][2]['type'] == 'asset'
 
 
+@pytest.mark.django_db
+def test_asset_atpath_folder_after(api_client, asset_blob):
+    user = UserFactory.create()
+    draft_version = DraftVersionFactory.create(dandiset__owners=[user])
+    for path in ['foo/a.txt', 'foo/b.txt', 'foo/c.txt']:
+        add_asset_to_version(
+            user=user,
+            version=draft_version,
+            asset_blob=asset_blob,
+            metadata={
+                'path': path,
+                'schemaVersion': DANDI_SCHEMA_VERSION,
+            },
+        )
+
+    api_client.force_authenticate(user=user)
+    params = {
+        'children': True,
+        'dandiset_id': draft_version.dandiset.identifier,
+        'version_id': draft_version.version,
+        'path': 'foo',
+        'page_size': 2,
+    }
+
+    # The folder itself is only included on the first page
+    resp = api_client.get('/api/webdav/assets/atpath/', {**params, 'after': ''})
+    assert resp.status_code == 200
+    assert [r['resource']['path'] for r in resp.json()['results']] == ['foo', 'foo/a.txt']
+    assert 'after=foo%2Fa.txt' in resp.json()['next']
+
+    resp = api_client.get('/api/webdav/assets/atpath/', {**params, 'after': 'foo/a.txt'})
+    assert resp.status_code == 200
+    assert [r['resource']['path'] for r in resp.json()['results']] == ['foo/b.txt', 'foo/c.txt']
+    assert resp.json()['next'] is None
+
+
 @pytest.mark.django_db
 def test_asset_atpath_trailing_slash(api_client, asset_blob):
     user = UserFactory.create()
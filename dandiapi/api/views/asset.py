@@ -1,65 +1,216 @@
 from __future__ import annotations
 
+from functools import cached_property
+import json
 import re
+import time
 from typing import TYPE_CHECKING, cast
 
 from dandischema.consts import DANDI_SCHEMA_VERSION
 from django.db import transaction
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django_filters import rest_framework as filters
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotAuthenticated, NotFound, PermissionDenied
 from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.viewsets import GenericViewSet, ReadOnlyModelViewSet
 from rest_framework_extensions.mixins import DetailSerializerMixin, NestedViewSetMixin
 
-from dandiapi.api.asset_paths import search_asset_paths
+from dandiapi.api.asset_metadata import iter_full_metadata
+from dandiapi.api.asset_paths import get_subtree_leaves, search_asset_paths
 from dandiapi.api.models import Asset, AssetBlob, Dandiset, Version
 from dandiapi.api.models.asset import validate_asset_path
 from dandiapi.api.services.asset import (
+    AssetBatchItem,
     add_asset_to_version,
+    add_or_change_assets,
     change_asset,
     remove_asset_from_version,
+    remove_assets_from_version,
 )
 from dandiapi.api.services.asset.exceptions import DraftDandisetNotModifiableError
 from dandiapi.api.services.embargo.exceptions import DandisetUnembargoInProgressError
+from dandiapi.api.services.exceptions import DandiError
 from dandiapi.api.services.permissions.dandiset import (
-    is_dandiset_owner,
-    is_owned_asset,
+    OwnershipCache,
+    get_owned_assets,
     require_dandiset_owner_or_403,
 )
 from dandiapi.api.views.common import (
     ASSET_ID_PARAM,
     VERSIONS_DANDISET_PK_PARAM,
     VERSIONS_VERSION_PARAM,
+    conditional_get,
+    make_etag,
 )
-from dandiapi.api.views.pagination import DandiPagination, LazyPagination
+from dandiapi.api.views.pagination import AssetPathPagination, DandiPagination, KeysetPagination
 from dandiapi.api.views.serializers import (
     AssetDetailSerializer,
     AssetDownloadQueryParameterSerializer,
     AssetListSerializer,
+    AssetMetadataBatchRequestSerializer,
+    AssetMetadataStreamQuerySerializer,
     AssetPathsQueryParameterSerializer,
     AssetPathsSerializer,
+    AssetPathsTreeQueryParameterSerializer,
     AssetSerializer,
     AssetValidationSerializer,
 )
 from dandiapi.zarr.models import ZarrArchive
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from uuid import UUID
+
     from django.contrib.auth.models import User
+    from django.db.models import QuerySet
+
+    from dandiapi.api.models import AssetPath
+    from dandiapi.storage import DandiS3Storage
+
+# The number of rows fetched from the server-side cursor at a time when streaming asset paths
+SUBTREE_STREAM_CHUNK_SIZE = 2000
+
+# The number of seconds after which a stream of asset paths is cut short, within the worker timeout
+SUBTREE_STREAM_TIME_LIMIT = 10
+
+
+def stream_subtree_leaves(leaves: QuerySet[AssetPath], url: str) -> Iterator[str]:
+    """
+    Yield one line of JSON for each leaf, describing the asset it points to.
+
+    If the time limit is reached before every leaf is sent, the final line is instead an object
+    with a `next` URL, which resumes the stream from the last leaf sent.
+    """
+    deadline = time.monotonic() + SUBTREE_STREAM_TIME_LIMIT
+    rows = leaves.values_list(
+        'path',
+        'asset__asset_id',
+        'asset__blob__size',
+        'asset__blob__etag',
+        'asset__blob__sha256',
+        'asset__zarr__size',
+        'asset__zarr__checksum',
+    ).iterator(chunk_size=SUBTREE_STREAM_CHUNK_SIZE)
+    for path, asset_id, blob_size, etag, sha256, zarr_size, checksum in rows:
+        # Match the digest of `Asset.digest`, without loading each asset
+        if etag is not None:
+            size = blob_size
+            digest = {'dandi:dandi-etag': etag}
+            if sha256:
+                digest['dandi:sha2-256'] = sha256
+        else:
+            size = zarr_size
+            digest = {'dandi:dandi-zarr-checksum': checksum}
+
+        line = {'path': path, 'asset_id': str(asset_id), 'size': size, 'digest': digest}
+        yield json.dumps(line) + '\n'
+        if time.monotonic() > deadline:
+            yield json.dumps({'next': replace_query_param(url, 'after', path)}) + '\n'
+            return
+
+
+# The number of assets fetched from the server-side cursor, and sent, at a time when streaming
+# asset metadata
+ASSET_METADATA_STREAM_CHUNK_SIZE = 500
+
+# The number of seconds after which a metadata stream is cut short, within the worker timeout
+ASSET_METADATA_STREAM_TIME_LIMIT = 10
+
+
+def stream_asset_metadata(assets: QuerySet[Asset], url: str) -> Iterator[str]:
+    """
+    Yield the full metadata of each asset as newline-delimited JSON, in chunks of many lines.
+
+    If the time limit is reached before every asset is sent, the final line is instead an object
+    with a `next` URL, which resumes the stream from the last asset sent.
+    """
+    deadline = time.monotonic() + ASSET_METADATA_STREAM_TIME_LIMIT
+    lines: list[str] = []
+    for metadata in iter_full_metadata(assets, chunk_size=ASSET_METADATA_STREAM_CHUNK_SIZE):
+        lines.append(json.dumps(metadata) + '\n')
+        if len(lines) < ASSET_METADATA_STREAM_CHUNK_SIZE:
+            continue
+
+        # Yielding many lines at once also allows the gzip middleware to compress them together
+        yield ''.join(lines)
+        lines = []
+        if time.monotonic() > deadline:
+            yield json.dumps({'next': replace_query_param(url, 'after', metadata['path'])}) + '\n'
+            return
+
+    if lines:
+        yield ''.join(lines)
+
+
+def compile_glob(pattern: str) -> tuple[str, str | None]:
+    """
+    Split a glob pattern into its literal prefix and a regex matching the entire pattern.
+
+    The prefix can be matched using the path index, leaving the regex to check only the rows that
+    share it. If the pattern contains no wildcards, the regex is None and the prefix is the
+    entire path.
+    """
+    prefix, wildcard, _ = pattern.partition('*')
+    if not wildcard:
+        return pattern, None
+
+    # Escape special characters in the glob pattern. This is a security precaution taken since we
+    # are using postgres' regex search. A malicious user who knows this could include a regex as
+    # part of the glob expression, which postgres would happily parse and use if it's not escaped.
+    return prefix, '^' + '.*'.join(re.escape(part) for part in pattern.split('*')) + '$'
+
+
+def filter_glob(queryset: QuerySet[Asset], pattern: str, *, case_sensitive: bool):
+    prefix, regex = compile_glob(pattern)
+    if not case_sensitive:
+        # The trigram index on the path supports case insensitive regexes, including the prefix
+        return queryset.filter(path__iregex=regex or f'^{re.escape(prefix)}$')
+    if regex is None:
+        return queryset.filter(path=prefix)
+    if prefix:
+        queryset = queryset.filter(path__startswith=prefix)
+    return queryset.filter(path__regex=regex)
+
+
+def asset_conditional_get_kwargs(asset: Asset) -> dict:
+    """Get the validators and caching of responses containing the metadata of an asset."""
+    # The computed fields of the metadata can change without the asset being modified
+    computed = asset.computed_metadata
+    if computed is None:
+        computed = asset.compute_metadata()
+
+    return {
+        'etag': make_etag(asset.asset_id, asset.modified, json.dumps(computed, sort_keys=True)),
+        # Published assets are never modified
+        'last_modified': asset.modified if asset.published else None,
+        'published': asset.published,
+        'private': asset.is_embargoed,
+    }
 
 
 class AssetFilter(filters.FilterSet):
-    path = filters.CharFilter(lookup_expr='istartswith')
+    path = filters.CharFilter(method='filter_path')
     order = filters.OrderingFilter(fields=['created', 'modified', 'path'])
 
     class Meta:
         model = Asset
         fields = ['path']
 
+    def filter_path(self, queryset, name, value):
+        # A case sensitive prefix is answered by the C-collated path index, and a case insensitive
+        # one by the index on the upper case path
+        case_sensitive = serializers.BooleanField().to_internal_value(
+            self.data.get('case_sensitive', False)
+        )
+        lookup = 'startswith' if case_sensitive else 'istartswith'
+        return queryset.filter(**{f'{name}__{lookup}': value})
+
 
 class AssetViewSet(DetailSerializerMixin, GenericViewSet):
     queryset = Asset.objects.all().select_related('zarr').order_by('created')
@@ -73,15 +224,23 @@ class AssetViewSet(DetailSerializerMixin, GenericViewSet):
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = AssetFilter
 
+    @cached_property
+    def ownership(self) -> OwnershipCache:
+        # A view instance only handles a single request, so this is scoped to the request
+        return OwnershipCache(self.request.user)
+
+    @cached_property
+    def asset(self) -> Asset:
+        """The asset being requested, fetched once per request."""
+        return get_object_or_404(
+            Asset.objects.select_related('blob', 'zarr', 'zarr__dandiset'),
+            asset_id=self.kwargs['asset_id'],
+        )
+
     def raise_if_unauthorized(self):
         # We need to check the dandiset to see if it's embargoed, and if so whether or not the
         # user has ownership
-        asset_id = self.kwargs.get('asset_id')
-        if asset_id is None:
-            return
-
-        asset = get_object_or_404(Asset.objects.select_related('blob', 'zarr'), asset_id=asset_id)
-        if not asset.is_embargoed:
+        if not self.asset.is_embargoed:
             return
 
         # Clients must be authenticated to access it
@@ -94,13 +253,15 @@ class AssetViewSet(DetailSerializerMixin, GenericViewSet):
             return
 
         # User must be an owner on any of the dandisets this asset belongs to
-        is_owned = is_owned_asset(asset, self.request.user)
+        is_owned = self.ownership.is_owned_asset(self.asset)
         if not is_owned:
             raise PermissionDenied
 
-    def get_queryset(self):
+    # The asset fetched to authorize the request is the one returned, rather than fetching it again
+    def get_object(self):
         self.raise_if_unauthorized()
-        return super().get_queryset()
+        self.check_object_permissions(self.request, self.asset)
+        return self.asset
 
     @swagger_auto_schema(
         responses={
@@ -110,7 +271,51 @@ class AssetViewSet(DetailSerializerMixin, GenericViewSet):
     )
     def retrieve(self, request, **kwargs):
         asset = self.get_object()
-        return Response(asset.full_metadata)
+        return conditional_get(
+            request, lambda: Response(asset.full_metadata), **asset_conditional_get_kwargs(asset)
+        )
+
+    @swagger_auto_schema(
+        request_body=AssetMetadataBatchRequestSerializer,
+        responses={
+            200: 'The metadata of each asset, in the order requested. '
+            'Asset IDs which do not exist are omitted.',
+        },
+        operation_summary='Get the metadata of many assets',
+    )
+    # This only reads metadata, so unlike other POST requests it's open to anonymous users. Access
+    # to embargoed assets is checked below.
+    @action(methods=['POST'], detail=False, url_path='metadata', permission_classes=[AllowAny])
+    def metadata_batch(self, request):
+        serializer = AssetMetadataBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        asset_ids = serializer.validated_data['asset_ids']
+
+        assets = {
+            asset.asset_id: asset
+            for asset in Asset.objects.select_related('blob', 'zarr', 'zarr__dandiset').filter(
+                asset_id__in=asset_ids
+            )
+        }
+
+        # Check access to all embargoed assets at once, as is done for a single asset
+        embargoed = [asset.id for asset in assets.values() if asset.is_embargoed]
+        if embargoed:
+            if not request.user.is_authenticated:
+                raise NotAuthenticated
+            if not request.user.is_superuser:
+                owned = get_owned_assets(Asset.objects.filter(id__in=embargoed), request.user)
+                if owned.count() != len(embargoed):
+                    raise PermissionDenied
+
+        embargo_end_dates = Asset.get_embargo_end_dates(assets.values())
+        return Response(
+            [
+                assets[asset_id].get_full_metadata(embargo_end_dates)
+                for asset_id in asset_ids
+                if asset_id in assets
+            ]
+        )
 
     @swagger_auto_schema(
         method='GET',
@@ -144,9 +349,11 @@ class AssetViewSet(DetailSerializerMixin, GenericViewSet):
         content_type = asset.metadata.get('encodingFormat', 'application/octet-stream')
         asset_basename = asset.path.split('/')[-1]
 
+        # Presigned URLs are reused for a short time, as popular assets are downloaded often
+        storage = cast('DandiS3Storage', asset_blob.blob.storage)
         if content_disposition == 'attachment':
             return HttpResponseRedirect(
-                asset_blob.blob.storage.url(
+                storage.cached_url(
                     asset_blob.blob.name,
                     parameters={
                         'ResponseContentDisposition': f'attachment; filename="{asset_basename}"',
@@ -154,7 +361,7 @@ class AssetViewSet(DetailSerializerMixin, GenericViewSet):
                 )
             )
         if content_disposition == 'inline':
-            url = asset_blob.blob.storage.url(
+            url = storage.cached_url(
                 asset_blob.blob.name,
                 parameters={
                     'ResponseContentDisposition': f'inline; filename="{asset_basename}"',
@@ -182,10 +389,13 @@ class AssetViewSet(DetailSerializerMixin, GenericViewSet):
         responses={200: AssetDetailSerializer},
     )
     @action(methods=['GET', 'HEAD'], detail=True)
-    def info(self, *args, **kwargs):
+    def info(self, request, *args, **kwargs):
         asset = self.get_object()
-        serializer = AssetDetailSerializer(instance=asset)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return conditional_get(
+            request,
+            lambda: Response(AssetDetailSerializer(instance=asset).data, status=status.HTTP_200_OK),
+            **asset_conditional_get_kwargs(asset),
+        )
 
 
 class AssetRequestSerializer(serializers.Serializer):
@@ -224,34 +434,116 @@ class AssetRequestSerializer(serializers.Serializer):
         return data
 
 
+# The most assets that can be created or updated by a single batch request
+ASSET_BATCH_MAX_SIZE = 500
+
+
+class AssetBatchItemSerializer(AssetRequestSerializer):
+    asset_id = serializers.UUIDField(
+        required=False, help_text='The asset to update. If omitted, a new asset is created.'
+    )
+
+
+class AssetBatchRequestSerializer(serializers.Serializer):
+    # Each item is validated separately by AssetBatchItemSerializer, so that it can fail on its own
+    assets = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=ASSET_BATCH_MAX_SIZE,
+        help_text='The `blob_id` or `zarr_id` and `metadata` of each asset, and an `asset_id` if '
+        'updating one.',
+    )
+
+
+# The most assets that can be removed by listing their IDs in a single request
+ASSET_BULK_REMOVE_MAX_SIZE = 10_000
+
+
+class AssetBulkRemoveSerializer(serializers.Serializer):
+    asset_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+        max_length=ASSET_BULK_REMOVE_MAX_SIZE,
+    )
+    path_prefix = serializers.CharField(
+        required=False, help_text='Remove every asset within this folder, at any depth.'
+    )
+
+    def validate(self, data):
+        """Ensure asset_ids and path_prefix are mutually exclusive."""
+        if ('asset_ids' in data) == ('path_prefix' in data):
+            raise serializers.ValidationError(
+                {'asset_ids': 'Exactly one of asset_ids or path_prefix must be specified.'}
+            )
+        return data
+
+
+def _batch_error(status_code: int, detail) -> dict:
+    return {'status': status_code, 'detail': detail}
+
+
+def _resolve_batch_item(
+    data: dict,
+    *,
+    blobs: dict[UUID, AssetBlob],
+    zarrs: dict[UUID, ZarrArchive],
+    assets: dict[UUID, Asset],
+) -> AssetBatchItem | dict:
+    """Return the batch item described by validated data, or the error to respond with."""
+    item = AssetBatchItem(metadata=data['metadata'])
+    if 'blob_id' in data:
+        item.asset_blob = blobs.get(data['blob_id'])
+        if item.asset_blob is None:
+            return _batch_error(status.HTTP_404_NOT_FOUND, 'Blob not found.')
+    if 'zarr_id' in data:
+        item.zarr_archive = zarrs.get(data['zarr_id'])
+        if item.zarr_archive is None:
+            return _batch_error(status.HTTP_404_NOT_FOUND, 'Zarr archive not found.')
+    if 'asset_id' in data:
+        item.asset = assets.get(data['asset_id'])
+        if item.asset is None:
+            return _batch_error(status.HTTP_404_NOT_FOUND, 'Asset not found in this version.')
+
+    return item
+
+
 class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet):
     pagination_class = DandiPagination
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = AssetFilter
 
-    def raise_if_unauthorized(self):
-        version = get_object_or_404(
+    # Fetching the metadata of assets by ID isn't specific to a version, and its route would
+    # otherwise shadow the metadata stream of the version
+    metadata_batch = None  # type: ignore[assignment]
+
+    @cached_property
+    def version(self) -> Version:
+        """The version of the request URL, fetched once per request."""
+        return get_object_or_404(
             Version.objects.select_related('dandiset'),
             dandiset__pk=self.kwargs['versions__dandiset__pk'],
             version=self.kwargs['versions__version'],
         )
+
+    @cached_property
+    def asset(self) -> Asset:
+        """The asset being requested, which must belong to the version of the request URL."""
+        return get_object_or_404(
+            self.version.assets.select_related('blob', 'zarr', 'zarr__dandiset'),
+            asset_id=self.kwargs['asset_id'],
+        )
+
+    def raise_if_unauthorized(self):
+        version = self.version
         if version.dandiset.embargo_status != Dandiset.EmbargoStatus.OPEN:
             if not self.request.user.is_authenticated:
                 # Clients must be authenticated to access it
                 raise NotAuthenticated
-            if not is_dandiset_owner(version.dandiset, self.request.user):
+            if not self.ownership.is_dandiset_owner(version.dandiset):
                 # The user does not have ownership permission
                 raise PermissionDenied
 
-    # Override this here to prevent the need for raise_if_unauthorized to exist in get_queryset
-    def get_object(self):
-        self.raise_if_unauthorized()
-        return super().get_object()
-
-    # Override this to skip the call to raise_if_unauthorized in AssetViewSet
-    def get_queryset(self):
-        return super(AssetViewSet, self).get_queryset()
-
     # Redefine info and download actions to update swagger manual_parameters
 
     @swagger_auto_schema(
@@ -265,9 +557,9 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
         responses={200: AssetDetailSerializer},
     )
     @action(detail=True, methods=['GET'])
-    def info(self, *args, **kwargs):
+    def info(self, request, *args, **kwargs):
         """Django serialization of an asset."""
-        return super().info()
+        return super().info(request)
 
     @swagger_auto_schema(
         method='GET',
@@ -319,11 +611,7 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
     )
     @require_dandiset_owner_or_403('versions__dandiset__pk')
     def create(self, request, versions__dandiset__pk, versions__version):
-        version: Version = get_object_or_404(
-            Version.objects.select_related('dandiset'),
-            dandiset=versions__dandiset__pk,
-            version=versions__version,
-        )
+        version = self.version
 
         if version.dandiset.unembargo_in_progress:
             raise DandisetUnembargoInProgressError
@@ -354,11 +642,7 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
     @require_dandiset_owner_or_403('versions__dandiset__pk')
     def update(self, request, versions__dandiset__pk, versions__version, **kwargs):
         """Create an asset with updated metadata."""
-        version: Version = get_object_or_404(
-            Version.objects.select_related('dandiset'),
-            dandiset__pk=versions__dandiset__pk,
-            version=versions__version,
-        )
+        version = self.version
         if version.version != 'draft':
             raise DraftDandisetNotModifiableError
         if version.dandiset.unembargo_in_progress:
@@ -392,11 +676,7 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
                                Only draft versions can be modified.',
     )
     def destroy(self, request, versions__dandiset__pk, versions__version, **kwargs):
-        version = get_object_or_404(
-            Version.objects.select_related('dandiset'),
-            dandiset__pk=versions__dandiset__pk,
-            version=versions__version,
-        )
+        version = self.version
         if version.dandiset.unembargo_in_progress:
             raise DandisetUnembargoInProgressError
 
@@ -409,6 +689,132 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
 
         return Response(None, status=status.HTTP_204_NO_CONTENT)
 
+    @swagger_auto_schema(
+        request_body=AssetBatchRequestSerializer,
+        responses={
+            200: 'The outcome of each item, in the order given. This is either the `status` 200 '
+            'and the resulting `asset`, or the `status` and `detail` of the error the item failed '
+            'with.',
+        },
+        manual_parameters=[VERSIONS_DANDISET_PK_PARAM, VERSIONS_VERSION_PARAM],
+        operation_summary='Create or update many assets.',
+        operation_description='Each item is handled as the create endpoint would, or as the update\
+                               endpoint would if it has an `asset_id`, and fails independently of\
+                               the others. All assets are added in a single transaction.\
+                               User must be an owner of the specified dandiset.\
+                               Only draft versions can be modified.',
+    )
+    @action(methods=['POST'], detail=False, filter_backends=[])
+    @require_dandiset_owner_or_403('versions__dandiset__pk')
+    def batch(self, request, versions__dandiset__pk, versions__version, **kwargs):
+        version = self.version
+        if version.version != 'draft':
+            raise DraftDandisetNotModifiableError
+        if version.dandiset.unembargo_in_progress:
+            raise DandisetUnembargoInProgressError
+
+        request_serializer = AssetBatchRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        item_serializers = [
+            AssetBatchItemSerializer(data=item)
+            for item in request_serializer.validated_data['assets']
+        ]
+        valid = [
+            serializer.validated_data for serializer in item_serializers if serializer.is_valid()
+        ]
+
+        # Look up the blobs, zarr archives and assets of every item at once
+        blobs = {
+            blob.blob_id: blob
+            for blob in AssetBlob.objects.filter(
+                blob_id__in=[data['blob_id'] for data in valid if 'blob_id' in data]
+            )
+        }
+        zarrs = {
+            zarr.zarr_id: zarr
+            for zarr in ZarrArchive.objects.select_related('dandiset').filter(
+                zarr_id__in=[data['zarr_id'] for data in valid if 'zarr_id' in data]
+            )
+        }
+        assets = {
+            asset.asset_id: asset
+            for asset in version.assets.select_related('blob', 'zarr', 'zarr__dandiset').filter(
+                asset_id__in=[data['asset_id'] for data in valid if 'asset_id' in data]
+            )
+        }
+
+        results: list[dict] = [{} for _ in item_serializers]
+        items: list[AssetBatchItem] = []
+        item_indexes: list[int] = []
+        seen_asset_ids = set()
+        for i, serializer in enumerate(item_serializers):
+            if serializer.errors:
+                results[i] = _batch_error(status.HTTP_400_BAD_REQUEST, serializer.errors)
+                continue
+
+            asset_id = serializer.validated_data.get('asset_id')
+            if asset_id is not None and asset_id in seen_asset_ids:
+                results[i] = _batch_error(
+                    status.HTTP_400_BAD_REQUEST, 'The asset is updated by another item.'
+                )
+                continue
+            seen_asset_ids.add(asset_id)
+
+            item = _resolve_batch_item(
+                serializer.validated_data, blobs=blobs, zarrs=zarrs, assets=assets
+            )
+            if isinstance(item, dict):
+                results[i] = item
+            else:
+                items.append(item)
+                item_indexes.append(i)
+
+        outcomes = add_or_change_assets(user=request.user, version=version, items=items)
+
+        # Look up the embargo end dates of all resulting assets at once
+        context = self.get_serializer_context()
+        context['embargo_end_dates'] = Asset.get_embargo_end_dates(
+            [outcome for outcome in outcomes if isinstance(outcome, Asset)]
+        )
+        for i, outcome in zip(item_indexes, outcomes, strict=True):
+            if isinstance(outcome, DandiError):
+                results[i] = _batch_error(outcome.http_status_code, outcome.message)
+            else:
+                results[i] = {
+                    'status': status.HTTP_200_OK,
+                    'asset': AssetDetailSerializer(instance=outcome, context=context).data,
+                }
+
+        return Response(results, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        request_body=AssetBulkRemoveSerializer,
+        responses={200: 'The number of assets `removed`.'},
+        manual_parameters=[VERSIONS_DANDISET_PK_PARAM, VERSIONS_VERSION_PARAM],
+        operation_summary='Remove many assets from a version.',
+        operation_description='Removes the listed assets, or every asset within a folder, at once.\
+                               Assets are never deleted, only disassociated from a version.\
+                               User must be an owner of the specified dandiset.\
+                               Only draft versions can be modified.',
+    )
+    @action(methods=['POST'], detail=False, filter_backends=[], url_path='remove')
+    @require_dandiset_owner_or_403('versions__dandiset__pk')
+    def bulk_destroy(self, request, versions__dandiset__pk, versions__version, **kwargs):
+        version = self.version
+        if version.dandiset.unembargo_in_progress:
+            raise DandisetUnembargoInProgressError
+
+        serializer = AssetBulkRemoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if 'asset_ids' in serializer.validated_data:
+            assets = Asset.objects.filter(asset_id__in=serializer.validated_data['asset_ids'])
+        else:
+            folder = serializer.validated_data['path_prefix'].rstrip('/')
+            assets = version.assets.filter(path__startswith=f'{folder}/')
+
+        removed = remove_assets_from_version(user=request.user, version=version, assets=assets)
+        return Response({'removed': removed}, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(query_serializer=AssetListSerializer, responses={200: AssetSerializer})
     def list(self, request, *args, **kwargs):
         # Manually call this to ensure user is authorized
@@ -418,13 +824,23 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
         serializer.is_valid(raise_exception=True)
 
         # Retrieve version first and then fetch assets, to remove a join
-        version = Version.objects.get(
-            dandiset__pk=self.kwargs['versions__dandiset__pk'],
-            version=self.kwargs['versions__version'],
-        )
+        version = self.version
+
+        # The assets of published versions never change, so neither does any page of them
+        if version.version != 'draft':
+            return conditional_get(
+                request,
+                lambda: self._list_assets(version, serializer),
+                etag=make_etag(version.id, version.modified, sorted(request.query_params.lists())),
+                last_modified=version.modified,
+                published=True,
+            )
+
+        return self._list_assets(version, serializer)
 
+    def _list_assets(self, version: Version, serializer: AssetListSerializer):
         # Use custom pagination class to reduce unnecessary counts of assets
-        paginator = LazyPagination()
+        paginator = KeysetPagination()
 
         # Apply filtering from included filter class first
         asset_queryset = self.filter_queryset(version.assets.all())
@@ -444,17 +860,16 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
 
         # Must do glob pattern matching before pagination
         glob_pattern: str | None = serializer.validated_data.get('glob')
+        case_sensitive = serializer.validated_data['case_sensitive']
         if glob_pattern is not None:
-            # Escape special characters in the glob pattern. This is a security precaution taken
-            # since we are using postgres' regex search. A malicious user who knows this could
-            # include a regex as part of the glob expression, which postgres would happily parse
-            # and use if it's not escaped.
-            glob_pattern = f'^{re.escape(glob_pattern)}$'
-            asset_queryset = asset_queryset.filter(path__iregex=glob_pattern.replace('\\*', '.*'))
+            asset_queryset = filter_glob(
+                asset_queryset, glob_pattern, case_sensitive=case_sensitive
+            )
 
         # Retrieve just the first N asset IDs, and use them for pagination
-        qs = asset_queryset.values_list('id', flat=True)
-        page_of_asset_ids = paginator.paginate_queryset(qs, request=self.request, view=self)
+        page_of_asset_ids = paginator.paginate_queryset(
+            asset_queryset, request=self.request, view=self
+        )
 
         # Not sure when the page is ever None, but this condition is checked for compatibility with
         # the original implementation: https://github.com/encode/django-rest-framework/blob/f4194c4684420ac86485d9610adf760064db381f/rest_framework/mixins.py#L37-L46
@@ -468,14 +883,24 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
         queryset = self.filter_queryset(
             Asset.objects.filter(id__in=page_of_asset_ids).select_related('blob', 'zarr')
         )
+        if paginator.cursor is not None:
+            queryset = queryset.order_by(*paginator.get_ordering())
 
         # Must apply this to the main queryset, since it affects the data returned
         include_metadata = serializer.validated_data['metadata']
         if not include_metadata:
-            queryset = queryset.defer('metadata')
+            queryset = queryset.defer('metadata', 'computed_metadata')
+
+        # Look up the embargo end dates of the whole page at once
+        context = self.get_serializer_context()
+        if include_metadata:
+            queryset = list(queryset)
+            context['embargo_end_dates'] = Asset.get_embargo_end_dates(queryset)
 
         # Paginate and return
-        serializer = self.get_serializer(queryset, many=True, metadata=include_metadata)
+        serializer = self.get_serializer(
+            queryset, many=True, metadata=include_metadata, context=context
+        )
         return paginator.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
@@ -497,25 +922,91 @@ class NestedAssetViewSet(NestedViewSetMixin, AssetViewSet, ReadOnlyModelViewSet)
         self.raise_if_unauthorized()
 
         # Fetch version
-        version = get_object_or_404(
-            Version,
-            dandiset__pk=versions__dandiset__pk,
-            version=versions__version,
-        )
+        version = self.version
 
         # Fetch child paths
+        # Only include paths after the cursor, if paginating by one
         path: str = query_serializer.validated_data['path_prefix']
-        children_paths = search_asset_paths(path, version)
+        after: str | None = query_serializer.validated_data.get('after')
+        children_paths = search_asset_paths(path, version, after=after)
         if children_paths is None:
             raise NotFound('Specified path not found.')
 
         # Paginate and return
-        page = self.paginate_queryset(children_paths)
-        if page is not None:
-            serializer = AssetPathsSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        paginator = AssetPathPagination()
+        page = paginator.paginate_queryset(children_paths, request=self.request, view=self)
+        serializer = AssetPathsSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(
+        query_serializer=AssetPathsTreeQueryParameterSerializer,
+        responses={
+            200: 'One line of JSON per asset, with its path, asset ID, size and digest. If the '
+            'stream is cut short, the last line is instead an object with a `next` URL to resume '
+            'it from.'
+        },
+    )
+    @action(detail=False, methods=['GET'], filter_backends=[], url_path='paths/tree')
+    def paths_tree(self, request, versions__dandiset__pk, versions__version, **kwargs):
+        """
+        Stream every asset within the specified folder, at any depth, as newline-delimited JSON.
+
+        Assets are streamed in path order. If the stream is cut short, the last line is instead an
+        object with a `next` URL to resume it from. An interrupted stream can also be resumed by
+        passing the last path received as `after`.
+        """
+        query_serializer = AssetPathsTreeQueryParameterSerializer(data=self.request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        # Permission check
+        self.raise_if_unauthorized()
+
+        # Fetch version
+        version = self.version
 
-        serializer = AssetPathsSerializer(children_paths, many=True)
-        return Response(serializer.data)
+        # Fetch all leaves within the folder
+        path: str = query_serializer.validated_data['path_prefix']
+        after: str | None = query_serializer.validated_data.get('after')
+        leaves = get_subtree_leaves(path, version, after=after)
+        if leaves is None:
+            raise NotFound('Specified path not found.')
+
+        return StreamingHttpResponse(
+            stream_subtree_leaves(leaves, request.build_absolute_uri()),
+            content_type='application/x-ndjson',
+        )
+
+    @swagger_auto_schema(
+        query_serializer=AssetMetadataStreamQuerySerializer,
+        responses={
+            200: 'One line of JSON per asset, containing its full metadata. If the stream is cut '
+            'short, the last line is instead an object with a `next` URL to resume it from.'
+        },
+    )
+    @action(detail=False, methods=['GET'], filter_backends=[], url_path='metadata')
+    def metadata_stream(self, request, versions__dandiset__pk, versions__version, **kwargs):
+        """
+        Stream the full metadata of every asset in this version as newline-delimited JSON.
+
+        Assets are streamed in path order. The response is gzip compressed if requested through
+        the `Accept-Encoding` header.
+        """
+        query_serializer = AssetMetadataStreamQuerySerializer(data=self.request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        # Permission check
+        self.raise_if_unauthorized()
+
+        version = self.version
+        assets = version.assets.select_related('blob', 'zarr', 'zarr__dandiset').order_by('path')
+
+        after: str | None = query_serializer.validated_data.get('after')
+        if after is not None:
+            assets = assets.filter(path__gt=after)
+
+        return StreamingHttpResponse(
+            stream_asset_metadata(assets, request.build_absolute_uri()),
+            content_type='application/x-ndjson',
+        )
 
     # TODO: add create to forge an asset from a validation
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.http import http_date
 from drf_yasg import openapi
 
 from dandiapi.api.views.pagination import DandiPagination
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    import datetime
+
+    from django.http import HttpResponseBase
+    from rest_framework.request import Request
+
+# The number of seconds clients and caches may reuse published metadata without revalidating it
+PUBLISHED_MAX_AGE = 24 * 60 * 60
+
 ASSET_ID_PARAM = openapi.Parameter(
     'asset_id',
     openapi.IN_PATH,
@@ -66,3 +81,47 @@ PAGINATION_PARAMS = [
         default=DandiPagination.page_size,
     ),
 ]
+
+
+def make_etag(*parts: object) -> str:
+    """Make an ETag which changes whenever any of the parts do."""
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def conditional_get(  # noqa: PLR0913
+    request: Request,
+    get_response: Callable[[], HttpResponseBase],
+    *,
+    etag: str,
+    last_modified: datetime.datetime | None = None,
+    published: bool = False,
+    private: bool = False,
+) -> HttpResponseBase:
+    """
+    Respond with 304 Not Modified if the client already has the current representation.
+
+    The response is only created by `get_response` if the client doesn't have it. `etag` must
+    change whenever the response would, while `last_modified` should only be given if it changes
+    whenever the response would.
+    """
+    etag = quote_etag(etag)
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=None if last_modified is None else int(last_modified.timestamp()),
+    )
+    if response is None:
+        response = get_response()
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+
+    if published:
+        patch_cache_control(response, public=True, max_age=PUBLISHED_MAX_AGE)
+    elif private:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+
+    return response
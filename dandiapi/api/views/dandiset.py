@@ -25,7 +25,7 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from dandiapi.api.asset_paths import get_root_paths_many
 from dandiapi.api.mail import send_ownership_change_emails
 from dandiapi.api.models import Dandiset, Version
-from dandiapi.api.models.asset_paths import AssetPath
+from dandiapi.api.models.asset_paths import AssetPath, AssetPathAggregateDelta
 from dandiapi.api.models.dandiset import DandisetStar
 from dandiapi.api.services import audit
 from dandiapi.api.services.dandiset import (
@@ -113,19 +113,29 @@ class DandisetOrderingFilter(filters.OrderingFilter):
             latest_version = Version.objects.filter(dandiset=OuterRef('pk')).order_by('-created')[
                 :1
             ]
-            queryset = queryset.annotate(
-                size=Subquery(
-                    latest_version.annotate(
-                        size=Coalesce(
-                            Sum(
-                                'asset_paths__aggregate_size',
-                                filter=~Q(asset_paths__path__contains='/'),
-                            ),
-                            0,
-                        )
-                    ).values('size')
+            # The size of a version is the sum of its root paths, including any aggregate deltas
+            # not yet compacted into them, as in the listed version stats
+            root_size = (
+                AssetPath.objects.filter(version=OuterRef('latest_version'), depth=1)
+                .values('version')
+                .annotate(total=Sum('aggregate_size'))
+                .values('total')
+            )
+            pending_root_size = (
+                AssetPathAggregateDelta.objects.filter(
+                    path__version=OuterRef('latest_version'), path__depth=1
                 )
-            ).order_by(ordering)
+                .values('path__version')
+                .annotate(total=Sum('size'))
+                .values('total')
+            )
+            queryset = (
+                queryset.alias(latest_version=Subquery(latest_version.values('id')))
+                .annotate(
+                    size=Coalesce(Subquery(root_size), 0) + Coalesce(Subquery(pending_root_size), 0)
+                )
+                .order_by(ordering)
+            )
         elif ordering.endswith('stars'):
             prefix = '-' if ordering.startswith('-') else ''
             queryset = queryset.annotate(stars_count=Count('stars')).order_by(
@@ -329,11 +339,23 @@ class DandisetViewSet(ReadOnlyModelViewSet):
             .order_by()
         }
 
+        # Aggregate deltas not yet compacted into the root paths, grouped the same way
+        pending_stats = {
+            entry['path__version_id']: entry
+            for entry in AssetPathAggregateDelta.objects.filter(
+                path__in=get_root_paths_many(versions=relevant_versions)
+            )
+            .values('path__version_id')
+            .annotate(total_size=Sum('size'), num_assets=Sum('files'))
+            .order_by()
+        }
+
         def annotate_version(version: Version):
             """Annotate a version with its aggregate stats."""
             stats = version_stats.get(version.id, {'total_size': 0, 'num_assets': 0})
-            version.total_size = stats['total_size']
-            version.num_assets = stats['num_assets']
+            pending = pending_stats.get(version.id, {'total_size': 0, 'num_assets': 0})
+            version.total_size = stats['total_size'] + pending['total_size']
+            version.num_assets = stats['num_assets'] + pending['num_assets']
 
         # Create a map from dandiset IDs to their draft and published versions
         dandisets_to_versions = {}
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from collections import OrderedDict
+from datetime import datetime
+import json
 
 from django.core.paginator import Page, Paginator
+from django.db.models import F
+from django.db.models.fields.tuple_lookups import TupleGreaterThan, TupleLessThan
+from django.utils.dateparse import parse_datetime
 from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class DandiPagination(PageNumberPagination):
@@ -18,6 +27,57 @@ class DandiPagination(PageNumberPagination):
         return f'{super().page_size_query_description[:-1]} (maximum {self.max_page_size}).'
 
 
+class AssetPathPagination(DandiPagination):
+    """
+    Page number pagination, which can also page through asset paths by the last path seen.
+
+    If the `after` query parameter is given, the page contains the paths directly following it,
+    fetched through the (version, path) index rather than with an OFFSET, so that every page costs
+    the same regardless of its depth. The caller is responsible for filtering the queryset to the
+    paths after the cursor, in path order. Such pages link to the next page using their last path,
+    and don't include a count.
+    """
+
+    cursor_query_param = 'after'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = request.query_params.get(self.cursor_query_param)
+        if self.cursor is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        # Intentionally fetch one extra to see if there are any more pages left
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        self.results = results[:page_size]
+        return self.results
+
+    def get_next_link(self):
+        if self.cursor is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.results[-1].path)
+
+    def get_paginated_response(self, data) -> Response:
+        if self.cursor is None:
+            return super().get_paginated_response(data)
+
+        page_dict = OrderedDict(
+            [
+                ('count', None),
+                ('next', self.get_next_link()),
+                ('previous', None),
+                ('results', data),
+            ]
+        )
+        return Response(page_dict)
+
+
 """
 The below code provides a custom pagination implementation, as the existing `PageNumberPagination`
 class returns a `count` field for every page returned. This can be very inefficient on large tables,
@@ -107,3 +167,101 @@ class LazyPagination(PageNumberPagination):
         )
 
         return Response(page_dict)
+
+
+class KeysetPagination(LazyPagination):
+    """
+    Lazy page number pagination, which can also page through a queryset using opaque cursors.
+
+    If the `cursor` query parameter is given (empty for the first page), rows are ordered by the
+    field given in the `order` query parameter followed by their ID, and each page continues from
+    the last row of the previous one, using a row value comparison that the (field, id) indexes
+    can answer. No OFFSET is used, so every page costs the same to fetch. In either mode, the page
+    consists of the IDs of its rows.
+    """
+
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'order'
+    ordering_fields = ('created', 'modified', 'path')
+    default_ordering = 'created'
+    invalid_cursor_message = 'Invalid cursor'
+
+    @classmethod
+    def get_ordering_choices(cls) -> list[str]:
+        return [choice for field in cls.ordering_fields for choice in (field, f'-{field}')]
+
+    def get_ordering(self) -> tuple[str, str]:
+        ordering = self.request.query_params.get(self.ordering_query_param) or self.default_ordering
+        if ordering not in self.get_ordering_choices():
+            choices = ', '.join(self.get_ordering_choices())
+            raise ValidationError(
+                {self.ordering_query_param: f'Cursor pagination must order by one of: {choices}'}
+            )
+        return ordering, '-id' if ordering.startswith('-') else 'id'
+
+    def encode_cursor(self, value, pk: int) -> str:
+        # Encode datetimes in full, as DjangoJSONEncoder would truncate them to milliseconds
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        cursor = json.dumps([value, pk])
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    def decode_cursor(self, cursor: str, field: str) -> tuple:
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+        if field in {'created', 'modified'}:
+            value = parse_datetime(value) if isinstance(value, str) else None
+        if value is None or not isinstance(pk, int):
+            raise NotFound(self.invalid_cursor_message)
+
+        return value, pk
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = request.query_params.get(self.cursor_query_param)
+        if self.cursor is None:
+            return super().paginate_queryset(queryset.values_list('id', flat=True), request, view)
+
+        self.request = request
+        ordering, id_ordering = self.get_ordering()
+        field = ordering.lstrip('-')
+        queryset = queryset.order_by(ordering, id_ordering)
+
+        # Continue from the last row of the previous page, breaking ties on the ordered field by ID
+        if self.cursor:
+            value, pk = self.decode_cursor(self.cursor, field)
+            lookup = TupleLessThan if ordering.startswith('-') else TupleGreaterThan
+            queryset = queryset.filter(lookup((F(field), F('id')), (value, pk)))
+
+        # Intentionally fetch one extra to see if there are any more pages left
+        page_size = self.get_page_size(request)
+        rows = list(queryset.values_list('id', field)[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.rows = rows[:page_size]
+        return [pk for pk, _ in self.rows]
+
+    def get_next_link(self):
+        if self.cursor is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        pk, value = self.rows[-1]
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(value, pk))
+
+    def get_paginated_response(self, data) -> Response:
+        if self.cursor is None:
+            return super().get_paginated_response(data)
+
+        page_dict = OrderedDict(
+            [
+                ('count', None),
+                ('next', self.get_next_link()),
+                ('previous', None),
+                ('results', data),
+            ]
+        )
+        return Response(page_dict)
@@ -465,10 +465,34 @@ class AssetValidationSerializer(serializers.ModelSerializer):
         fields = ['status', 'validation_errors']
 
 
+# The maximum number of assets whose metadata can be requested at once
+ASSET_METADATA_BATCH_MAX_SIZE = 1000
+
+
+class AssetMetadataBatchRequestSerializer(serializers.Serializer):
+    asset_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=ASSET_METADATA_BATCH_MAX_SIZE,
+    )
+
+
 class AssetDownloadQueryParameterSerializer(serializers.Serializer):
     content_disposition = serializers.ChoiceField(['attachment', 'inline'], default='attachment')
 
 
+class AssetMetadataField(serializers.JSONField):
+    """
+    The full metadata of an asset.
+
+    To avoid querying the embargo end date of each asset separately, the serializer context may
+    contain `embargo_end_dates`, from `Asset.get_embargo_end_dates`.
+    """
+
+    def get_attribute(self, instance: Asset):
+        return instance.get_full_metadata(self.context.get('embargo_end_dates'))
+
+
 class AssetSerializer(serializers.ModelSerializer):
     class Meta:
         model = Asset
@@ -486,7 +510,7 @@ class AssetSerializer(serializers.ModelSerializer):
 
     blob = serializers.SlugRelatedField(slug_field='blob_id', read_only=True)
     zarr = serializers.SlugRelatedField(slug_field='zarr_id', read_only=True)
-    metadata = serializers.JSONField(source='full_metadata')
+    metadata = AssetMetadataField()
 
     def __init__(self, *args, metadata=True, **kwargs):
         # Instantiate the superclass normally
@@ -504,12 +528,43 @@ class AssetDetailSerializer(AssetSerializer):
 
 class AssetListSerializer(serializers.Serializer):
     glob = serializers.CharField(required=False)
+    case_sensitive = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text='Match the `path` prefix and `glob` pattern case sensitively.',
+    )
     metadata = serializers.BooleanField(required=False, default=False)
     zarr = serializers.BooleanField(required=False, default=False)
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text=(
+            'Paginate by cursor instead of page number. Pass an empty cursor for the first page, '
+            'then follow the `next` link of each page.'
+        ),
+    )
 
 
 class AssetPathsQueryParameterSerializer(serializers.Serializer):
     path_prefix = serializers.CharField(default='')
+    after = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text='Return the paths following this one, instead of paginating by page number.',
+    )
+
+
+class AssetPathsTreeQueryParameterSerializer(serializers.Serializer):
+    path_prefix = serializers.CharField(default='')
+    after = serializers.CharField(
+        required=False, help_text='Resume the stream from the path following this one.'
+    )
+
+
+class AssetMetadataStreamQuerySerializer(serializers.Serializer):
+    after = serializers.CharField(
+        required=False, help_text='Resume the stream from the path following this one.'
+    )
 
 
 class PaginationQuerySerializer(serializers.Serializer):
@@ -536,4 +591,6 @@ class AssetPathsSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created']
 
+    aggregate_files = serializers.IntegerField(source='total_files')
+    aggregate_size = serializers.IntegerField(source='total_size')
     asset = AssetFileSerializer()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cached_property
+
 from django.db import transaction
 from django_filters import rest_framework as filters
 from drf_yasg.utils import swagger_auto_schema
@@ -15,12 +17,17 @@ from dandiapi.api.models import Dandiset, Version
 from dandiapi.api.services import audit
 from dandiapi.api.services.embargo.exceptions import DandisetUnembargoInProgressError
 from dandiapi.api.services.permissions.dandiset import (
-    is_dandiset_owner,
+    OwnershipCache,
     require_dandiset_owner_or_403,
 )
 from dandiapi.api.services.publish import publish_dandiset
 from dandiapi.api.tasks import delete_doi_task
-from dandiapi.api.views.common import DANDISET_PK_PARAM, VERSION_PARAM
+from dandiapi.api.views.common import (
+    DANDISET_PK_PARAM,
+    VERSION_PARAM,
+    conditional_get,
+    make_etag,
+)
 from dandiapi.api.views.pagination import DandiPagination
 from dandiapi.api.views.serializers import (
     PublishVersionSerializer,
@@ -51,15 +58,25 @@ class VersionViewSet(NestedViewSetMixin, DetailSerializerMixin, ReadOnlyModelVie
     lookup_field = 'version'
     lookup_value_regex = Version.VERSION_REGEX
 
+    @cached_property
+    def ownership(self) -> OwnershipCache:
+        # A view instance only handles a single request, so this is scoped to the request
+        return OwnershipCache(self.request.user)
+
+    @cached_property
+    def dandiset(self) -> Dandiset:
+        """The dandiset of the request URL, fetched once per request."""
+        return get_object_or_404(Dandiset, pk=self.kwargs['dandiset__pk'])
+
     def get_queryset(self):
         # We need to check the dandiset to see if it's embargoed, and if so whether or not the
         # user has ownership
-        dandiset = get_object_or_404(Dandiset, pk=self.kwargs['dandiset__pk'])
+        dandiset = self.dandiset
         if dandiset.embargo_status != Dandiset.EmbargoStatus.OPEN:
             if not self.request.user.is_authenticated:
                 # Clients must be authenticated to access it
                 raise NotAuthenticated
-            if not is_dandiset_owner(dandiset, self.request.user):
+            if not self.ownership.is_dandiset_owner(dandiset):
                 # The user does not have ownership permission
                 raise PermissionDenied
         return super().get_queryset()
@@ -72,7 +89,16 @@ class VersionViewSet(NestedViewSetMixin, DetailSerializerMixin, ReadOnlyModelVie
     )
     def retrieve(self, request, **kwargs):
         version = self.get_object()
-        return Response(version.metadata, status=status.HTTP_200_OK)
+
+        # The metadata of a version only changes when the version is modified
+        return conditional_get(
+            request,
+            lambda: Response(version.metadata, status=status.HTTP_200_OK),
+            etag=make_etag(version.id, version.modified),
+            last_modified=version.modified,
+            published=version.version != 'draft',
+            private=version.dandiset.embargo_status != Dandiset.EmbargoStatus.OPEN,
+        )
 
     @swagger_auto_schema(
         manual_parameters=[DANDISET_PK_PARAM, VERSION_PARAM],
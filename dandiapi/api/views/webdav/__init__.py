@@ -7,12 +7,13 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework.decorators import api_view
 from rest_framework.exceptions import NotFound, PermissionDenied
 
-from dandiapi.api.asset_paths import get_path_children
+from dandiapi.api.asset_paths import annotate_pending_aggregates, get_path_children
+from dandiapi.api.models.asset import Asset
 from dandiapi.api.models.asset_paths import AssetPath
 from dandiapi.api.models.version import Version
 from dandiapi.api.services.permissions.dandiset import is_dandiset_owner
 from dandiapi.api.views.common import PAGINATION_PARAMS
-from dandiapi.api.views.pagination import DandiPagination
+from dandiapi.api.views.pagination import AssetPathPagination
 
 from .serializers import AtPathQuerySerializer, PathResultSerializer
 
@@ -23,9 +24,11 @@ if TYPE_CHECKING:
     from dandiapi.api.models.dandiset import Dandiset
 
 
-def get_atpath_queryset(*, version: Version, path: str, children: bool) -> QuerySet[AssetPath]:
+def get_atpath_queryset(
+    *, version: Version, path: str, children: bool, after: str | None = None
+) -> QuerySet[AssetPath]:
     select_related_clauses = ('asset', 'asset__blob')
-    qs = (
+    qs = annotate_pending_aggregates(
         AssetPath.objects.select_related(*select_related_clauses)
         .filter(version=version)
         .order_by('path')
@@ -33,7 +36,10 @@ def get_atpath_queryset(*, version: Version, path: str, children: bool) -> Query
 
     # Handle root path case explicitly
     if path == '':
-        return qs.exclude(path__contains='/') if children else qs.none()
+        if not children:
+            return qs.none()
+        qs = qs.exclude(path__contains='/')
+        return qs if after is None else qs.filter(path__gt=after)
 
     # Perform path filter
     qs = qs.filter(path=path)
@@ -43,6 +49,11 @@ def get_atpath_queryset(*, version: Version, path: str, children: bool) -> Query
     if asset_path is None:
         return qs.none()
 
+    # When paginating by cursor, only include paths after it. As a folder sorts before all of its
+    # children, this drops the folder itself from every page but the first.
+    if after is not None:
+        qs = qs.filter(path__gt=after)
+
     # Since path+version combinations are unique, we know we've matched exactly one path.
     # Now see if we should extend this with it's children
     if asset_path.asset is not None or not children:
@@ -52,6 +63,8 @@ def get_atpath_queryset(*, version: Version, path: str, children: bool) -> Query
     children_paths = (
         get_path_children(asset_path).select_related(None).select_related(*select_related_clauses)
     )
+    if after is not None:
+        children_paths = children_paths.filter(path__gt=after)
 
     # Must include an additional order clause here to ensure correct ordering
     return qs.union(children_paths).order_by('path')
@@ -86,21 +99,26 @@ def atpath(request: Request):
     endslash = path.endswith('/')
     path = path.rstrip('/')
 
-    qs = get_atpath_queryset(version=version, path=path, children=params['children'])
-
     # Handle special behavior if results not found
     if path != '':
-        first = qs.first()
-        if first is None:
+        target = version.asset_paths.filter(path=path).first()
+        if target is None:
             raise NotFound(detail=f'Folder or asset not found at {path}')
-        if endslash and first.asset is not None:
+        if endslash and target.asset_id is not None:
             raise NotFound(detail=f'Folder not found at {path}')
 
+    qs = get_atpath_queryset(
+        version=version, path=path, children=params['children'], after=params.get('after')
+    )
+
     # Paginate
-    paginator = DandiPagination()
+    paginator = AssetPathPagination()
     result_page = paginator.paginate_queryset(qs, request=request)
-    serializer = PathResultSerializer(
-        instance=result_page, many=True, context={'metadata': params['metadata']}
-    )
+    context = {'metadata': params['metadata']}
+    if params['metadata']:
+        context['embargo_end_dates'] = Asset.get_embargo_end_dates(
+            asset_path.asset for asset_path in result_page if asset_path.asset is not None
+        )
+    serializer = PathResultSerializer(instance=result_page, many=True, context=context)
 
     return paginator.get_paginated_response(serializer.data)
@@ -4,6 +4,7 @@ from rest_framework import serializers
 
 from dandiapi.api.models.asset import Asset
 from dandiapi.api.models.asset_paths import AssetPath
+from dandiapi.api.views.serializers import AssetMetadataField
 
 
 class PathFolderSerializer(serializers.ModelSerializer):
@@ -16,8 +17,8 @@ class PathFolderSerializer(serializers.ModelSerializer):
         ]
 
     path = serializers.CharField()
-    total_assets = serializers.IntegerField(source='aggregate_files')
-    total_size = serializers.IntegerField(source='aggregate_size')
+    total_assets = serializers.IntegerField(source='total_files')
+    total_size = serializers.IntegerField()
 
 
 class PathAssetSerializer(serializers.ModelSerializer):
@@ -36,7 +37,7 @@ class PathAssetSerializer(serializers.ModelSerializer):
 
     blob = serializers.UUIDField(source='blob.blob_id', allow_null=True)
     zarr = serializers.UUIDField(source='zarr.zarr_id', allow_null=True)
-    metadata = serializers.JSONField(source='full_metadata')
+    metadata = AssetMetadataField()
 
     def __init__(self, *args, include_metadata=False, **kwargs):
         if not include_metadata:
@@ -56,7 +57,9 @@ class PathResultSerializer(serializers.Serializer):
 
     def get_resource(self, obj: AssetPath):
         if obj.asset is not None:
-            return PathAssetSerializer(obj.asset, include_metadata=self.context['metadata']).data
+            return PathAssetSerializer(
+                obj.asset, include_metadata=self.context['metadata'], context=self.context
+            ).data
         return PathFolderSerializer(obj).data
 
 
@@ -66,3 +69,8 @@ class AtPathQuerySerializer(serializers.Serializer):
     path = serializers.CharField(default='')
     metadata = serializers.BooleanField(default=False)
     children = serializers.BooleanField(default=False)
+    after = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text='Return the paths following this one, instead of paginating by page number.',
+    )
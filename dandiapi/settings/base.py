@@ -216,8 +216,28 @@ DANDI_DOI_API_USER: str | None = env.str('DJANGO_DANDI_DOI_API_USER', default=No
 DANDI_DOI_API_PASSWORD: str | None = env.str('DJANGO_DANDI_DOI_API_PASSWORD', default=None)
 DANDI_DOI_PUBLISH: bool = env.bool('DJANGO_DANDI_DOI_PUBLISH', default=False)
 
+# How the hierarchy of asset paths is stored. "closure" stores every (ancestor, descendant) pair
+# in the AssetPathRelation table, while "prefix" derives it from an index over the path itself.
+# Switching from "prefix" to "closure" requires running `ingest_asset_paths --restart`.
+DANDI_ASSET_PATH_HIERARCHY: str = env.str('DJANGO_DANDI_ASSET_PATH_HIERARCHY', default='closure')
+if DANDI_ASSET_PATH_HIERARCHY not in {'closure', 'prefix'}:
+    raise ValueError(f'Unknown DJANGO_DANDI_ASSET_PATH_HIERARCHY: {DANDI_ASSET_PATH_HIERARCHY}')
+
+# Whether the daily asset path verification should also correct any aggregates it finds incorrect
+DANDI_ASSET_PATH_REPAIR: bool = env.bool('DJANGO_DANDI_ASSET_PATH_REPAIR', default=False)
+
 DANDI_VALIDATION_JOB_INTERVAL: int = env.int('DJANGO_DANDI_VALIDATION_JOB_INTERVAL', default=60)
 
+# How long a draft version must go unmodified before its manifests are rewritten, in seconds, so
+# that a burst of changes produces a single write
+DANDI_MANIFEST_DEBOUNCE: int = env.int('DJANGO_DANDI_MANIFEST_DEBOUNCE', default=120)
+
+# The longest a modified draft version waits for its manifests to be rewritten, in seconds, even if
+# it keeps being modified, as during a long upload
+DANDI_MANIFEST_MAX_DELAY: int = env.int(
+    'DJANGO_DANDI_MANIFEST_MAX_DELAY', default=10 * DANDI_MANIFEST_DEBOUNCE
+)
+
 DANDI_AUTO_APPROVE_USERS = False
 
 DANDI_DEV_EMAIL: str
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager
 import hashlib
 import io
 import json
+import threading
+import time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import ParseResult, urlencode
 
@@ -12,7 +16,7 @@ from storages.backends.s3 import S3Storage
 from storages.utils import clean_name
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Generator, Hashable, Mapping
 
     from mypy_boto3_s3.client import S3Client
     from mypy_boto3_s3.service_resource import S3ServiceResource
@@ -35,6 +39,122 @@ class _WritableSha256(io.RawIOBase):
         return True
 
 
+# The size of the parts uploaded by `DandiS3Storage.open_write`. S3 requires every part but the last
+# to be at least 5 MiB, and allows at most 10,000 parts.
+WRITE_PART_SIZE = 16 * 1024 * 1024
+
+
+class _MultipartUploadWriter(io.RawIOBase):
+    """
+    File-like object that uploads everything written to it to an object, in fixed-size parts.
+
+    At most one part is buffered in memory. The multipart upload is only started once the first
+    part is full, so content smaller than a part is uploaded with a single request.
+    """
+
+    def __init__(
+        self, client: S3Client, *, bucket: str, key: str, params: dict[str, Any], part_size: int
+    ):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._params = params
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, Any]] = []
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(data)
+
+    def writable(self) -> bool:
+        return True
+
+    def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key, **self._params
+            )['UploadId']
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+    def complete(self) -> None:
+        """Upload any buffered content and create the object."""
+        if self._upload_id is None:
+            self._client.put_object(
+                Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer), **self._params
+            )
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={'Parts': self._parts},
+            )
+        self._buffer.clear()
+
+    def abort(self) -> None:
+        """Discard any uploaded parts, leaving the object unchanged."""
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+        self._buffer.clear()
+
+
+# The longest time a presigned URL is reused for. Each reuse shortens the time the URL remains valid
+# after being handed out, so this is also limited to a small fraction of its expiry.
+PRESIGNED_URL_CACHE_TTL = 10 * 60
+
+# The most presigned URLs kept by each storage
+PRESIGNED_URL_CACHE_SIZE = 10_000
+
+
+class _TTLCache:
+    """A thread-safe mapping whose entries expire a fixed time after being set."""
+
+    def __init__(self, *, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Since every entry lives for the same time, insertion order is also expiry order
+        self._entries: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (now + self.ttl, value)
+            while self._entries and (
+                len(self._entries) > self.maxsize or next(iter(self._entries.values()))[0] <= now
+            ):
+                self._entries.popitem(last=False)
+
+
 class DandiS3Storage(S3Storage):
     """
     An enhanced S3Storage.
@@ -42,9 +162,11 @@ class DandiS3Storage(S3Storage):
     This class additionally:
     * Does not transform original filenames
     * Allows unsigned URLs to be generated
+    * Caches presigned GET URLs for a short time
     * Provides an API to generate presigned PUT URLs
     * Provides an API to get the ETag of an object
     * Provides an API to tag objects
+    * Provides an API to stream content to an object
     * Provides an API to efficiently calculate the SHA256 checksums of an object
     """
 
@@ -69,6 +191,10 @@ class DandiS3Storage(S3Storage):
             signature_version='s3v4',
             **settings,
         )
+        self._presigned_url_cache = _TTLCache(
+            ttl=min(PRESIGNED_URL_CACHE_TTL, self.querystring_expire // 10),
+            maxsize=PRESIGNED_URL_CACHE_SIZE,
+        )
 
     @property
     def s3_client(self) -> S3Client:
@@ -89,14 +215,12 @@ class DandiS3Storage(S3Storage):
         return filename
 
     def _url_unsigned(self, name: str) -> str:
-        # TODO: Remove this method once https://github.com/jschneier/django-storages/pull/1536
-        #  is released.
+        # Build the URL with an unsigned client, so that it uses the same endpoint, addressing style
+        # and key encoding as a presigned URL, and matches one with its query string removed
         name = self._normalize_name(clean_name(name))
-        if self.endpoint_url:
-            # Assume only path-style requests are supported, as this is probably MinIO
-            return f'{self.endpoint_url}/{self.bucket_name}/{name}'
-        # https://docs.aws.amazon.com/AmazonS3/latest/userguide/VirtualHosting.html#virtual-hosted-style-access
-        return f'https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{name}'
+        return self.unsigned_connection.meta.client.generate_presigned_url(
+            'get_object', Params={'Bucket': self.bucket_name, 'Key': name}
+        )
 
     def url(
         self,
@@ -112,6 +236,27 @@ class DandiS3Storage(S3Storage):
         name = self._normalize_name(clean_name(name))
         return self._url_unsigned(name)
 
+    def cached_url(
+        self,
+        name: str,
+        *,
+        parameters: Mapping[str, str] | None = None,
+        http_method: str | None = None,
+    ) -> str:
+        """
+        Return a presigned URL, reusing one generated recently for the same request.
+
+        Presigning is relatively expensive, and popular objects are requested many times in a short
+        period. A URL is reused for a small fraction of `querystring_expire`, so it always remains
+        valid for nearly as long as a newly presigned one.
+        """
+        key = (name, http_method, tuple(sorted((parameters or {}).items())))
+        url = self._presigned_url_cache.get(key)
+        if url is None:
+            url = self.url(name, parameters=parameters, http_method=http_method)
+            self._presigned_url_cache.set(key, url)
+        return url
+
     def generate_presigned_put_object_url(
         self,
         name: str,
@@ -143,6 +288,14 @@ class DandiS3Storage(S3Storage):
             ExpiresIn=expire,
         )
 
+    def get_object_parameters(self, name: str) -> dict[str, Any]:
+        params = super().get_object_parameters(name)
+        # Otherwise gzip files are stored with "Content-Encoding: gzip", so that clients decompress
+        # them on download while keeping the ".gz" name
+        if name.endswith('.gz') and 'ContentType' not in params:
+            params['ContentType'] = 'application/gzip'
+        return params
+
     def e_tag(self, name: str) -> str | None:
         name = self._normalize_name(clean_name(name))
         """Return the ETag (entity tag) for an uploaded object, or `None` if it's unavailable."""
@@ -176,6 +329,34 @@ class DandiS3Storage(S3Storage):
         name = self._normalize_name(clean_name(name))
         self.s3_client.delete_object_tagging(Bucket=self.bucket_name, Key=name)
 
+    @contextmanager
+    def open_write(
+        self,
+        name: str,
+        *,
+        tags: Mapping[str, str] | None = None,
+        part_size: int = WRITE_PART_SIZE,
+    ) -> Generator[_MultipartUploadWriter]:
+        """
+        Stream content to an object, uploading it in parts as it's written.
+
+        The object is created, with any tags, once the block exits. If the block raises, any
+        uploaded parts are discarded and the object is left unchanged.
+        """
+        name = self._normalize_name(clean_name(name))
+        params = self._get_write_parameters(name)
+        if tags:
+            params['Tagging'] = urlencode(tags)
+        writer = _MultipartUploadWriter(
+            self.s3_client, bucket=self.bucket_name, key=name, params=params, part_size=part_size
+        )
+        try:
+            yield writer
+            writer.complete()
+        except BaseException:
+            writer.abort()
+            raise
+
     def sha256_checksum(self, name: str) -> str:
         """Efficiently compute the SHA256 checksum of an object."""
         name = self._normalize_name(clean_name(name))
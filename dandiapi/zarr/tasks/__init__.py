@@ -8,7 +8,8 @@ import psycopg.errors
 from zarr_checksum import compute_zarr_checksum
 from zarr_checksum.generators import S3ClientOptions, yield_files_s3
 
-from dandiapi.api.asset_paths import add_zarr_paths, delete_zarr_paths
+from dandiapi.api.asset_metadata import invalidate_computed_metadata
+from dandiapi.api.asset_paths import resize_zarr_paths
 from dandiapi.api.models.asset import Asset
 from dandiapi.api.models.version import Version
 from dandiapi.zarr.models import ZarrArchive, ZarrArchiveStatus
@@ -44,6 +45,7 @@ def _ingest_zarr_archive(zarr_id: str, *, force: bool = False):
         zarr.status = ZarrArchiveStatus.INGESTING
         zarr.checksum = None
         zarr.save(update_fields=['status', 'checksum'])
+        invalidate_computed_metadata(zarr.assets.all())
 
     # Instantiate updater and add files as they come in.
     # Compute the checksum before starting the transaction to avoid long lived locks.
@@ -72,9 +74,6 @@ def _ingest_zarr_archive(zarr_id: str, *, force: bool = False):
             .get(zarr_id=zarr_id, status=ZarrArchiveStatus.INGESTING)
         )
 
-        # Remove all asset paths associated with this zarr before ingest
-        delete_zarr_paths(zarr)
-
         # Set zarr fields
         zarr.checksum = checksum.digest
         zarr.file_count = checksum.count
@@ -82,8 +81,11 @@ def _ingest_zarr_archive(zarr_id: str, *, force: bool = False):
         zarr.status = ZarrArchiveStatus.COMPLETE
         zarr.save()
 
-        # Add asset paths after ingest is finished
-        add_zarr_paths(zarr)
+        # Apply the new size to the asset paths associated with this zarr
+        resize_zarr_paths(zarr)
+
+        # The size and digest of each asset must be recomputed
+        invalidate_computed_metadata(zarr.assets.all())
 
         # Set version status back to PENDING, and update modified.
         Version.objects.filter(id=zarr.dandiset.draft_version.id).update(
@@ -14,6 +14,7 @@ from rest_framework.response import Response
 from rest_framework.utils.urls import replace_query_param
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from dandiapi.api.asset_metadata import invalidate_computed_metadata
 from dandiapi.api.models.dandiset import Dandiset
 from dandiapi.api.services import audit
 from dandiapi.api.services.exceptions import DandiError
@@ -251,9 +252,13 @@ class ZarrViewSet(ReadOnlyModelViewSet):
 
         # Note: S3 will 404 if the file does not exist.
         if request.method == 'HEAD':
-            return HttpResponseRedirect(zarr_archive.storage.url(full_prefix, http_method='HEAD'))
+            return HttpResponseRedirect(
+                zarr_archive.storage.cached_url(full_prefix, http_method='HEAD')
+            )
         if download:
-            return HttpResponseRedirect(zarr_archive.storage.url(zarr_archive.s3_path(raw_prefix)))
+            return HttpResponseRedirect(
+                zarr_archive.storage.cached_url(zarr_archive.s3_path(raw_prefix))
+            )
 
         # Retrieve file listing
         listing = zarr_archive.storage.s3_client.list_objects_v2(
@@ -330,6 +335,7 @@ class ZarrViewSet(ReadOnlyModelViewSet):
             # Set status back to pending, since with these URLs the zarr could have been changed
             zarr_archive.mark_pending()
             zarr_archive.save()
+            invalidate_computed_metadata(zarr_archive.assets.all())
 
             audit.upload_zarr_chunks(
                 dandiset=zarr_archive.dandiset,
@@ -368,6 +374,7 @@ class ZarrViewSet(ReadOnlyModelViewSet):
             serializer.is_valid(raise_exception=True)
             paths = [file['path'] for file in serializer.validated_data]
             zarr_archive.delete_files(paths)
+            invalidate_computed_metadata(zarr_archive.assets.all())
 
             audit.delete_zarr_chunks(
                 dandiset=zarr_archive.dandiset,